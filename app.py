@@ -1,30 +1,150 @@
 import streamlit as st
-from io import BytesIO
-from PyPDF2 import PdfReader
-from text_utils import clean_text, extract_keywords, extract_nouns_verbs, match_keywords, calculate_match_percent
+from file_utils import read_pdf_bytes
+from matrix_utils import build_keyword_matrix
+from scoring_engine import ScoringSession, extract_keywords_from_jd
+from text_utils import clean_text
+from profiling_utils import Profiler
 from stopwords import STOP_WORDS
 import collections
-import pandas as pd
+import functools
+import hashlib
 import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 # ========== file reading helpers ==========
 
 def read_uploaded_file(uploaded_file):
     """
     Reads and returns the text content of an uploaded .txt or .pdf file.
-    Handles encoding and PDF errors gracefully.
+    PDFs are extracted in an isolated worker within the pdf_utils time and
+    size budgets; one that fails raises PdfExtractionError with the reason.
     """
     if uploaded_file.type == "text/plain":
         return uploaded_file.read().decode("utf-8")
     elif uploaded_file.type == "application/pdf":
-        try:
-            pdf = PdfReader(BytesIO(uploaded_file.read()))
-            return "\n".join(page.extract_text() or "" for page in pdf.pages)
-        except Exception as e:
-            return f"[Error reading PDF: {e}]"
+        # getvalue() returns the whole upload regardless of read position
+        return read_pdf_bytes(uploaded_file.getvalue(), separator="\n")
     else:
         return "[Unsupported file type]"
-    
+
+def read_uploads(uploaded_files):
+    """
+    Reads uploaded files concurrently, skipping ones that can't be read
+    (e.g. PDFs that fail extraction).
+    Returns (texts, labels, skipped) with skipped as [(file name, reason)].
+    """
+    return extract_concurrently([(f.name, functools.partial(read_uploaded_file, f)) for f in uploaded_files])
+
+# ========== bulk (ZIP) upload ==========
+# Documents are extracted on a small thread pool: PDF text comes from
+# isolated worker processes (pdf_utils), so threads are enough to keep
+# several of them busy, and the script thread stays free to draw progress.
+
+UPLOAD_WORKERS = min(8, os.cpu_count() or 1)
+MAX_ZIP_MEMBERS = 2000
+MAX_MEMBER_BYTES = 20 * 1024 * 1024
+
+def extract_concurrently(jobs, progress=None):
+    """
+    Runs jobs, a list of (name, load) where load() returns the document's
+    text, with at most 2 * UPLOAD_WORKERS in flight (so only their bytes are
+    held at once). progress(done) is called from the script thread as
+    documents finish. Returns (texts, labels, skipped) in job order, with
+    skipped as [(name, reason)].
+    """
+    outcomes = [None] * len(jobs)
+    queue = iter(enumerate(jobs))
+    with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as pool:
+        pending = {}
+
+        def submit_next():
+            for i, (name, load) in queue:
+                pending[pool.submit(load)] = i
+                return
+
+        for _ in range(2 * UPLOAD_WORKERS):
+            submit_next()
+        done = 0
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                i = pending.pop(future)
+                try:
+                    outcomes[i] = (future.result(), None)
+                except UnicodeDecodeError:
+                    outcomes[i] = (None, "not UTF-8 text")
+                except Exception as e:
+                    outcomes[i] = (None, str(e) or type(e).__name__)
+                submit_next()
+                done += 1
+            if progress:
+                progress(done)
+    texts, labels, skipped = [], [], []
+    for (name, _), (text, reason) in zip(jobs, outcomes):
+        if reason is None:
+            texts.append(text)
+            labels.append(name)
+        else:
+            skipped.append((name, reason))
+    return texts, labels, skipped
+
+def _read_zip_member(archive, info):
+    # file_size comes from the archive header, so the read itself is capped too
+    with archive.open(info) as member:
+        data = member.read(MAX_MEMBER_BYTES + 1)
+    if len(data) > MAX_MEMBER_BYTES:
+        raise ValueError(f"larger than {MAX_MEMBER_BYTES // (1024 * 1024)} MB")
+    if info.filename.lower().endswith(".pdf"):
+        return read_pdf_bytes(data, separator="\n")
+    return data.decode("utf-8")
+
+def zip_resume_jobs(uploaded_zip):
+    """
+    Lists the .txt/.pdf resumes in an uploaded ZIP (from its central
+    directory; nothing is decompressed yet). Returns (jobs, skipped): jobs
+    for extract_concurrently, each reading and extracting one member when
+    it runs, and skipped as [(name, reason)] for oversized or surplus members.
+    Raises zipfile.BadZipFile for anything that isn't a ZIP.
+    """
+    archive = zipfile.ZipFile(uploaded_zip)
+    members = [
+        info for info in archive.infolist()
+        if not info.is_dir()
+        and info.filename.lower().endswith((".txt", ".pdf"))
+        # Finder metadata (__MACOSX/._resume.pdf) and other hidden files
+        and not any(part.startswith((".", "__MACOSX")) for part in info.filename.split("/"))
+    ]
+    jobs, skipped = [], []
+    for info in members[MAX_ZIP_MEMBERS:]:
+        skipped.append((info.filename, f"more than {MAX_ZIP_MEMBERS} resumes in the ZIP"))
+    for info in members[:MAX_ZIP_MEMBERS]:
+        if info.file_size > MAX_MEMBER_BYTES:
+            skipped.append((info.filename, f"larger than {MAX_MEMBER_BYTES // (1024 * 1024)} MB"))
+        else:
+            jobs.append((info.filename, functools.partial(_read_zip_member, archive, info)))
+    return jobs, skipped
+
+def read_zip_upload(uploaded_zip):
+    """
+    Extracts every resume in an uploaded ZIP concurrently, with a progress
+    bar. The outcome is kept in session state per upload, so reruns reuse
+    it instead of extracting again. Returns (texts, labels, skipped).
+    """
+    cached = st.session_state.get("zip_upload")
+    if cached and cached[0] == uploaded_zip.file_id:
+        return cached[1]
+    try:
+        jobs, skipped = zip_resume_jobs(uploaded_zip)
+    except zipfile.BadZipFile:
+        return [], [], [(uploaded_zip.name, "not a valid ZIP file")]
+    bar = st.progress(0.0, text=f"Extracting {len(jobs)} resumes from {uploaded_zip.name}...")
+    texts, labels, failed = extract_concurrently(
+        jobs, lambda done: bar.progress(done / len(jobs), text=f"Extracted {done} of {len(jobs)} resumes"))
+    bar.empty()
+    outcome = (texts, labels, skipped + failed)
+    st.session_state["zip_upload"] = (uploaded_zip.file_id, outcome)
+    return outcome
 
 def read_sample_file(filepath):
     """Read a local sample text file (always as UTF-8)."""
@@ -34,39 +154,194 @@ def read_sample_file(filepath):
         with open(filepath, encoding="utf-8") as f:
             return f.read()
     elif ext == ".pdf":
-        pdf = PdfReader(filepath)
-        return "\n".join(page.extract_text() or "" for page in pdf.pages)
+        with open(filepath, "rb") as f:
+            return read_pdf_bytes(f.read(), separator="\n")
     else:
         return "[Unsupported sample file type]"
 
-# ========== KEYWORD EXTRACTION & MATCHING ==========
+# ========== CACHED COMPUTE LAYER ==========
+# Results are keyed by a hash of the document text (plus the keyword mode
+# and word-form normalization),
+# shared across sessions, and bounded by entry count and TTL. Arguments with
+# a leading underscore are not hashed by Streamlit; the digest stands in for them.
+
+CACHE_MAX_ENTRIES = 512
+CACHE_TTL_SECONDS = 60 * 60
+
+def text_digest(text):
+    """Returns a stable content hash for a document's text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def cached_jd_keywords(jd_digest, mode, _job_text, normalize=None):
+    """extract_keywords_from_jd, cached by (JD hash, mode, normalize)."""
+    return extract_keywords_from_jd(_job_text, mode, normalize)
 
-def extract_keywords_from_jd(job_text, mode):
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def cached_resume_counts(resume_digest, _resume_text, normalize=None):
+    """Cleaned word counts for a resume, cached by (resume hash, normalize); mode-independent."""
+    return collections.Counter(clean_text(_resume_text, STOP_WORDS, normalize))
+
+# Stand-in when diagnostics are off: every stage is a no-op
+NO_PROFILER = Profiler(enabled=False)
+
+def compute_analysis(job_text, resume_texts, resume_labels, jd_mode, session=None, profiler=NO_PROFILER,
+                     normalize=None):
+    """
+    Pure compute step behind analyze_and_render (no Streamlit output).
+    With a ScoringSession from an earlier run, only new resumes are scored
+    and a changed JD (or keyword mode) only applies its keyword delta.
+    Per-stage timings are recorded on profiler. normalize ('stem' or 'lemma')
+    matches on word forms; the session must have been created with the same value.
+    Returns a dict with the JD keywords/frequencies, resume labels, the
+    resume x keyword count matrix (columns in display order), per-resume
+    match stats, and the top gaps across resumes.
     """
-    Cleans and processes job description text,
-    extracting a set of keywords and their frequencies.
-    Mode can be 'all' (all words) or 'nouns_verbs' (only nouns/verbs).
+    if session is None:
+        session = ScoringSession(normalize=normalize)
+    with profiler.stage("jd.keywords", len(job_text)):
+        jd_keywords, jd_word_counts = cached_jd_keywords(text_digest(job_text), jd_mode, job_text, normalize)
+    with profiler.stage("session.set_job"):
+        session.set_job(jd_keywords, jd_word_counts)
+
+    keys = []
+    for resume_text in resume_texts:
+        key = text_digest(resume_text)
+        if key not in session:
+            with profiler.stage("resume.clean", len(resume_text)):
+                resume_counts = cached_resume_counts(key, resume_text, normalize)
+            with profiler.stage("resume.match"):
+                session.add_resume(key, resume_counts=resume_counts)
+        keys.append(key)
+    session.retain(keys)
+    with profiler.stage("session.results"):
+        results = session.results(keys)
+
+    labels = [
+        resume_labels[idx] if idx < len(resume_labels) else f"Resume {idx+1}"
+        for idx in range(len(resume_texts))
+    ]
+    with profiler.stage("matrix.build"):
+        sorted_keywords = sorted(jd_keywords, key=lambda w: (-jd_word_counts[w], w))
+        matrix = build_keyword_matrix(sorted_keywords, [r["resume_counts"] for r in results])
+        top_gaps = matrix.top_gaps(jd_word_counts, n=8)
+    return {
+        "jd_keywords": jd_keywords,
+        "jd_word_counts": jd_word_counts,
+        "labels": labels,
+        "matrix": matrix,
+        "match_percent": [r["match_percent"] for r in results],
+        "num_matched": [r["num_matched"] for r in results],
+        "num_missing": [r["num_missing"] for r in results],
+        "top_gaps": top_gaps,
+    }
+
+# ========== RENDER LAYER ==========
+
+# Rows per page for long results; only the visible page is sent to the browser
+RESUMES_PER_PAGE = 25
+KEYWORDS_PER_PAGE = 50
+
+def page_range(label, total, page_size, key):
     """
-    job_cleaned = clean_text(job_text, STOP_WORDS)
-    if mode == "nouns_verbs":
-        job_cleaned = extract_nouns_verbs(job_cleaned)
-    job_keywords = extract_keywords(job_cleaned)
-    job_word_counts = collections.Counter(job_cleaned)
-    return job_keywords, job_word_counts
-
-def analyze_resume(resume_text, jd_keywords):
+    Page picker for long tables. Returns the (start, stop) slice of the
+    current page; no picker is shown when everything fits on one page.
     """
-    Cleans a resume and matches it against JD keywords.
-    Returns matched/missing sets, match percent, and resume word counts.
+    if total <= page_size:
+        return 0, total
+    pages = (total + page_size - 1) // page_size
+    # The widget's value lives only in session state (no value= as well)
+    st.session_state.setdefault(key, 1)
+    if st.session_state[key] > pages:
+        st.session_state[key] = pages  # a shorter result replaced the previous one
+    page = st.number_input(f"{label} page (of {pages})", min_value=1, max_value=pages, step=1, key=key)
+    start = (page - 1) * page_size
+    return start, min(total, start + page_size)
+
+def render_analysis(job_text, resume_texts, analysis, profiler=NO_PROFILER):
     """
-    resume_cleaned = clean_text(resume_text, STOP_WORDS)
-    matched, missing = match_keywords(jd_keywords, resume_cleaned)
-    match_percent = calculate_match_percent(matched, len(jd_keywords))
-    resume_counts = collections.Counter(resume_cleaned)
-    return matched, missing, match_percent, resume_counts
+    Renders a compute_analysis result: JD/resume previews, summary table,
+    keyword comparison matrix, and top gaps across resumes.
+    Resumes and keywords are paginated, so previews, the summary and the
+    matrix only serialize the rows on the current page.
+    """
+    labels = analysis["labels"]
+    matrix = analysis["matrix"]
+    with profiler.stage("render.paging"):
+        resume_start, resume_stop = page_range("Resume", len(labels), RESUMES_PER_PAGE, "resume_page")
+        keyword_start, keyword_stop = page_range("Keyword", len(matrix.keywords), KEYWORDS_PER_PAGE, "keyword_page")
+        if resume_stop - resume_start < len(labels):
+            st.caption(f"Showing resumes {resume_start + 1}–{resume_stop} of {len(labels)}.")
+
+   # --- SHOW JOB DESCRIPTION ---
+    with profiler.stage("render.previews"):
+        with st.expander("Job Description", expanded=False):
+            st.text(job_text if len(job_text) < 5000 else job_text[:5000] + "\n...[truncated]")
+
+        # --- SHOW RESUME TEXTS ---
+        summary_rows = []
+        for idx in range(resume_start, resume_stop):
+            resume_text = resume_texts[idx]
+            label = labels[idx]
+            # Keep full resume text tucked away
+            with st.expander(f"Resume: {label}", expanded=False):
+                st.text(resume_text if len(resume_text) < 5000 else resume_text[:5000] + "\n...[truncated]")
+            summary_rows.append({
+                "Resume": label,
+                "Match %": f"{analysis['match_percent'][idx]:.1f}",
+                "#Matched": analysis["num_matched"][idx],
+                "#Missing": analysis["num_missing"][idx]
+            })
+
+    # --- SUMMARY TABLE ---
+    with profiler.stage("render.summary"):
+        st.markdown("##### ✅ Resume Match Summary")
+        st.table(summary_rows)
+
+    # --- KEYWORD COMPARISON MATRIX ---
+    with profiler.stage("render.matrix"):
+        import pandas as pd  # deferred: only needed once results are rendered
+        block = matrix.block(range(resume_start, resume_stop), range(keyword_start, keyword_stop))
+        df = pd.DataFrame(block.T, columns=labels[resume_start:resume_stop])
+        df.insert(0, "Keyword", matrix.keywords[keyword_start:keyword_stop])
+
+        st.markdown("##### 📊 Keyword Comparison Matrix")
+        if keyword_stop - keyword_start < len(matrix.keywords):
+            st.caption(f"Keywords {keyword_start + 1}–{keyword_stop} of {len(matrix.keywords)}, most frequent in the JD first.")
+        st.dataframe(
+            df,
+            use_container_width=True,
+            height=min(420, 56 + 28 * min(len(df), 10)),  # keep compact; adjust as you like
+        )
 
+    # --- QUICK INSIGHT: Top gaps across resumes ---
+    jd_word_counts = analysis["jd_word_counts"]
+    if analysis["top_gaps"]:
+        with profiler.stage("render.gaps"):
+            st.markdown("##### 🔎 Top gaps across resumes")
+            st.table([
+                {"Keyword": w, "#Resumes without keyword": n, "Freq in Job Description": jd_word_counts[w]}
+                for w, n in analysis["top_gaps"]
+            ])
+
+def render_diagnostics(profiler):
+    """Collapsible per-stage breakdown (time, calls, input size, memory peak) of the last run."""
+    report = profiler.report()
+    with st.expander(f"🩺 Diagnostics — {report['wall_ms']:.1f} ms total", expanded=False):
+        st.table([
+            {
+                "Stage": s["stage"],
+                "Calls": s["calls"],
+                "Total ms": f"{s['total_ms']:.2f}",
+                "Max ms": f"{s['max_ms']:.2f}",
+                "Input KB": f"{s['bytes'] / 1024:.1f}",
+                "Peak memory KB": "—" if s["peak_mem_bytes"] is None else f"{s['peak_mem_bytes'] / 1024:.1f}",
+            }
+            for s in report["stages"]
+        ])
+        st.caption("JD/resume cleaning is cached by document hash, so repeat runs show cache-lookup times.")
 
-def analyze_and_render(job_text, resume_texts, resume_labels, mode_label):
+def analyze_and_render(job_text, resume_texts, resume_labels, mode_label, analysis=None, normalize=None):
     """
     Run the full keyword analysis pipeline and render results in the Streamlit app.
 
@@ -89,76 +364,27 @@ def analyze_and_render(job_text, resume_texts, resume_labels, mode_label):
         Display labels for each resume (usually filenames).
     mode_label : str
         The selected keyword extraction mode label ("All words ..." or "Only nouns/verbs ...").
+    analysis : dict, optional
+        A precomputed compute_analysis result (e.g. the startup demo); computed if omitted.
+    normalize : str, optional
+        'stem' or 'lemma' to match different forms of the same word; None for exact words.
 
     """
-   # --- SHOW JOB DESCRIPTION ---
-    with st.expander("Job Description", expanded=False):
-        st.text(job_text if len(job_text) < 5000 else job_text[:5000] + "\n...[truncated]")
-
-    # --- EXTRACT JD KEYWORDS ---
     jd_mode = "all" if mode_label.startswith("All") else "nouns_verbs"
-    jd_keywords, jd_word_counts = extract_keywords_from_jd(job_text, jd_mode)
-
-    # --- ANALYZE EACH RESUME, SHOW RESUME TEXTS ---
-    summary_rows = []
-    resume_counts_list = []
-    matched_missing_per_resume = []
-
-    for idx, resume_text in enumerate(resume_texts):
-        label = resume_labels[idx] if idx < len(resume_labels) else f"Resume {idx+1}"
-        # Keep full resume text tucked away
-        with st.expander(f"Resume: {label}", expanded=False):
-            st.text(resume_text if len(resume_text) < 5000 else resume_text[:5000] + "\n...[truncated]")
-
-        matched, missing, match_percent, resume_counts = analyze_resume(resume_text, jd_keywords)
-        summary_rows.append({
-            "Resume": label,
-            "Match %": f"{match_percent:.1f}",
-            "#Matched": len(matched),
-            "#Missing": len(missing)
-        })
-        resume_counts_list.append(resume_counts)
-        matched_missing_per_resume.append((matched, missing))
-
-    # --- SUMMARY TABLE ---
-    st.markdown("##### ✅ Resume Match Summary")
-    st.table(summary_rows)
-
-    # --- KEYWORD COMPARISON MATRIX ---
-    data = []
-    sorted_keywords = sorted(jd_keywords, key=lambda w: (-jd_word_counts[w], w))
-    for keyword in sorted_keywords:
-        row = {"Keyword": keyword}
-        for i, counts in enumerate(resume_counts_list):
-            row[resume_labels[i]] = counts.get(keyword, 0)
-        data.append(row)
-    df = pd.DataFrame(data)
-    for col in resume_labels:
-        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(int)
-
-    st.markdown("##### 📊 Keyword Comparison Matrix")
-    st.dataframe(
-        df,
-        use_container_width=True,
-        height=min(420, 56 + 28 * min(len(df), 10)),  # keep compact; adjust as you like
-    )
-
-    # --- QUICK INSIGHT: Top gaps across resumes ---
-    all_missing_counts = collections.Counter()
-    for matched, missing in matched_missing_per_resume:
-        all_missing_counts.update(missing)
-
-    top_gaps = sorted(
-        all_missing_counts,
-        key=lambda w: (-all_missing_counts[w], -jd_word_counts[w], w)
-    )[:8]
-
-    if top_gaps:
-        st.markdown("##### 🔎 Top gaps across resumes")
-        st.table([
-            {"Keyword": w, "#Resumes without keyword": all_missing_counts[w], "Freq in Job Description": jd_word_counts[w]}
-            for w in top_gaps
-        ])
+    profiler = NO_PROFILER
+    if st.session_state.get("show_diagnostics"):
+        profiler = Profiler(trace_memory=st.session_state.get("trace_memory", False))
+    if analysis is None:
+        # One incremental scoring session per browser session (and word-form setting)
+        session = st.session_state.setdefault(f"scoring_session_{normalize}", ScoringSession(normalize=normalize))
+        try:
+            analysis = compute_analysis(job_text, resume_texts, resume_labels, jd_mode, session, profiler, normalize)
+        except LookupError:
+            st.error("NLTK data is missing. Run `python main.py --download-nltk` and reload the app.")
+            return
+    render_analysis(job_text, resume_texts, analysis, profiler)
+    if profiler.enabled:
+        render_diagnostics(profiler)
 
    
 
@@ -193,11 +419,50 @@ SAMPLE_RESUMES = [
     str(BASE / "test_files/resume3.txt"),
 ]
 
+@st.cache_resource(show_spinner=False)
+def load_demo():
+    """
+    Reads the sample files and precomputes the demo analysis for each keyword
+    mode once per server process, so the first page load renders instantly.
+    The nouns/verbs analysis also loads the POS tagger model up front, so
+    the first nouns/verbs rerun doesn't pay for it.
+    Returns (job_text, resume_texts, resume_labels, {mode: analysis}).
+    """
+    job_text = read_sample_file(SAMPLE_JOB)
+    resume_texts = [read_sample_file(p) for p in SAMPLE_RESUMES]
+    resume_labels = [os.path.basename(p) for p in SAMPLE_RESUMES]
+    analyses = {}
+    for jd_mode in ("all", "nouns_verbs"):
+        try:
+            analyses[jd_mode] = compute_analysis(job_text, resume_texts, resume_labels, jd_mode)
+        except LookupError:
+            pass  # NLTK data not installed; computed on demand instead
+    return job_text, resume_texts, resume_labels, analyses
+
+def render_demo(mode_label, normalize=None):
+    """Renders the sample-data demo, from the precomputed results when matching exact words."""
+    job_text_demo, resume_texts_demo, resume_labels_demo, analyses = load_demo()
+    jd_mode = "all" if mode_label.startswith("All") else "nouns_verbs"
+    analysis = analyses.get(jd_mode) if normalize is None else None
+    analyze_and_render(job_text_demo, resume_texts_demo, resume_labels_demo, mode_label,
+                       analysis=analysis, normalize=normalize)
+
 # ====== SESSION STATE ======
 # Tracks whether we've already shown the auto demo this session
 if "auto_demo_ran" not in st.session_state:
     st.session_state["auto_demo_ran"] = False
 
+# Which results stay on screen across reruns ("demo" or "upload"), so that
+# paging through long results doesn't clear them
+if "showing" not in st.session_state:
+    st.session_state["showing"] = None
+
+def show_results(kind):
+    """Button callback: switch the displayed results and go back to the first page."""
+    st.session_state["showing"] = kind
+    for key in ("resume_page", "keyword_page"):
+        st.session_state.pop(key, None)
+
 # (Optional legacy flag you had; safe to keep but unused by the new flow)
 if "use_samples" not in st.session_state:
     st.session_state["use_samples"] = False
@@ -209,23 +474,34 @@ mode = st.radio(
     help="Choose whether to consider all words or only nouns/verbs (often better for job relevance)."
 )
 
+# ====== WORD FORMS (exact words by default) ======
+WORD_FORMS = {"Exact words (default)": None, "Word stems": "stem", "Dictionary forms (lemmas)": "lemma"}
+word_forms = st.radio(
+    "How words are compared",
+    list(WORD_FORMS),
+    horizontal=True,
+    help="Stems and lemmas let 'developed', 'developing' and 'develops' all match 'develop'.",
+)
+normalize = WORD_FORMS[word_forms]
+
+# ====== DIAGNOSTICS (off by default; no-op profiler when off) ======
+if st.checkbox("Show diagnostics", key="show_diagnostics",
+               help="Adds a collapsible per-stage timing breakdown under the results."):
+    st.checkbox("Trace memory (slower)", key="trace_memory",
+                help="Also records the peak Python memory allocated in each stage.")
+
 # ====== INSTANT DEMO ON FIRST LOAD ======
 if not st.session_state["auto_demo_ran"]:
-    # Load samples and render immediately so viewers see results without any clicks
-    job_text_demo = read_sample_file(SAMPLE_JOB)
-    resume_texts_demo = [read_sample_file(p) for p in SAMPLE_RESUMES]
-    resume_labels_demo = [os.path.basename(p) for p in SAMPLE_RESUMES]
-
+    # Render the precomputed samples immediately so viewers see results without any clicks
     st.success("Showing demo with sample data.")
-    analyze_and_render(job_text_demo, resume_texts_demo, resume_labels_demo, mode)
+    st.session_state["showing"] = "demo"
+    render_demo(mode, normalize)
     st.session_state["auto_demo_ran"] = True
 else:
     # Let users quickly re-run the demo after trying uploads or changing mode
-    if st.button("Replay Demo with Sample Data"):
-        job_text_demo = read_sample_file(SAMPLE_JOB)
-        resume_texts_demo = [read_sample_file(p) for p in SAMPLE_RESUMES]
-        resume_labels_demo = [os.path.basename(p) for p in SAMPLE_RESUMES]
-        analyze_and_render(job_text_demo, resume_texts_demo, resume_labels_demo, mode)
+    st.button("Replay Demo with Sample Data", on_click=show_results, args=("demo",))
+    if st.session_state["showing"] == "demo":
+        render_demo(mode, normalize)
 
 # ====== USER UPLOADS (de-emphasized in an expander) ======
 with st.expander("🔽 Try with your own files"):
@@ -236,28 +512,43 @@ with st.expander("🔽 Try with your own files"):
         key="jobdesc",
     )
     resume_files = st.file_uploader(
-        "Upload 1–3 Resumes",
+        "Upload Resumes",
         type=["txt", "pdf"],
         accept_multiple_files=True,
         help="Accepted formats: .txt, .pdf",
         key="resumes",
     )
+    resume_zip = st.file_uploader(
+        "Or upload a ZIP of resumes",
+        type=["zip"],
+        help=f"A .zip of .txt/.pdf resumes (up to {MAX_ZIP_MEMBERS}; folders inside are fine)",
+        key="resume_zip",
+    )
 
-    # Extract text + labels from uploads
-    job_text = read_uploaded_file(job_file) if job_file else None
-    resume_texts = [read_uploaded_file(f) for f in resume_files] if resume_files else []
-    resume_labels = [f.name for f in resume_files] if resume_files else []
+    # Extract text + labels from uploads (unreadable files are skipped with a reason)
+    job_texts, _, job_skipped = read_uploads([job_file] if job_file else [])
+    job_text = job_texts[0] if job_texts else None
+    resume_texts, resume_labels, resume_skipped = read_uploads(resume_files or [])
+    if resume_zip:
+        zip_texts, zip_labels, zip_skipped = read_zip_upload(resume_zip)
+        resume_texts += zip_texts
+        resume_labels += zip_labels
+        resume_skipped += zip_skipped
+    skipped = job_skipped + resume_skipped
+    for name, reason in skipped[:10]:
+        st.warning(f"Skipped {name}: {reason}")
+    if len(skipped) > 10:
+        st.warning(f"... and {len(skipped) - 10} more files skipped.")
 
     # Run analysis on user data
-    if st.button("Analyze"):
+    st.button("Analyze", on_click=show_results, args=("upload",))
+    if st.session_state["showing"] == "upload":
         if not job_text:
             st.error("Please upload a job description.")
         elif not resume_texts:
             st.error("Please upload at least one resume.")
-        elif len(resume_texts) > 3:
-            st.error("Please upload no more than 3 resumes.")
         else:
-            analyze_and_render(job_text, resume_texts, resume_labels, mode)
+            analyze_and_render(job_text, resume_texts, resume_labels, mode, normalize=normalize)
 
 
 
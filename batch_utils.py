@@ -0,0 +1,259 @@
+import os
+import glob
+import hashlib
+import itertools
+import collections
+import tracemalloc
+
+from stopwords import STOP_WORDS
+from file_utils import read_file, decode_file_bytes, read_text_chunks, MMAP_THRESHOLD_BYTES
+from pdf_utils import set_pdf_workers
+from text_cache import configure_text_cache
+from text_utils import iter_clean_text
+from phrase_matcher import get_phrase_matcher
+from fuzzy_utils import get_fuzzy_matcher
+from resume_result import KeywordVocab, ResumeResult
+
+# ========================
+# Resume Path Collection
+# ========================
+
+SUPPORTED_EXTENSIONS = ('.txt', '.pdf')
+
+def collect_resume_paths(source, extensions=SUPPORTED_EXTENSIONS):
+    """
+    Expands a directory or glob pattern into a sorted list of .txt/.pdf paths
+    (or files with the given extensions).
+    A directory is scanned (non-recursively) for supported files.
+    Anything else is treated as a glob pattern (use ** for recursive globs).
+    """
+    if os.path.isdir(source):
+        candidates = [os.path.join(source, name) for name in os.listdir(source)]
+    else:
+        candidates = glob.glob(source, recursive=True)
+    return sorted(
+        p for p in candidates
+        if os.path.isfile(p) and p.lower().endswith(extensions)
+    )
+
+# ========================
+# Scoring a Single Resume
+# ========================
+
+def add_phrase_matches(result, resume_text, job_phrases):
+    """
+    Adds phrase_matched / phrase_missing (sets, like matched / missing)
+    to a result by scanning the resume's raw text for the JD phrases.
+    """
+    phrase_matched, phrase_missing = get_phrase_matcher(frozenset(job_phrases)).match(resume_text)
+    result["phrase_matched"] = phrase_matched
+    result["phrase_missing"] = phrase_missing
+    return result
+
+def add_fuzzy_matches(result, resume_counts, max_distance):
+    """
+    Adds fuzzy_matched ({JD keyword: resume word}) to a result: missing JD
+    keywords that one of the resume's cleaned words (resume_counts) is a
+    near-miss of, within max_distance edits (see fuzzy_utils).
+    """
+    matcher = get_fuzzy_matcher(frozenset(result.vocab.keywords), max_distance)
+    result["fuzzy_matched"] = matcher.match(resume_counts, result.missing)
+    return result
+
+def score_text(resume_id, resume_text, job_keywords, job_phrases=None, normalize=None, fuzzy=None):
+    """
+    Cleans and matches already-read resume text (e.g. a corpus record) the
+    same way score_resume does. Words are counted as they are cleaned
+    (iter_clean_text), without building the word list.
+    fuzzy (max edit distance) adds fuzzy_matched.
+    Returns a ResumeResult, or None for empty text.
+    """
+    if not resume_text:
+        return None
+    vocab = job_keywords if isinstance(job_keywords, KeywordVocab) else KeywordVocab(job_keywords)
+    resume_counts = collections.Counter(iter_clean_text(resume_text, STOP_WORDS, normalize))
+    result = ResumeResult.from_counts(resume_id, vocab, resume_counts)
+    if job_phrases:
+        add_phrase_matches(result, resume_text, job_phrases)
+    if fuzzy:
+        add_fuzzy_matches(result, resume_counts, fuzzy)
+    return result
+
+def score_resume(resume_path, job_keywords, job_phrases=None, normalize=None, fuzzy=None):
+    """
+    Reads, cleans, and matches one resume against the JD keywords (a set,
+    or a KeywordVocab to reuse across calls) and, if given, the JD phrases.
+    normalize must match the JD keywords'. Large .txt files are streamed
+    from a memory map instead of being read into one string (unless
+    phrase matching needs the whole text).
+    Returns the same ResumeResult that process_resumes builds,
+    or None if the file could not be read.
+    """
+    if (not job_phrases and resume_path.lower().endswith(".txt")
+            and os.path.isfile(resume_path) and os.path.getsize(resume_path) > MMAP_THRESHOLD_BYTES):
+        vocab = job_keywords if isinstance(job_keywords, KeywordVocab) else KeywordVocab(job_keywords)
+        try:
+            resume_counts = collections.Counter(
+                iter_clean_text(read_text_chunks(resume_path), STOP_WORDS, normalize))
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Error reading TXT file: {e}")
+            return None
+        result = ResumeResult.from_counts(resume_path, vocab, resume_counts)
+        return add_fuzzy_matches(result, resume_counts, fuzzy) if fuzzy else result
+    return score_text(resume_path, read_file(resume_path), job_keywords, job_phrases, normalize, fuzzy)
+
+def tokenize_resume(resume_path, known_digest=None, normalize=None):
+    """
+    Reads one resume file, hashes its bytes (sha256) and counts its cleaned
+    words, for caching (see corpus_manifest). If the hash equals known_digest
+    the content is unchanged and the words are not counted again.
+    Returns (size, mtime, digest, word counts dict or None); digest is None
+    if no text could be extracted. Returns None if the file can't be opened.
+    """
+    try:
+        with open(resume_path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            data = f.read()
+    except OSError as e:
+        print(f"Error reading file: {e}")
+        return None
+    digest = hashlib.sha256(data).hexdigest()
+    if digest == known_digest:
+        return stat.st_size, stat.st_mtime, digest, None
+    resume_text = decode_file_bytes(resume_path, data)
+    if not resume_text:
+        return stat.st_size, stat.st_mtime, None, None
+    word_counts = dict(collections.Counter(iter_clean_text(resume_text, STOP_WORDS, normalize)))
+    return stat.st_size, stat.st_mtime, digest, word_counts
+
+# ========================
+# Parallel Scoring (Process Pool)
+# ========================
+
+# Set once per worker process by _init_worker, so the JD keyword vocabulary
+# is pickled per worker instead of once per task.
+_worker_vocab = None
+_worker_job_phrases = None
+_worker_normalize = None
+_worker_fuzzy = None
+
+def _init_worker(vocab, cache_dir, job_phrases=None, normalize=None, fuzzy=None):
+    global _worker_vocab, _worker_job_phrases, _worker_normalize, _worker_fuzzy
+    _worker_vocab = vocab
+    _worker_job_phrases = job_phrases
+    _worker_normalize = normalize
+    _worker_fuzzy = fuzzy
+    # Already one process per core; don't fan out again per PDF
+    set_pdf_workers(1)
+    # Forked workers inherit the parent's --profile-memory tracing, which they don't report
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+    if cache_dir:
+        # Workers share extracted text through the on-disk cache tier
+        configure_text_cache(cache_dir=cache_dir, compress=True)
+
+def _score_in_worker(resume_path):
+    result = score_resume(resume_path, _worker_vocab, _worker_job_phrases, _worker_normalize, _worker_fuzzy)
+    if result is not None:
+        # The parent reattaches its own vocabulary, so only the count array
+        # and bitmap are pickled back per resume
+        result.vocab = None
+    return resume_path, result
+
+def _score_records_in_worker(records):
+    results = []
+    for resume_id, resume_text in records:
+        result = score_text(resume_id, resume_text, _worker_vocab, _worker_job_phrases, _worker_normalize,
+                            _worker_fuzzy)
+        if result is not None:
+            result.vocab = None
+        results.append((resume_id, result))
+    return results
+
+def _tokenize_in_worker(item):
+    resume_path, known_digest = item
+    return resume_path, tokenize_resume(resume_path, known_digest, _worker_normalize)
+
+def _attach_vocab(scored, vocab):
+    for resume_path, result in scored:
+        if result is not None:
+            result.vocab = vocab
+        yield resume_path, result
+
+def score_resumes_parallel(resume_paths, job_keywords, workers=None, chunksize=16, cache_dir=None,
+                           job_phrases=None, normalize=None, fuzzy=None):
+    """
+    Scores resumes in a process pool and yields (resume_path, result) pairs
+    in input order. result is None for files that could not be read.
+    workers defaults to the CPU count; chunksize sets how many paths
+    each worker receives per task. cache_dir enables the on-disk
+    extracted-text cache so re-runs skip PDF parsing. Results are compact
+    ResumeResults sharing one KeywordVocab. job_phrases adds phrase_matched / phrase_missing to each result.
+    normalize ('stem'/'lemma') must be the one the JD keywords were built with.
+    fuzzy (max edit distance) adds fuzzy_matched; each worker remembers its
+    vocabulary lookups for the whole run.
+    """
+    vocab = KeywordVocab(job_keywords)
+    if workers == 1:
+        # No pool overhead for single-worker runs (handy for debugging)
+        _init_worker(vocab, cache_dir, job_phrases, normalize, fuzzy)
+        yield from _attach_vocab(map(_score_in_worker, resume_paths), vocab)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(vocab, cache_dir, job_phrases, normalize, fuzzy),
+    ) as executor:
+        scored = executor.map(_score_in_worker, resume_paths, chunksize=max(1, chunksize))
+        yield from _attach_vocab(scored, vocab)
+
+def score_records_parallel(records, job_keywords, workers=None, chunksize=16, job_phrases=None, normalize=None,
+                           fuzzy=None):
+    """
+    Scores (resume id, text) records, e.g. from corpus_utils.iter_corpus, in
+    a process pool and yields (resume id, result) pairs in input order
+    (result is None for records without text). records is consumed lazily:
+    at most two batches of chunksize records per worker are in flight, so
+    memory stays flat however many records there are.
+    """
+    vocab = KeywordVocab(job_keywords)
+    records = iter(records)
+    batches = iter(lambda: list(itertools.islice(records, max(1, chunksize))), [])
+    if workers == 1:
+        _init_worker(vocab, None, job_phrases, normalize, fuzzy)
+        for batch in batches:
+            yield from _attach_vocab(_score_records_in_worker(batch), vocab)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    max_pending = 2 * (workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(vocab, None, job_phrases, normalize, fuzzy),
+    ) as executor:
+        pending = collections.deque()
+        for batch in batches:
+            pending.append(executor.submit(_score_records_in_worker, batch))
+            if len(pending) >= max_pending:
+                yield from _attach_vocab(pending.popleft().result(), vocab)
+        while pending:
+            yield from _attach_vocab(pending.popleft().result(), vocab)
+
+def tokenize_resumes_parallel(items, workers=None, chunksize=16, cache_dir=None, normalize=None):
+    """
+    Runs tokenize_resume over (resume_path, known digest) items in a process
+    pool and yields (resume_path, tokenize_resume result) in input order.
+    Same pool options as score_resumes_parallel.
+    """
+    if workers == 1:
+        _init_worker(None, cache_dir, None, normalize)
+        yield from map(_tokenize_in_worker, items)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(None, cache_dir, None, normalize),
+    ) as executor:
+        yield from executor.map(_tokenize_in_worker, items, chunksize=max(1, chunksize))
@@ -0,0 +1,65 @@
+"""
+Micro-benchmark: original clean_text vs the precompiled Analyzer.
+
+Run from the repo root:
+    python benchmarks/bench_analyzer.py [--repeat 200]
+"""
+import os
+import sys
+import time
+import string
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stopwords import STOP_WORDS
+from text_utils import Analyzer
+
+def legacy_clean_text(raw_text, stop_words):
+    # The pre-Analyzer implementation, kept here as the baseline
+    text = raw_text.lower()
+    translator = str.maketrans('', '', string.punctuation)
+    text = text.translate(translator)
+    words = text.split()
+    return [word for word in words if word not in stop_words and word.isalpha()]
+
+def best_of(fn, arg, rounds=5):
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn(arg)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=200,
+                        help="How many copies of the sample files make up the large input")
+    args = parser.parse_args()
+
+    base = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "test_files")
+    sample = ""
+    for name in ("job1.txt", "resume1.txt", "resume2.txt", "resume3.txt"):
+        with open(os.path.join(base, name), encoding="utf-8") as f:
+            sample += f.read() + "\n"
+    inputs = {
+        "unicode": sample * args.repeat,
+        "ascii": sample.encode("ascii", "ignore").decode("ascii") * args.repeat,
+    }
+
+    analyzer = Analyzer(STOP_WORDS)
+    print(f"{'Input':<10} {'Chars':>10} {'legacy (s)':>12} {'Analyzer (s)':>14} {'Speedup':>9}")
+    print("-" * 59)
+    for label, text in inputs.items():
+        assert analyzer.clean(text) == legacy_clean_text(text, STOP_WORDS)
+        legacy = best_of(lambda t: legacy_clean_text(t, STOP_WORDS), text)
+        fast = best_of(analyzer.clean, text)
+        print(f"{label:<10} {len(text):>10} {legacy:>12.4f} {fast:>14.4f} {legacy / fast:>8.1f}x")
+
+    docs = [sample] * args.repeat
+    legacy = best_of(lambda ds: [legacy_clean_text(d, STOP_WORDS) for d in ds], docs)
+    fast = best_of(analyzer.clean_many, docs)
+    print(f"{'batch':<10} {len(docs):>9}d {legacy:>12.4f} {fast:>14.4f} {legacy / fast:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Startup benchmark: import time and time-to-first-result in fresh processes.
+
+Run from the repo root:
+    python benchmarks/bench_startup.py [--runs 10] [--json] [--max-import-ms 150]
+
+Each scenario is timed end to end in a new interpreter, so it includes
+interpreter start-up. A bare `python -c pass` is reported as the floor.
+With --max-import-ms the script exits non-zero when importing main.py
+takes longer than the budget (above the floor), so regressions show up in CI.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LIBRARY_FIRST_RESULT = """
+from stopwords import STOP_WORDS
+from file_utils import read_file
+from text_utils import clean_text, extract_keywords
+from batch_utils import score_resume
+job_keywords = extract_keywords(clean_text(read_file('test_files/job1.txt'), STOP_WORDS))
+score_resume('test_files/resume1.pdf', job_keywords)
+"""
+
+def scenarios(output_path):
+    return {
+        "python_floor": [sys.executable, "-c", "pass"],
+        "import_library": [sys.executable, "-c", "import file_utils, text_utils"],
+        "import_cli": [sys.executable, "-c", "import main"],
+        "first_result_library": [sys.executable, "-c", LIBRARY_FIRST_RESULT],
+        "first_result_cli": [
+            sys.executable, "main.py",
+            "--jd", "test_files/job1.txt",
+            "--resumes", "test_files/resume1.pdf",
+            "--output", output_path,
+            "--workers", "1",
+        ],
+    }
+
+def time_command(cmd, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=REPO, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append((time.perf_counter() - start) * 1000)
+    return {
+        "min_ms": round(min(times), 2),
+        "median_ms": round(statistics.median(times), 2),
+        "max_ms": round(max(times), 2),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--max-import-ms", type=float, default=None,
+                        help="Fail if importing main.py exceeds this (median, above the floor)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {
+            name: time_command(cmd, args.runs)
+            for name, cmd in scenarios(os.path.join(tmp, "out.csv")).items()
+        }
+
+    floor = results["python_floor"]["median_ms"]
+    for stats in results.values():
+        stats["above_floor_ms"] = round(stats["median_ms"] - floor, 2)
+
+    if args.json:
+        print(json.dumps({"runs": args.runs, "results": results}, indent=2))
+    else:
+        print(f"{'Scenario':<22} {'min ms':>9} {'median ms':>10} {'max ms':>9} {'+floor ms':>10}")
+        print("-" * 64)
+        for name, s in results.items():
+            print(f"{name:<22} {s['min_ms']:>9.1f} {s['median_ms']:>10.1f} {s['max_ms']:>9.1f} {s['above_floor_ms']:>10.1f}")
+
+    import_cost = results["import_cli"]["above_floor_ms"]
+    if args.max_import_ms is not None and import_cost > args.max_import_ms:
+        print(f"import main.py took {import_cost:.1f} ms above floor (budget {args.max_import_ms} ms)",
+              file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
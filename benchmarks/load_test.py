@@ -0,0 +1,180 @@
+"""
+Localhost load test for service.py.
+
+Run from the repo root:
+    python benchmarks/load_test.py [--requests 2000] [--concurrency 64] [--jds 3]
+                                   [--workers N] [--batch-window-ms 5] [--max-batch 32]
+                                   [--max-inflight 256] [--output report.json]
+
+Starts the service on a free 127.0.0.1 port as a subprocess, generates a
+seeded synthetic corpus (benchmarks/synthetic.py, TXT only), then fires
+/analyze requests from `concurrency` keep-alive connections, cycling through
+a few JDs so requests for the same JD can be micro-batched. Reports
+requests/sec, p50/p99 latency, status counts and the service's /stats
+(batches, mean batch size, 503 rejections) as JSON.
+"""
+import os
+import sys
+import json
+import time
+import socket
+import asyncio
+import argparse
+import tempfile
+import subprocess
+import collections
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic import generate_corpus
+from run_benchmarks import percentile
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+# ========================
+# Minimal HTTP/1.1 Client
+# ========================
+
+class Connection:
+    """One keep-alive connection that sends a request and reads one response at a time."""
+    def __init__(self, port):
+        self.port = port
+        self.reader = self.writer = None
+
+    async def request(self, method, path, payload=None):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection("127.0.0.1", self.port)
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: 127.0.0.1\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+        )
+        await self.writer.drain()
+        status = int((await self.reader.readline()).split()[1])
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        data = await self.reader.readexactly(int(headers.get("content-length", 0)))
+        if headers.get("connection", "").lower() == "close":
+            self.close()
+        return status, json.loads(data or b"null")
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.reader = self.writer = None
+
+async def wait_until_up(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = Connection(port)
+            status, _ = await conn.request("GET", "/health")
+            conn.close()
+            if status == 200:
+                return
+        except OSError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError("Service did not start in time")
+
+# ========================
+# Load Generation
+# ========================
+
+async def run_load(port, payloads, num_requests, concurrency):
+    latencies = []
+    statuses = collections.Counter()
+    counter = iter(range(num_requests))
+
+    async def client():
+        conn = Connection(port)
+        try:
+            for i in counter:
+                start = time.perf_counter()
+                try:
+                    status, _ = await conn.request("POST", "/analyze", payloads[i % len(payloads)])
+                except (OSError, asyncio.IncompleteReadError):
+                    conn.close()
+                    status = "connection_error"
+                latencies.append(time.perf_counter() - start)
+                statuses[status] += 1
+        finally:
+            conn.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    conn = Connection(port)
+    _, service_stats = await conn.request("GET", "/stats")
+    conn.close()
+
+    latencies.sort()
+    return {
+        "requests": num_requests,
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "requests_per_sec": round(num_requests / elapsed, 1),
+        "ok_per_sec": round(statuses[200] / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "statuses": {str(k): v for k, v in statuses.items()},
+        "service": service_stats,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--jds", type=int, default=3, help="Distinct JDs the requests cycle through")
+    parser.add_argument("--resumes", type=int, default=200, help="Distinct resumes the requests cycle through")
+    parser.add_argument("--words", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--batch-window-ms", type=float, default=5)
+    parser.add_argument("--max-batch", type=int, default=32)
+    parser.add_argument("--max-inflight", type=int, default=256)
+    parser.add_argument("--output", default=None, help="Write the JSON report to this file (default: stdout)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = generate_corpus(tmp, args.resumes, args.jds, args.words, pdf_fraction=0.0, seed=args.seed)
+        read = lambda p: open(p, encoding="utf-8").read()
+        jds = [read(p) for p in paths["jds"]]
+        payloads = [
+            {"job_text": jds[i % len(jds)], "resume_text": read(p), "mode": "all"}
+            for i, p in enumerate(paths["resumes"])
+        ]
+
+    port = free_port()
+    command = [sys.executable, os.path.join(REPO, "service.py"), "--port", str(port),
+               "--batch-window-ms", str(args.batch_window_ms), "--max-batch", str(args.max_batch),
+               "--max-inflight", str(args.max_inflight)]
+    if args.workers:
+        command += ["--workers", str(args.workers)]
+    server = subprocess.Popen(command, cwd=REPO, stdout=subprocess.DEVNULL)
+    try:
+        asyncio.run(wait_until_up(port))
+        report = asyncio.run(run_load(port, payloads, args.requests, args.concurrency))
+    finally:
+        server.terminate()
+        server.wait()
+    report["config"] = {k: v for k, v in vars(args).items() if k != "output"}
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        print(f"Load test report written to {args.output}")
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+Per-stage benchmark harness over a seeded synthetic corpus.
+
+Run from the repo root:
+    python benchmarks/run_benchmarks.py [--resumes 500] [--words 600] [--vocab 5000]
+                                        [--pdf-fraction 0.3] [--seed 42]
+                                        [--corpus-dir DIR] [--output results.json]
+
+Stages are timed on their own: read_file, clean_text (plain, stemmed and,
+with the WordNet data installed, lemmatized), extract_nouns_verbs,
+match_keywords, calculate_match_percent, matrix building, and end-to-end
+process_resumes (one call per resume). Each stage reports docs/sec, p50/p99 per-document latency
+and peak traced memory, as JSON, so runs before and after a change can be
+compared. Latencies come from an untraced pass; peak memory from a second
+pass under tracemalloc.
+"""
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import contextlib
+import collections
+import subprocess
+import tracemalloc
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+from synthetic import generate_corpus
+from stopwords import STOP_WORDS
+from text_cache import configure_text_cache
+from file_utils import read_file
+from text_utils import (
+    clean_text,
+    extract_keywords,
+    match_keywords,
+    calculate_match_percent,
+    extract_nouns_verbs,
+)
+from tagging_utils import missing_nltk_resources, LEMMATIZER_RESOURCES
+from matrix_utils import build_keyword_matrix
+
+# ========================
+# Measurement Helpers
+# ========================
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[rank]
+
+def run_stage(name, items, fn):
+    """
+    Calls fn(item) for every item, once untraced for latency and once under
+    tracemalloc for peak memory. Returns the stage's stats dict.
+    """
+    latencies = []
+    start = time.perf_counter()
+    for item in items:
+        t0 = time.perf_counter()
+        fn(item)
+        latencies.append(time.perf_counter() - t0)
+    total = time.perf_counter() - start
+
+    # Each stage's peak is its own, even if tracing was already on
+    tracemalloc.start()
+    tracemalloc.clear_traces()
+    tracemalloc.reset_peak()
+    for item in items:
+        fn(item)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "stage": name,
+        "docs": len(items),
+        "total_s": round(total, 6),
+        "docs_per_sec": round(len(items) / total, 2) if total else None,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 4),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 4),
+        "peak_mem_bytes": peak,
+    }
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+# ========================
+# Benchmark
+# ========================
+
+def run_benchmarks(corpus_dir, args):
+    import main as cli  # process_resumes lives in main.py
+
+    paths = generate_corpus(corpus_dir, args.resumes, 1, args.words,
+                            args.vocab, args.pdf_fraction, args.seed)
+    resume_paths = paths["resumes"]
+    job_path = paths["jds"][0]
+
+    # Disable the extracted-text cache so read_file always parses
+    configure_text_cache(max_bytes=0)
+
+    job_cleaned = clean_text(read_file(job_path), STOP_WORDS)
+    job_keywords = extract_keywords(job_cleaned)
+    job_word_counts = collections.Counter(job_cleaned)
+    texts = [read_file(p) for p in resume_paths]
+    cleaned = [clean_text(t, STOP_WORDS) for t in texts]
+    counts = [collections.Counter(c) for c in cleaned]
+    matches = [match_keywords(job_keywords, c)[0] for c in cleaned]
+    all_keywords = sorted(job_keywords, key=lambda w: (-job_word_counts[w], w))
+
+    stages = [
+        run_stage("read_file", resume_paths, read_file),
+        run_stage("clean_text", texts, lambda t: clean_text(t, STOP_WORDS)),
+        # The per-token normalization memo stays warm across documents, as in a batch run
+        run_stage("clean_text_stem", texts, lambda t: clean_text(t, STOP_WORDS, "stem")),
+    ]
+    if missing_nltk_resources(resources=LEMMATIZER_RESOURCES):
+        stages.append({"stage": "clean_text_lemma", "skipped": "NLTK wordnet data not installed"})
+    else:
+        stages.append(run_stage("clean_text_lemma", texts, lambda t: clean_text(t, STOP_WORDS, "lemma")))
+    if missing_nltk_resources():
+        stages.append({"stage": "extract_nouns_verbs", "skipped": "NLTK tagger data not installed"})
+    else:
+        # Fresh token lists each call so the per-document tag cache doesn't hide the cost
+        from tagging_utils import configure_pos_tagger
+        configure_pos_tagger(cache_size=0)
+        stages.append(run_stage("extract_nouns_verbs", cleaned, extract_nouns_verbs))
+    stages += [
+        run_stage("match_keywords", cleaned, lambda c: match_keywords(job_keywords, c)),
+        run_stage("calculate_match_percent", matches,
+                  lambda m: calculate_match_percent(m, len(job_keywords))),
+        # One "document" = building the whole matrix once
+        run_stage("build_keyword_matrix", [counts], lambda cs: build_keyword_matrix(all_keywords, cs)),
+    ]
+    with contextlib.redirect_stdout(io.StringIO()):
+        # One call per resume (each with a fresh session) so p50/p99 are per document
+        stages.append(run_stage("process_resumes", resume_paths,
+                                lambda p: cli.process_resumes([p], job_keywords, job_word_counts)))
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "corpus": {
+            "resumes": args.resumes,
+            "words_per_doc": args.words,
+            "vocab": args.vocab,
+            "pdf_fraction": args.pdf_fraction,
+            "seed": args.seed,
+            "jd_keywords": len(job_keywords),
+        },
+        "stages": stages,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=500)
+    parser.add_argument("--words", type=int, default=600)
+    parser.add_argument("--vocab", type=int, default=5000)
+    parser.add_argument("--pdf-fraction", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--corpus-dir", default=None, help="Keep the generated corpus here (default: temp dir)")
+    parser.add_argument("--output", default=None, help="Write the JSON report to this file (default: stdout)")
+    args = parser.parse_args()
+
+    if args.corpus_dir:
+        report = run_benchmarks(args.corpus_dir, args)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            report = run_benchmarks(tmp, args)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        print(f"Benchmark report written to {args.output}")
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()
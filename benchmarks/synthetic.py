@@ -0,0 +1,155 @@
+"""
+Seeded generator for synthetic resumes and job descriptions (TXT and PDF).
+
+    python benchmarks/synthetic.py OUT_DIR [--resumes 500] [--jds 5] [--words 600]
+                                   [--vocab 5000] [--pdf-fraction 0.3] [--seed 42]
+
+The same seed and settings always produce byte-identical files, so runs
+before and after a change score exactly the same corpus.
+"""
+import os
+import random
+import argparse
+import itertools
+
+FILLER_WORDS = [
+    'the', 'and', 'is', 'in', 'to', 'of', 'for', 'with', 'on', 'a', 'an',
+    'by', 'at', 'as', 'it', 'this', 'that', 'from', 'or', 'be', 'are',
+]
+PUNCTUATION = [",", ".", ";", ":", "!", "?", "-", "/"]
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+# ========================
+# Vocabulary & Text
+# ========================
+
+def make_vocabulary(size, rng):
+    """Returns `size` distinct lowercase pseudo-words (3-10 letters)."""
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(LETTERS) for _ in range(rng.randint(3, 10))))
+    return sorted(words)
+
+def make_document(vocab, num_words, rng, cum_weights):
+    """
+    Returns document text: Zipf-distributed vocabulary words mixed with
+    stop words, capitalization, punctuation and the odd number, in lines.
+    """
+    words = rng.choices(vocab, cum_weights=cum_weights, k=num_words)
+    out = []
+    for i, word in enumerate(words):
+        roll = rng.random()
+        if roll < 0.15:
+            out.append(rng.choice(FILLER_WORDS))
+        if roll < 0.05:
+            word = word.capitalize()
+        elif roll > 0.97:
+            word = f"{word}{rng.randint(1, 99)}"
+        if rng.random() < 0.08:
+            word += rng.choice(PUNCTUATION)
+        out.append(word)
+        if i % 12 == 11:
+            out.append("\n")
+    return " ".join(out).replace(" \n ", "\n")
+
+# ========================
+# Minimal PDF Writer
+# ========================
+
+def _pdf_escape(line):
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+def write_pdf(path, text, lines_per_page=50):
+    """
+    Writes text as a simple multi-page PDF (Helvetica, one text line per line)
+    that PyPDF2 can extract. No third-party PDF library needed.
+    """
+    lines = text.split("\n") or [""]
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[""]]
+
+    objects = []  # object bodies, numbered from 1
+    def add(body):
+        objects.append(body)
+        return len(objects)
+
+    font_id = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    pages_id = add(None)  # filled in once the kids are known
+    page_ids = []
+    for page_lines in pages:
+        stream = ["BT /F1 10 Tf 12 TL 40 800 Td"]
+        for line in page_lines:
+            stream.append(f"({_pdf_escape(line)}) Tj T*")
+        stream.append("ET")
+        data = "\n".join(stream).encode("latin-1", "replace")
+        content_id = add(b"<< /Length %d >>\nstream\n" % len(data) + data + b"\nendstream")
+        page_ids.append(add(
+            f"<< /Type /Page /Parent {pages_id} 0 R /MediaBox [0 0 612 842] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {content_id} 0 R >>".encode()
+        ))
+    kids = " ".join(f"{pid} 0 R" for pid in page_ids)
+    objects[pages_id - 1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode()
+    catalog_id = add(f"<< /Type /Catalog /Pages {pages_id} 0 R >>".encode())
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref_at = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, catalog_id, xref_at)
+    with open(path, "wb") as f:
+        f.write(out)
+
+# ========================
+# Corpus
+# ========================
+
+def generate_corpus(out_dir, num_resumes=500, num_jds=5, words_per_doc=600,
+                    vocab_size=5000, pdf_fraction=0.3, seed=42):
+    """
+    Writes resumes to out_dir/resumes and JDs to out_dir/jds.
+    Document lengths vary +/-50% around words_per_doc; JDs are a third as long.
+    Returns {"resumes": [paths], "jds": [paths]}.
+    """
+    rng = random.Random(seed)
+    vocab = make_vocabulary(vocab_size, rng)
+    # Zipf-like word frequencies; cumulative weights are computed once
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(vocab))))
+    paths = {"resumes": [], "jds": []}
+    for kind, count, length in (("resumes", num_resumes, words_per_doc),
+                                ("jds", num_jds, max(50, words_per_doc // 3))):
+        folder = os.path.join(out_dir, kind)
+        os.makedirs(folder, exist_ok=True)
+        for i in range(count):
+            text = make_document(vocab, rng.randint(length // 2, length * 3 // 2), rng, cum_weights)
+            stem = os.path.join(folder, f"{kind[:-1]}{i:05d}")
+            if rng.random() < pdf_fraction:
+                path = stem + ".pdf"
+                write_pdf(path, text)
+            else:
+                path = stem + ".txt"
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(text)
+            paths[kind].append(path)
+    return paths
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("out_dir")
+    parser.add_argument("--resumes", type=int, default=500)
+    parser.add_argument("--jds", type=int, default=5)
+    parser.add_argument("--words", type=int, default=600, help="Average words per resume")
+    parser.add_argument("--vocab", type=int, default=5000, help="Vocabulary size")
+    parser.add_argument("--pdf-fraction", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    paths = generate_corpus(args.out_dir, args.resumes, args.jds, args.words,
+                            args.vocab, args.pdf_fraction, args.seed)
+    print(f"Wrote {len(paths['resumes'])} resumes and {len(paths['jds'])} JDs to {args.out_dir}")
+
+if __name__ == "__main__":
+    main()
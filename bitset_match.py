@@ -0,0 +1,220 @@
+import os
+import csv
+import argparse
+
+import numpy as np
+
+from stopwords import STOP_WORDS
+from file_utils import read_file
+from text_utils import clean_text
+
+# ========================
+# Packed Keyword Bitsets
+# ========================
+#
+# The union of all JD keywords is interned once (word -> bit id). Every JD
+# keyword set and every resume's word set becomes a row of uint64 words with
+# bit i set when vocabulary word i is present; resume words outside the
+# vocabulary can never match and are dropped. |JD ∩ resume| for every pair
+# is then AND + popcount over the packed rows.
+
+# Upper bound for the temporary (JDs x resumes x words) AND block
+BLOCK_BYTES = 64 * 1024 * 1024
+
+if hasattr(np, "bitwise_count"):  # NumPy >= 2.0
+    def _popcount(words):
+        return np.bitwise_count(words)
+else:
+    _BYTE_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def _popcount(words):
+        as_bytes = words.view(np.uint8).reshape(words.shape + (8,))
+        return _BYTE_POPCOUNT[as_bytes].sum(axis=-1, dtype=np.uint8)
+
+class KeywordBitsets:
+    """
+    Interned JD keyword vocabulary plus the packed bitset of each JD.
+    encode() packs any collection of word sets (e.g. resume word counts)
+    against the same vocabulary.
+    """
+    def __init__(self, jd_keyword_sets):
+        self.vocab = {}
+        jd_ids = []
+        for keywords in jd_keyword_sets:
+            ids = [self.vocab.setdefault(word, len(self.vocab)) for word in keywords]
+            jd_ids.append(np.unique(np.array(ids, dtype=np.int64)))
+        self.num_words = max(1, (len(self.vocab) + 63) // 64)
+        self.jd_sizes = np.array([len(ids) for ids in jd_ids], dtype=np.int64)
+        self.jd_bits = self._pack(jd_ids)
+
+    def _pack(self, rows_of_ids):
+        bits = np.zeros((len(rows_of_ids), self.num_words), dtype=np.uint64)
+        if not rows_of_ids:
+            return bits
+        rows = np.repeat(np.arange(len(rows_of_ids)), [len(ids) for ids in rows_of_ids])
+        ids = np.concatenate(rows_of_ids)
+        masks = np.left_shift(np.uint64(1), (ids & 63).astype(np.uint64))
+        np.bitwise_or.at(bits, (rows, ids >> 6), masks)
+        return bits
+
+    def encode(self, word_sets):
+        """
+        Packs word collections (sets, lists, Counters) into bitset rows.
+        Words outside the JD vocabulary are ignored.
+        """
+        vocab = self.vocab
+        rows_of_ids = []
+        for words in word_sets:
+            ids = {vocab[w] for w in words if w in vocab}
+            rows_of_ids.append(np.fromiter(ids, dtype=np.int64, count=len(ids)))
+        return self._pack(rows_of_ids)
+
+    def intersection_counts(self, resume_bits):
+        """
+        Returns a (JDs x resumes) int32 matrix of |JD keywords ∩ resume words|.
+        Processed in blocks of JDs, each restricted to the bitset words that
+        any JD in the block actually uses.
+        """
+        num_jds, num_resumes = len(self.jd_bits), len(resume_bits)
+        counts = np.zeros((num_jds, num_resumes), dtype=np.int32)
+        if num_jds == 0 or num_resumes == 0:
+            return counts
+        block = max(1, BLOCK_BYTES // (num_resumes * self.num_words * 8))
+        for start in range(0, num_jds, block):
+            jd_block = self.jd_bits[start:start + block]
+            used = np.flatnonzero(jd_block.any(axis=0))
+            if used.size == 0:
+                continue
+            anded = jd_block[:, None, used] & resume_bits[None, :, used]
+            counts[start:start + block] = _popcount(anded).sum(axis=2, dtype=np.int32)
+        return counts
+
+# ========================
+# All-Pairs Match Grid
+# ========================
+
+class MatchGrid:
+    """
+    Match percent of every JD against every resume (rows = JDs,
+    columns = resumes), identical to calculate_match_percent per pair.
+    """
+    def __init__(self, matched_counts, jd_sizes):
+        self.matched = matched_counts
+        self.jd_sizes = jd_sizes
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = 100 * matched_counts.astype(np.float64) / jd_sizes[:, None]
+        scores[jd_sizes == 0] = 0.0
+        self.scores = scores
+
+    @property
+    def shape(self):
+        return self.scores.shape
+
+    def missing(self):
+        """Number of JD keywords absent from each resume, per pair."""
+        return self.jd_sizes[:, None] - self.matched
+
+    @staticmethod
+    def _top_k(scores, k):
+        # Stable sort on the negated scores: ties keep the lower index first
+        order = np.argsort(-scores, axis=1, kind="stable")[:, :k]
+        return order, np.take_along_axis(scores, order, axis=1)
+
+    def top_k_per_jd(self, k=10):
+        """
+        For each JD, the k best resumes: (indices, scores) arrays of shape
+        (JDs, k), best first, ties broken by resume order.
+        """
+        return self._top_k(self.scores, k)
+
+    def top_k_per_resume(self, k=10):
+        """
+        For each resume, the k best-matching JDs: (indices, scores) arrays of
+        shape (resumes, k), best first, ties broken by JD order.
+        """
+        return self._top_k(self.scores.T, k)
+
+def match_grid(jd_keyword_sets, resume_word_sets):
+    """
+    Scores every JD keyword set against every resume word collection
+    (sets or Counters of cleaned words) and returns a MatchGrid.
+    """
+    bitsets = KeywordBitsets(jd_keyword_sets)
+    resume_bits = bitsets.encode(resume_word_sets)
+    return MatchGrid(bitsets.intersection_counts(resume_bits), bitsets.jd_sizes)
+
+# ========================
+# Command-Line Interface
+# ========================
+
+def main(argv=None):
+    """
+    python bitset_match.py JD_DIR_OR_GLOB RESUME_DIR_OR_GLOB [--mode all|nouns_verbs]
+                           [--top K] [--output grid.csv]
+    JDs may also be .jdp profiles compiled with jd_profile.py (same mode, no normalization).
+    """
+    from batch_utils import collect_resume_paths, SUPPORTED_EXTENSIONS
+    from scoring_engine import extract_keywords_from_jds
+    from jd_profile import PROFILE_EXTENSION, is_profile_file, load_jd_profile
+
+    parser = argparse.ArgumentParser(description="Score every job description against every resume.")
+    parser.add_argument("jds", help="Directory of job descriptions or glob pattern")
+    parser.add_argument("resumes", help="Directory of resumes or glob pattern")
+    parser.add_argument("--mode", choices=["all", "nouns_verbs"], default="all")
+    parser.add_argument("--top", type=int, default=5, help="Best resumes to list per JD")
+    parser.add_argument("--output", default=None, help="Write the full match-percent grid to this CSV")
+    args = parser.parse_args(argv)
+
+    jd_paths, jd_keyword_sets = [], []
+    job_texts = {}  # position in jd_paths -> JD text, extracted together below
+    for path in collect_resume_paths(args.jds, SUPPORTED_EXTENSIONS + (PROFILE_EXTENSION,)):
+        if is_profile_file(path):
+            try:
+                profile = load_jd_profile(path)
+            except (OSError, ValueError) as e:
+                print(f"{e}. Skipping.")
+                continue
+            if profile.mode != args.mode or profile.normalize:
+                print(f"{path} was compiled with other settings than --mode {args.mode}. Skipping.")
+                continue
+            jd_paths.append(path)
+            jd_keyword_sets.append(profile.job_keywords)
+            continue
+        job_text = read_file(path)
+        if job_text:
+            job_texts[len(jd_paths)] = job_text
+            jd_paths.append(path)
+            jd_keyword_sets.append(None)
+    # One batched POS-tagging call for every JD in nouns_verbs mode
+    for i, (job_keywords, _) in zip(job_texts, extract_keywords_from_jds(list(job_texts.values()), args.mode)):
+        jd_keyword_sets[i] = job_keywords
+    resume_paths, resume_word_sets = [], []
+    for path in collect_resume_paths(args.resumes):
+        resume_text = read_file(path)
+        if resume_text:
+            resume_paths.append(path)
+            resume_word_sets.append(set(clean_text(resume_text, STOP_WORDS)))
+    if not jd_paths or not resume_paths:
+        print("Need at least one readable job description and one readable resume.")
+        return
+
+    grid = match_grid(jd_keyword_sets, resume_word_sets)
+    indices, scores = grid.top_k_per_jd(args.top)
+    for j, jd_path in enumerate(jd_paths):
+        print(f"\n{os.path.basename(jd_path)} ({grid.jd_sizes[j]} keywords)")
+        for i, score in zip(indices[j], scores[j]):
+            print(f"  {os.path.basename(resume_paths[i]):<40} {score:>6.1f}%")
+
+    if args.output:
+        output_dir = os.path.dirname(args.output)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        with open(args.output, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Job Description'] + [os.path.basename(p) for p in resume_paths])
+            for jd_path, row in zip(jd_paths, grid.scores):
+                writer.writerow([os.path.basename(jd_path)] + [f"{s:.1f}" for s in row])
+        print(f"\nMatch grid ({grid.shape[0]} x {grid.shape[1]}) saved to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+import os
+import json
+import zlib
+
+from resume_result import KeywordVocab, ResumeResult
+from fuzzy_utils import get_fuzzy_matcher
+
+# ========================
+# Corpus Manifest (incremental re-runs)
+# ========================
+#
+# A manifest directory remembers every resume file of a folder as it was
+# when last read, and the cleaned words it produced:
+#   manifest.json                    absolute path -> {"size", "mtime", "sha256"}
+#   tokens/<sha256>-<variant>.json.z zlib-compressed {word: count}
+# variant is the cleaning variant ("plain", "stem" or "lemma"), so one
+# manifest serves runs with different --normalize settings, and identical
+# files share one token file. sha256 is None for files that had no
+# readable text (they are retried once they change).
+#
+# A re-run only stats each file. Files with the same size and mtime are
+# scored straight from their cached words; the rest are hashed and only
+# re-cleaned when their content actually changed. The manifest is saved
+# every checkpoint_every files, so an interrupted run picks up where it
+# stopped.
+
+MANIFEST_FILE = "manifest.json"
+TOKENS_DIR = "tokens"
+
+def _write_atomic(path, data):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+class CorpusManifest:
+    """
+    Change manifest plus cleaned-word cache for one resume folder.
+    normalize ('stem'/'lemma') selects which cached words are used.
+    """
+    def __init__(self, manifest_dir, normalize=None):
+        self.manifest_dir = manifest_dir
+        self.variant = normalize if normalize not in (None, "none") else "plain"
+        os.makedirs(os.path.join(manifest_dir, TOKENS_DIR), exist_ok=True)
+        manifest_path = os.path.join(manifest_dir, MANIFEST_FILE)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, encoding="utf-8") as f:
+                self.entries = json.load(f)["files"]
+        else:
+            self.entries = {}  # absolute path -> {"size", "mtime", "sha256"}
+
+    def __len__(self):
+        return len(self.entries)
+
+    # ---------- token files ----------
+
+    def _token_path(self, digest):
+        return os.path.join(self.manifest_dir, TOKENS_DIR, f"{digest}-{self.variant}.json.z")
+
+    def has_tokens(self, digest):
+        return digest is not None and os.path.exists(self._token_path(digest))
+
+    def load_tokens(self, digest):
+        """Returns the cached {word: count} for a content hash, or None."""
+        try:
+            with open(self._token_path(digest), "rb") as f:
+                return json.loads(zlib.decompress(f.read()))
+        except (OSError, TypeError, ValueError, zlib.error):
+            return None
+
+    def _store_tokens(self, digest, word_counts):
+        if not self.has_tokens(digest):
+            _write_atomic(self._token_path(digest),
+                          zlib.compress(json.dumps(word_counts).encode("utf-8"), 1))
+
+    # ---------- change detection ----------
+
+    def plan(self, resume_paths):
+        """
+        Compares resume_paths with the manifest. Returns (stale, removed):
+        stale lists (path, known sha256 or None) for files that are new, whose
+        size/mtime changed, or that lack cached words for this variant;
+        removed lists (absolute) manifest paths no longer in resume_paths.
+        """
+        stale = []
+        for path in resume_paths:
+            entry = self.entries.get(os.path.abspath(path))
+            try:
+                stat = os.stat(path)
+            except OSError:
+                stale.append((path, None))
+                continue
+            if entry is None:
+                stale.append((path, None))
+            elif entry["size"] != stat.st_size or entry["mtime"] != stat.st_mtime:
+                stale.append((path, entry["sha256"] if self.has_tokens(entry["sha256"]) else None))
+            elif entry["sha256"] is not None and not self.has_tokens(entry["sha256"]):
+                stale.append((path, None))
+        current = {os.path.abspath(path) for path in resume_paths}
+        removed = [path for path in self.entries if path not in current]
+        return stale, removed
+
+    def sync(self, resume_paths, tokenize, checkpoint_every=200):
+        """
+        Brings the manifest up to date with resume_paths. tokenize(stale)
+        must yield (path, tokenize_resume result) for the stale items, e.g.
+        batch_utils.tokenize_resumes_parallel. Progress is saved every
+        checkpoint_every files and when the run stops for any reason; word
+        caches no file refers to any more are deleted afterwards.
+        Returns {"read": paths re-cleaned, "unchanged": count,
+        "removed": paths, "failed": unreadable paths}.
+        """
+        stale, removed = self.plan(resume_paths)
+        for path in removed:
+            del self.entries[path]
+        read, failed = [], []
+        done = 0
+        try:
+            for path, info in tokenize(stale):
+                done += 1
+                key = os.path.abspath(path)
+                if info is None:
+                    self.entries.pop(key, None)
+                    failed.append(path)
+                else:
+                    size, mtime, digest, word_counts = info
+                    if word_counts is not None:
+                        self._store_tokens(digest, word_counts)
+                        read.append(path)
+                    elif digest is None:
+                        failed.append(path)
+                    self.entries[key] = {"size": size, "mtime": mtime, "sha256": digest}
+                if done % max(1, checkpoint_every) == 0:
+                    self.save()
+        finally:
+            self.save()
+        if read or removed:
+            self.prune()
+        return {
+            "read": read,
+            "unchanged": len(resume_paths) - len(read) - len(failed),
+            "removed": removed,
+            "failed": failed,
+        }
+
+    def save(self):
+        """Writes the manifest (atomically; token files are already on disk)."""
+        state = {"files": self.entries}
+        _write_atomic(os.path.join(self.manifest_dir, MANIFEST_FILE), json.dumps(state).encode("utf-8"))
+
+    def prune(self):
+        """Deletes token files no longer referenced by any manifest entry. Returns how many."""
+        referenced = {entry["sha256"] for entry in self.entries.values()}
+        tokens_dir = os.path.join(self.manifest_dir, TOKENS_DIR)
+        pruned = 0
+        for name in os.listdir(tokens_dir):
+            if name.split("-", 1)[0] not in referenced:
+                os.remove(os.path.join(tokens_dir, name))
+                pruned += 1
+        return pruned
+
+    # ---------- scoring ----------
+
+    def score(self, resume_paths, job_keywords, fuzzy=None):
+        """
+        Scores resumes from their cached words (call sync first) and yields
+        (resume_path, ResumeResult) in input order; the result is None for
+        files without readable text. fuzzy (max edit distance) adds fuzzy_matched.
+        """
+        vocab = KeywordVocab(job_keywords)
+        matcher = get_fuzzy_matcher(frozenset(vocab.keywords), fuzzy) if fuzzy else None
+        for path in resume_paths:
+            entry = self.entries.get(os.path.abspath(path))
+            word_counts = self.load_tokens(entry["sha256"]) if entry and entry["sha256"] else None
+            if word_counts is None:
+                yield path, None
+                continue
+            result = ResumeResult.from_counts(path, vocab, word_counts)
+            if matcher:
+                result["fuzzy_matched"] = matcher.match(word_counts, result.missing)
+            yield path, result
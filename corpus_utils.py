@@ -0,0 +1,83 @@
+import os
+import csv
+import sys
+import gzip
+import json
+
+# ========================
+# Streaming Resume Corpora (JSONL / CSV)
+# ========================
+#
+# Applicant exports hold one resume per record instead of one per file.
+# Records are read lazily, one line / row at a time, so memory stays flat
+# however large the export is. Each record becomes (resume id, text):
+# the id comes from id_field when given, else "<file name>:<line or row>".
+
+CORPUS_EXTENSIONS = (".jsonl", ".ndjson", ".csv")
+
+def _base_name(path):
+    name = os.path.basename(path)
+    return name[:-3] if name.lower().endswith(".gz") else name
+
+def is_corpus_file(path):
+    """True for a .jsonl/.ndjson/.csv file (optionally .gz-compressed)."""
+    return os.path.isfile(path) and _base_name(path).lower().endswith(CORPUS_EXTENSIONS)
+
+def _open_text(path):
+    if path.lower().endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, encoding="utf-8", newline="")
+
+def _record_id(record, id_field, name, number):
+    value = record.get(id_field) if id_field else None
+    return f"{name}:{number}" if value in (None, "") else str(value)
+
+def _record_text(value):
+    return value if isinstance(value, str) else ""
+
+def iter_jsonl_records(path, text_field="text", id_field=None):
+    """
+    Yields (resume id, text) for each JSON object line of a JSONL file.
+    Blank lines are skipped; malformed lines are reported and skipped.
+    A record without a string text_field yields empty text.
+    """
+    name = _base_name(path)
+    with _open_text(path) as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                print(f"Skipping {name}:{line_no}: not valid JSON")
+                continue
+            if not isinstance(record, dict):
+                print(f"Skipping {name}:{line_no}: not a JSON object")
+                continue
+            yield _record_id(record, id_field, name, line_no), _record_text(record.get(text_field))
+
+def iter_csv_records(path, text_field="text", id_field=None):
+    """
+    Yields (resume id, text) for each row of a CSV file with a header row.
+    Raises ValueError right away if text_field is not one of its columns.
+    """
+    # Whole resumes in one cell easily exceed csv's 128 KB default field limit
+    csv.field_size_limit(min(sys.maxsize, 2 ** 31 - 1))
+    f = _open_text(path)
+    reader = csv.DictReader(f)
+    if text_field not in (reader.fieldnames or ()):
+        f.close()
+        raise ValueError(f"{_base_name(path)} has no '{text_field}' column "
+                         f"(columns: {', '.join(reader.fieldnames or ())})")
+    return _iter_csv_rows(f, reader, text_field, id_field, _base_name(path))
+
+def _iter_csv_rows(f, reader, text_field, id_field, name):
+    with f:
+        for row_no, row in enumerate(reader, 1):
+            yield _record_id(row, id_field, name, row_no), _record_text(row.get(text_field))
+
+def iter_corpus(path, text_field="text", id_field=None):
+    """Yields (resume id, text) records from a JSONL or CSV corpus file, lazily."""
+    if _base_name(path).lower().endswith(".csv"):
+        return iter_csv_records(path, text_field, id_field)
+    return iter_jsonl_records(path, text_field, id_field)
@@ -1,4 +1,71 @@
 import os
+import sys
+import pydoc
+import contextlib
+
+from file_utils import phrase_match_percent, fuzzy_match_percent, format_fuzzy_matches
+
+# ================================
+# Buffered Terminal Output
+# ================================
+# Each print_* function formats its whole table first and writes it with a
+# single call (one write per table instead of one print per row). Inside
+# paged_output() the tables are collected and shown together, through the
+# system pager ($PAGER, else less/more) when paging is on and stdout is a
+# terminal.
+
+# Set by configure_display (main.py --top / --pager)
+_display_options = {"top": None, "pager": False}
+_buffers = []
+
+def configure_display(top=None, pager=False):
+    """
+    top: show at most this many rows per table (resumes in the summary and
+    matrix columns, keywords in the matrix and keyword lists); None for all.
+    pager: send paged_output() blocks through the system pager.
+    """
+    _display_options["top"] = top or None
+    _display_options["pager"] = pager
+
+def emit(lines):
+    """Writes a block of lines with one call (or adds it to the open paged_output block)."""
+    text = "\n".join(lines) + "\n"
+    if _buffers:
+        _buffers[-1].append(text)
+    else:
+        sys.stdout.write(text)
+
+@contextlib.contextmanager
+def paged_output():
+    """Collects everything emitted inside the block and shows it at once."""
+    _buffers.append([])
+    try:
+        yield
+    finally:
+        text = "".join(_buffers.pop())
+        if _buffers:
+            _buffers[-1].append(text)
+        elif _display_options["pager"] and sys.stdout.isatty():
+            pydoc.pager(text)
+        else:
+            sys.stdout.write(text)
+
+def _top(top):
+    return _display_options["top"] if top is None else (top or None)
+
+def best_result_indices(valid_results, top=None):
+    """
+    Indices of the results to display: all of them in input order, or with
+    top set and exceeded, the best `top` by match percent (ties keep input order).
+    """
+    top = _top(top)
+    if not top or len(valid_results) <= top:
+        return list(range(len(valid_results)))
+    order = sorted(range(len(valid_results)), key=lambda i: -valid_results[i]["match_percent"])
+    return order[:top]
+
+def _more(hidden, what):
+    return [f"... {hidden} more {what} not shown (use --top 0 to show all, or save the results)"]
 
 # ================================
 # Print the CLI Introduction Banner
@@ -8,66 +75,140 @@ def print_intro():
     Prints an intro message with basic instructions for the CLI tool.
     """
     print("=== Resume Keyword Matcher ===\n")
-    print("Compare up to 3 resumes against a job description.")
+    print("Compare one or more resumes against a job description.")
     print("See which resume covers the most important keywords for the job.\n")
     print("Resumes with more keyword matches may stand out more to employers.\n")
 
 # ================================
 # Print Results for a Single Resume
 # ================================
-def print_single_resume_results(result, job_word_counts):
+def print_single_resume_results(result, job_word_counts, all_keywords=None, top=None):
     """
     Prints detailed match results for one resume:
       - Match percent
       - List of matched keywords with job description frequencies
       - List of missing keywords with job description frequencies
+    all_keywords is the JD keyword list already sorted by frequency (as for
+    the matrix); the lists are filtered from it instead of re-sorted.
+    top limits each list to its most frequent keywords.
     """
-    print(f"\n=== RESULTS for {os.path.basename(result['resume_path'])} ===")
-    print(f"Match Percent: {result['match_percent']:.1f}%\n")
-    print(f"Matched Keywords ({result['num_matched']}):")
-    print(f"{'Keyword':<20} {'Frequency in JD':>16}")
-    print("-" * 36)
-    for word in sorted(result['matched'], key=lambda w: (-job_word_counts[w], w)):
-        print(f"{word:<20} {job_word_counts[word]:>16}")
-    print(f"\nMissing Keywords ({result['num_missing']}):")
-    print(f"{'Keyword':<20} {'Frequency in JD':>16}")
-    print("-" * 36)
-    for word in sorted(result['missing'], key=lambda w: (-job_word_counts[w], w)):
-        print(f"{word:<20} {job_word_counts[word]:>16}")
+    if all_keywords is None:
+        all_keywords = sorted(result['matched'] | result['missing'], key=lambda w: (-job_word_counts[w], w))
+    top = _top(top)
+    lines = [
+        f"\n=== RESULTS for {os.path.basename(result['resume_path'])} ===",
+        f"Match Percent: {result['match_percent']:.1f}%\n",
+    ]
+    for title, words in (("Matched", result['matched']), ("Missing", result['missing'])):
+        ranked = [w for w in all_keywords if w in words]
+        if title == "Missing":
+            lines.append("")
+        lines += [f"{title} Keywords ({len(ranked)}):", f"{'Keyword':<20} {'Frequency in JD':>16}", "-" * 36]
+        lines += [f"{word:<20} {job_word_counts[word]:>16}" for word in ranked[:top]]
+        if top and len(ranked) > top:
+            lines += _more(len(ranked) - top, "keywords")
+    emit(lines)
 
 # ================================
 # Print the Summary Table (Multi-Resume)
 # ================================
-def print_summary_table(valid_results):
+def print_summary_table(valid_results, top=None):
     """
     Prints a summary table for multiple resumes:
       - File name
       - Match percent
       - Number of matched and missing keywords
+    With top set and exceeded, only the best `top` resumes are listed.
     """
-    print("\n=== SUMMARY ===")
-    print(f"{'Resume File':<28} {'Match %':>8} {'#Matched':>10} {'#Missing':>10}")
-    print("-" * 60)
-    for r in valid_results:
-        print(f"{os.path.basename(r['resume_path']):<28} {r['match_percent']:>8.1f} {r['num_matched']:>10} {r['num_missing']:>10}")
+    indices = best_result_indices(valid_results, top)
+    lines = [
+        "\n=== SUMMARY ===",
+        f"{'Resume File':<28} {'Match %':>8} {'#Matched':>10} {'#Missing':>10}",
+        "-" * 60,
+    ]
+    for i in indices:
+        r = valid_results[i]
+        lines.append(f"{os.path.basename(r['resume_path']):<28} {r['match_percent']:>8.1f} {r['num_matched']:>10} {r['num_missing']:>10}")
+    if len(indices) < len(valid_results):
+        lines += _more(len(valid_results) - len(indices), "resumes")
+    emit(lines)
 
 # ================================
 # Print the Keyword Comparison Matrix
 # ================================
-def print_keyword_matrix(all_keywords, valid_results):
+def print_keyword_matrix(all_keywords, valid_results, matrix=None, top=None):
     """
     Prints a side-by-side matrix showing, for each job keyword,
     the frequency in each resume.
     Header: Keyword | resume1.txt | resume2.txt | ...
-    Returns the header (list of column names) for reuse.
+    matrix is an optional prebuilt KeywordMatrix over all_keywords.
+    With top set, shows the `top` most frequent keywords and only the
+    columns of the resumes listed in the summary.
+    Returns the full header (list of column names, all resumes) for reuse.
     """
-    print("\n=== KEYWORD COMPARISON ===")
+    if matrix is None:
+        from matrix_utils import build_keyword_matrix  # NumPy loads only when a matrix is built
+        matrix = build_keyword_matrix(all_keywords, [r['resume_counts'] for r in valid_results])
     header = ["Keyword"] + [os.path.basename(r['resume_path']) for r in valid_results]
-    print(" | ".join(f"{col:<15}" for col in header))
-    print("-" * (18 * len(header)))
-    for word in all_keywords:
-        row = [f"{word:<15}"]
-        for r in valid_results:
-            row.append(f"{r['resume_counts'].get(word, 0):<15}")
-        print(" | ".join(row))
+    columns = best_result_indices(valid_results, top)
+    top = _top(top)
+    num_rows = min(len(all_keywords), top) if top else len(all_keywords)
+    row_format = " | ".join(["{:<15}"] * (len(columns) + 1))
+    lines = [
+        "\n=== KEYWORD COMPARISON ===",
+        row_format.format("Keyword", *(header[i + 1] for i in columns)),
+        "-" * (18 * (len(columns) + 1)),
+    ]
+    block = matrix.block(columns, range(num_rows)).T.tolist()
+    lines += [row_format.format(word, *counts) for word, counts in zip(all_keywords, block)]
+    if num_rows < len(all_keywords):
+        lines += _more(len(all_keywords) - num_rows, "keywords")
+    if len(columns) < len(valid_results):
+        lines.append(f"(Columns: the top {len(columns)} of {len(valid_results)} resumes by match %.)")
+    emit(lines)
     return header  # Useful if you want to reuse in save logic
+
+# ================================
+# Print Phrase Matches (phrase mode)
+# ================================
+def print_phrase_results(valid_results, top=None):
+    """
+    Prints matched and missing JD phrases (e.g. "c++", "machine learning")
+    for each resume that was scored with phrase matching (with top set, for
+    the resumes listed in the summary).
+    """
+    indices = best_result_indices(valid_results, top)
+    lines = ["\n=== PHRASE MATCHES ==="]
+    for i in indices:
+        r = valid_results[i]
+        lines += [
+            f"{os.path.basename(r['resume_path'])}: {phrase_match_percent(r):.1f}%",
+            f"  Matched: {', '.join(sorted(r['phrase_matched'])) or '-'}",
+            f"  Missing: {', '.join(sorted(r['phrase_missing'])) or '-'}",
+        ]
+    if len(indices) < len(valid_results):
+        lines += _more(len(valid_results) - len(indices), "resumes")
+    emit(lines)
+
+# ================================
+# Print Fuzzy Matches (fuzzy mode)
+# ================================
+def print_fuzzy_results(valid_results, top=None):
+    """
+    Prints the near-miss spellings (e.g. "kubernetes ~ kubernets") found
+    for missing JD keywords in each resume scored with fuzzy matching,
+    with the match percent counting them (with top set, for the resumes
+    listed in the summary).
+    """
+    indices = best_result_indices(valid_results, top)
+    lines = ["\n=== FUZZY MATCHES ==="]
+    for i in indices:
+        r = valid_results[i]
+        lines += [
+            f"{os.path.basename(r['resume_path'])}: {fuzzy_match_percent(r):.1f}% with "
+            f"{len(r['fuzzy_matched'])} fuzzy matches",
+            f"  {format_fuzzy_matches(r['fuzzy_matched']) or '-'}",
+        ]
+    if len(indices) < len(valid_results):
+        lines += _more(len(valid_results) - len(indices), "resumes")
+    emit(lines)
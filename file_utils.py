@@ -1,10 +1,14 @@
 import os
-import re
-import string
-import collections
 import csv
-from PyPDF2 import PdfReader  # Install with: pip install PyPDF2
-import nltk
+import mmap
+import codecs
+import threading
+import collections
+
+# PyPDF2 is imported lazily by pdf_utils the first time a PDF is read
+from pdf_utils import extract_pdf_text, PdfExtractionError
+from text_cache import get_text_cache
+from text_utils import calculate_match_percent, match_percent_from_count
 
 # ========================
 # Default sample resume paths (used if user presses Enter)
@@ -19,6 +23,66 @@ DEFAULT_RESUMES = [
 # File Reading
 # ========================
 
+# .txt resumes above this size are streamed from a memory map (read_text_chunks)
+# by the scoring path instead of being read into one string
+MMAP_THRESHOLD_BYTES = 8 * 1024 * 1024
+
+# Why recent PDFs failed extraction, by text-cache key, so a document that
+# times out costs its timeout once per process instead of on every read
+MAX_PDF_FAILURES = 256
+_pdf_failures = collections.OrderedDict()
+_pdf_failures_lock = threading.Lock()
+
+def read_pdf_bytes(data, separator=""):
+    """
+    Returns the extracted text of raw PDF bytes, using the shared text cache
+    so the same document is only ever parsed once per process (or per
+    cache_dir when a disk cache is configured).
+    Raises PdfExtractionError (the message is the reason) for PDFs that
+    can't be extracted within the pdf_utils budgets; the failure is
+    remembered, so retrying the same bytes fails fast.
+    """
+    # The separator changes the output, so it is part of the cache key
+    kind = "pdf" + (f"-{separator.encode('utf-8').hex()}" if separator else "")
+    cache = get_text_cache()
+    key = cache.make_key(data, kind)
+    text = cache.get(key)
+    if text is not None:
+        return text
+    with _pdf_failures_lock:
+        reason = _pdf_failures.get(key)
+    if reason is not None:
+        raise PdfExtractionError(reason)
+    try:
+        text = extract_pdf_text(data, separator)
+    except PdfExtractionError as e:
+        with _pdf_failures_lock:
+            _pdf_failures[key] = str(e)
+            while len(_pdf_failures) > MAX_PDF_FAILURES:
+                _pdf_failures.popitem(last=False)
+        raise
+    cache.put(key, text)
+    return text
+
+def read_text_chunks(filepath, chunk_bytes=1 << 20):
+    """
+    Yields the UTF-8 text of a file in pieces of about chunk_bytes, decoded
+    incrementally from a read-only memory map, so memory use doesn't grow
+    with the file size. Raises OSError / UnicodeDecodeError like open().read().
+    """
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            decoder = codecs.getincrementaldecoder('utf-8')()
+            for start in range(0, len(mapped), chunk_bytes):
+                piece = decoder.decode(mapped[start:start + chunk_bytes])
+                if piece:
+                    yield piece
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                yield tail
+
 def read_file(filepath):
     """
     Reads and returns the text from a .txt or .pdf file.
@@ -39,13 +103,9 @@ def read_file(filepath):
     
     elif ext == '.pdf':
         try:
-            reader = PdfReader(filepath)
-            text = ""
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text
-            return text
+            with open(filepath, 'rb') as f:
+                data = f.read()
+            return read_pdf_bytes(data)
         except Exception as e:
             print(f"Error reading PDF file: {e}")
             return ""
@@ -54,6 +114,24 @@ def read_file(filepath):
         print("Unsupported file type. Please use a .txt or .pdf file.")
         return ""
 
+def decode_file_bytes(filepath, data):
+    """
+    Returns the text of a .txt or .pdf file from its raw bytes, for callers
+    that have already read the file (e.g. to hash it). Like read_file,
+    returns empty string if the text cannot be extracted.
+    """
+    ext = os.path.splitext(filepath)[1].lower()
+    try:
+        if ext == '.txt':
+            return data.decode('utf-8')
+        if ext == '.pdf':
+            return read_pdf_bytes(data)
+    except Exception as e:
+        print(f"Error reading {ext[1:].upper()} file: {e}")
+        return ""
+    print("Unsupported file type. Please use a .txt or .pdf file.")
+    return ""
+
 # ========================
 # Save Results to TXT
 # ========================
@@ -165,24 +243,128 @@ def save_summary_csv(filename, summary_rows):
 
 def prompt_resume_paths():
     """
-    Prompts user for 1-3 resume file paths (comma-separated).
+    Prompts user for resume file paths (comma-separated); a folder or glob
+    pattern adds every .txt/.pdf resume it matches.
     Returns a list of valid paths (or sample files if Enter is pressed).
     """
+    from batch_utils import collect_resume_paths  # deferred: batch_utils imports this module
+
     while True:
         resume_input = input(
-            "Enter path(s) to 1–3 resume files (.txt or .pdf). Separate by commas\n"
+            "Enter path(s) to resume files (.txt or .pdf), folders or glob patterns. Separate by commas\n"
             f"[Press Enter to use the samples: {', '.join(DEFAULT_RESUMES)}]: "
         ).strip()
         if not resume_input:
             resume_paths = DEFAULT_RESUMES
         else:
             # Split input by comma, strip whitespace, ignore empty values
-            resume_paths = [p.strip() for p in resume_input.split(",") if p.strip()]
+            resume_paths = []
+            for entry in (p.strip() for p in resume_input.split(",")):
+                if os.path.isdir(entry) or any(c in entry for c in "*?["):
+                    resume_paths += collect_resume_paths(entry)
+                elif entry:
+                    resume_paths.append(entry)
         if len(resume_paths) == 0:
             print("Please provide at least one resume file.")
             continue
-        if len(resume_paths) > 3:
-            print("You entered too many resumes. Please enter up to 3 resumes for comparison.")
-            continue
         # Optional: check if files exist here and warn/skip as needed
         return resume_paths
+
+# ========================
+# Write Multi-Resume Results (no prompts)
+# ========================
+
+def phrase_match_percent(result):
+    """Match percent over the JD phrases for a result with phrase matches."""
+    total = len(result["phrase_matched"]) + len(result["phrase_missing"])
+    return calculate_match_percent(result["phrase_matched"], total)
+
+def fuzzy_match_percent(result):
+    """Match percent counting fuzzy matches as matched, for a result with fuzzy matches."""
+    return match_percent_from_count(result["num_matched"] + len(result["fuzzy_matched"]),
+                                    result["num_matched"] + result["num_missing"])
+
+def format_fuzzy_matches(fuzzy_matched, sep=", "):
+    """'keyword ~ resume word' pairs, sorted by keyword."""
+    return sep.join(f"{keyword} ~ {word}" for keyword, word in sorted(fuzzy_matched.items()))
+
+def write_all_results_txt(filename, valid_results, all_keywords, header, matrix=None):
+    """
+    Writes the summary table and keyword comparison matrix as a .txt file.
+    matrix is an optional prebuilt KeywordMatrix over all_keywords.
+    """
+    if matrix is None:
+        from matrix_utils import build_keyword_matrix  # NumPy loads only when a matrix is built
+        matrix = build_keyword_matrix(all_keywords, [r['resume_counts'] for r in valid_results])
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write("=== SUMMARY ===\n")
+        f.write(f"{'Resume File':<28} {'Match %':>8} {'#Matched':>10} {'#Missing':>10}\n")
+        f.write("-" * 60 + "\n")
+        for r in valid_results:
+            f.write(f"{os.path.basename(r['resume_path']):<28} {r['match_percent']:>8.1f} {r['num_matched']:>10} {r['num_missing']:>10}\n")
+        f.write("\n=== KEYWORD COMPARISON ===\n")
+        f.write(" | ".join(f"{col:<15}" for col in header) + "\n")
+        f.write("-" * (18 * len(header)) + "\n")
+        for word, counts in zip(all_keywords, matrix.rows_by_keyword()):
+            row = [f"{word:<15}"] + [f"{count:<15}" for count in counts]
+            f.write(" | ".join(row) + "\n")
+        if valid_results and "phrase_matched" in valid_results[0]:
+            f.write("\n=== PHRASE MATCHES ===\n")
+            for r in valid_results:
+                f.write(f"{os.path.basename(r['resume_path'])}: {phrase_match_percent(r):.1f}%\n")
+                f.write(f"  Matched: {', '.join(sorted(r['phrase_matched']))}\n")
+                f.write(f"  Missing: {', '.join(sorted(r['phrase_missing']))}\n")
+        if valid_results and "fuzzy_matched" in valid_results[0]:
+            f.write("\n=== FUZZY MATCHES ===\n")
+            for r in valid_results:
+                f.write(f"{os.path.basename(r['resume_path'])}: {fuzzy_match_percent(r):.1f}% with "
+                        f"{len(r['fuzzy_matched'])} fuzzy matches\n")
+                f.write(f"  {format_fuzzy_matches(r['fuzzy_matched']) or '-'}\n")
+
+def write_all_results_csv(filename, valid_results, all_keywords, matrix=None):
+    """
+    Writes the summary table and keyword comparison matrix as a .csv file.
+    matrix is an optional prebuilt KeywordMatrix over all_keywords.
+    """
+    if matrix is None:
+        from matrix_utils import build_keyword_matrix  # NumPy loads only when a matrix is built
+        matrix = build_keyword_matrix(all_keywords, [r['resume_counts'] for r in valid_results])
+    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["=== SUMMARY ==="])
+        writer.writerow(['Resume File', 'Match %', '#Matched', '#Missing'])
+        for r in valid_results:
+            writer.writerow([
+                os.path.basename(r["resume_path"]),
+                f"{r['match_percent']:.1f}",
+                r["num_matched"],
+                r["num_missing"]
+            ])
+        writer.writerow([])
+        writer.writerow(["=== KEYWORD COMPARISON ==="])
+        row_header = ["Keyword"] + [os.path.basename(r['resume_path']) for r in valid_results]
+        writer.writerow(row_header)
+        for word, counts in zip(all_keywords, matrix.rows_by_keyword()):
+            writer.writerow([word] + counts)
+        if valid_results and "phrase_matched" in valid_results[0]:
+            writer.writerow([])
+            writer.writerow(["=== PHRASE MATCHES ==="])
+            writer.writerow(['Resume File', 'Phrase Match %', 'Matched Phrases', 'Missing Phrases'])
+            for r in valid_results:
+                writer.writerow([
+                    os.path.basename(r["resume_path"]),
+                    f"{phrase_match_percent(r):.1f}",
+                    "; ".join(sorted(r["phrase_matched"])),
+                    "; ".join(sorted(r["phrase_missing"]))
+                ])
+        if valid_results and "fuzzy_matched" in valid_results[0]:
+            writer.writerow([])
+            writer.writerow(["=== FUZZY MATCHES ==="])
+            writer.writerow(['Resume File', 'Match % with Fuzzy', '#Fuzzy', 'Fuzzy Matches'])
+            for r in valid_results:
+                writer.writerow([
+                    os.path.basename(r["resume_path"]),
+                    f"{fuzzy_match_percent(r):.1f}",
+                    len(r["fuzzy_matched"]),
+                    format_fuzzy_matches(r["fuzzy_matched"], "; ")
+                ])
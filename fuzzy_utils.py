@@ -0,0 +1,152 @@
+import functools
+import collections
+
+# ========================
+# Fuzzy Keyword Matching
+# ========================
+#
+# Exact matching misses misspelled skills ("kubernets", "postgre",
+# "javascrpt"). Fuzzy mode also accepts a resume word within a few edits
+# (Levenshtein distance) of a JD keyword the resume lacks. The bound
+# scales with the keyword's length, since one edit turns most short words
+# into other real words ("java" / "jira"):
+#   under 5 letters   exact only
+#   5-8 letters       1 edit
+#   9+ letters        2 edits
+#
+# Words are not compared pairwise. A character-bigram index (with "^"/"$"
+# marking the word ends) narrows each lookup to words that share enough
+# bigrams: k edits destroy at most 2k of a word's distinct bigrams, so
+# anything sharing fewer, or differing in length by more than k, can't be
+# within k edits. Only those candidates get a bounded edit-distance check.
+# The index holds the JD keywords and resume words are looked up in it
+# (edit distance is symmetric). Each distinct word's lookup is remembered,
+# so over a corpus every vocabulary word is looked up once per JD.
+
+DEFAULT_MAX_DISTANCE = 2
+
+def max_edits(word, max_distance=DEFAULT_MAX_DISTANCE):
+    """Edits allowed for a keyword of this length (at most max_distance)."""
+    if len(word) < 5:
+        return 0
+    return min(max_distance, 1 if len(word) < 9 else 2)
+
+def edit_distance_within(a, b, max_distance):
+    """Levenshtein distance between a and b, or None if it is over max_distance."""
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+    if len(a) > len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if min(current) > max_distance:
+            # Every later row only grows from this one
+            return None
+        previous = current
+    return previous[-1] if previous[-1] <= max_distance else None
+
+def _bigrams(word):
+    padded = f"^{word}$"
+    return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+class FuzzyIndex:
+    """Character-bigram postings over a set of words, for near-match lookups."""
+    def __init__(self, words=()):
+        self.words = []
+        self._ids = {}
+        self._postings = collections.defaultdict(list)  # bigram -> word ids
+        self._min_len = self._max_len = None
+        self.add(words)
+
+    def __len__(self):
+        return len(self.words)
+
+    def add(self, words):
+        for word in words:
+            if word in self._ids:
+                continue
+            word_id = self._ids[word] = len(self.words)
+            self.words.append(word)
+            for gram in _bigrams(word):
+                self._postings[gram].append(word_id)
+            self._min_len = len(word) if self._min_len is None else min(self._min_len, len(word))
+            self._max_len = len(word) if self._max_len is None else max(self._max_len, len(word))
+
+    def near(self, word, max_distance):
+        """
+        Indexed words within max_distance edits of word (other than word
+        itself), as (distance, word) pairs, closest first.
+        """
+        if not self.words or not self._min_len - max_distance <= len(word) <= self._max_len + max_distance:
+            return []
+        grams = _bigrams(word)
+        needed = len(grams) - 2 * max_distance
+        if needed > 0:
+            shared = collections.Counter()
+            for gram in grams:
+                shared.update(self._postings.get(gram, ()))
+            candidates = [word_id for word_id, count in shared.items() if count >= needed]
+        else:
+            candidates = range(len(self.words))
+        matches = []
+        for word_id in candidates:
+            other = self.words[word_id]
+            if other == word:
+                continue
+            distance = edit_distance_within(word, other, max_distance)
+            if distance is not None:
+                matches.append((distance, other))
+        return sorted(matches)
+
+class FuzzyMatcher:
+    """
+    Fuzzy matching for one JD keyword set, reused across resumes
+    (see get_fuzzy_matcher).
+    """
+    # Lookups remembered before the memo is reset (bounds memory on huge corpora)
+    MAX_REMEMBERED = 200_000
+
+    def __init__(self, keywords, max_distance=DEFAULT_MAX_DISTANCE):
+        self.keywords = frozenset(keywords)
+        self.max_distance = max_distance
+        self.index = FuzzyIndex(sorted(word for word in self.keywords if max_edits(word, max_distance)))
+        self._near = {}
+
+    def near_keywords(self, word):
+        """JD keywords that word is within their edit bound of, as (distance, keyword) pairs."""
+        near = self._near.get(word)
+        if near is None:
+            if len(self._near) >= self.MAX_REMEMBERED:
+                self._near.clear()
+            near = [(distance, keyword) for distance, keyword in self.index.near(word, self.max_distance)
+                    if distance <= max_edits(keyword, self.max_distance)]
+            self._near[word] = near
+        return near
+
+    def match(self, word_counts, missing):
+        """
+        Finds fuzzy matches for the missing JD keywords among a resume's
+        cleaned words (a word -> count mapping). Words that are JD keywords
+        themselves never stand in for another keyword. The closest, then most
+        frequent, word wins. Returns {missing keyword: resume word}.
+        """
+        best = {}
+        if not missing or not self.index:
+            return best
+        for word, count in word_counts.items():
+            if not count or word in self.keywords:
+                continue
+            for distance, keyword in self.near_keywords(word):
+                if keyword in missing:
+                    rank = (distance, -count, word)
+                    if keyword not in best or rank < best[keyword]:
+                        best[keyword] = rank
+        return {keyword: rank[2] for keyword, rank in best.items()}
+
+@functools.lru_cache(maxsize=8)
+def get_fuzzy_matcher(keywords, max_distance=DEFAULT_MAX_DISTANCE):
+    """Cached FuzzyMatcher for a frozenset of JD keywords."""
+    return FuzzyMatcher(keywords, max_distance)
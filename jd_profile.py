@@ -0,0 +1,213 @@
+import os
+import json
+import zlib
+import struct
+import hashlib
+import argparse
+import collections
+from array import array
+
+from stopwords import STOP_WORDS
+from file_utils import read_file
+from tagging_utils import NOUN_VERB_TAGS
+from text_utils import ANALYZER_VERSION
+
+# ========================
+# Compiled JD Profiles
+# ========================
+#
+# A JD profile is a job description already run through the keyword
+# pipeline (read, clean, POS-filter, normalize), saved so that scoring
+# against the same requisition again skips all of that. File layout
+# (little-endian):
+#   header    8s magic, 32s analyzer fingerprint, uint32 keyword count,
+#             uint16 mode / normalize / source name byte lengths,
+#             uint32 keywords byte length, uint32 CRC-32 of everything after
+#             the header
+#   strings   mode, normalize ("" for none), source name (UTF-8)
+#   counts    uint32 JD frequency per keyword
+#   keywords  UTF-8 keywords joined by "\n", sorted
+#
+# The fingerprint hashes everything that decides which keywords a JD
+# yields: ANALYZER_VERSION, the stop-word list, the POS tags kept in
+# nouns_verbs mode, the normalization and the NLTK version those two
+# depend on. A profile whose fingerprint no longer matches is refused.
+
+PROFILE_EXTENSION = ".jdp"
+PROFILE_MAGIC = b"RKMJDP02"
+OLD_MAGICS = (b"RKMJDP01",)
+HEADER = struct.Struct("<8s32sIHHHII")
+
+class StaleProfileError(ValueError):
+    """Raised when a profile was compiled with different analyzer settings."""
+
+def _nltk_version():
+    # From the package metadata: importing nltk itself takes a while
+    from importlib import metadata
+    try:
+        return metadata.version("nltk")
+    except metadata.PackageNotFoundError:
+        return None
+
+def analyzer_fingerprint(mode, normalize=None):
+    """sha256 digest (bytes) of the analyzer settings a JD profile depends on."""
+    settings = {"analyzer": ANALYZER_VERSION, "stop_words": sorted(STOP_WORDS), "mode": mode,
+                "normalize": normalize or "none"}
+    if mode == "nouns_verbs":
+        settings["tags"] = sorted(NOUN_VERB_TAGS)
+    if mode == "nouns_verbs" or normalize:
+        settings["nltk"] = _nltk_version()
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode("utf-8")).digest()
+
+def is_profile_file(path):
+    return path.lower().endswith(PROFILE_EXTENSION)
+
+class JDProfile:
+    """
+    A compiled job description: job_keywords / job_word_counts exactly as
+    extract_keywords_from_jd returns them, plus the settings they were
+    built with (resumes must be cleaned with the same normalize).
+    """
+    __slots__ = ("job_word_counts", "mode", "normalize", "source", "fingerprint")
+
+    def __init__(self, job_word_counts, mode, normalize=None, source="", fingerprint=None):
+        self.job_word_counts = collections.Counter(job_word_counts)
+        self.mode = mode
+        self.normalize = normalize if normalize != "none" else None
+        self.source = source
+        self.fingerprint = fingerprint or analyzer_fingerprint(mode, self.normalize)
+
+    @property
+    def job_keywords(self):
+        return set(self.job_word_counts)
+
+    @classmethod
+    def compile(cls, job_text, mode="all", normalize=None, source=""):
+        """Runs the JD keyword pipeline once and returns its profile."""
+        from scoring_engine import extract_keywords_from_jd
+        _, job_word_counts = extract_keywords_from_jd(job_text, mode, normalize)
+        return cls(job_word_counts, mode, normalize, source)
+
+    @classmethod
+    def compile_many(cls, job_texts, mode="all", normalize=None, sources=None):
+        """compile for several JDs, POS-tagged in one batched call in nouns_verbs mode."""
+        from scoring_engine import extract_keywords_from_jds
+        sources = sources or [""] * len(job_texts)
+        return [cls(job_word_counts, mode, normalize, source)
+                for (_, job_word_counts), source in zip(extract_keywords_from_jds(job_texts, mode, normalize), sources)]
+
+    def to_bytes(self):
+        keywords = sorted(self.job_word_counts)
+        strings = [s.encode("utf-8") for s in (self.mode, self.normalize or "", self.source)]
+        counts = array("I", [self.job_word_counts[word] for word in keywords])
+        keyword_bytes = "\n".join(keywords).encode("utf-8")
+        body = b"".join([*strings, counts.tobytes(), keyword_bytes])
+        header = HEADER.pack(PROFILE_MAGIC, self.fingerprint, len(keywords), *map(len, strings),
+                             len(keyword_bytes), zlib.crc32(body))
+        return header + body
+
+    @classmethod
+    def from_bytes(cls, data, name="profile"):
+        """
+        Parses a profile. Raises ValueError for anything that isn't one and
+        StaleProfileError if the analyzer settings changed since it was compiled.
+        """
+        if data[:len(PROFILE_MAGIC)] in OLD_MAGICS:
+            raise StaleProfileError(f"{name} uses an older profile format; recompile it with jd_profile.py")
+        if len(data) < HEADER.size or data[:len(PROFILE_MAGIC)] != PROFILE_MAGIC:
+            raise ValueError(f"{name} is not a JD profile")
+        _, fingerprint, num_keywords, *lengths, keywords_length, checksum = HEADER.unpack_from(data, 0)
+        body = data[HEADER.size:]
+        if len(body) != sum(lengths) + 4 * num_keywords + keywords_length or zlib.crc32(body) != checksum:
+            raise ValueError(f"{name} is truncated or corrupt")
+        offset = 0
+        strings = []
+        for length in lengths:
+            strings.append(body[offset:offset + length].decode("utf-8"))
+            offset += length
+        mode, normalize, source = strings
+        counts = array("I")
+        counts.frombytes(body[offset:offset + 4 * num_keywords])
+        offset += 4 * num_keywords
+        keywords = body[offset:].decode("utf-8").split("\n") if num_keywords else []
+        if len(keywords) != num_keywords:
+            raise ValueError(f"{name} is truncated or corrupt")
+        if fingerprint != analyzer_fingerprint(mode, normalize or None):
+            raise StaleProfileError(
+                f"{name} was compiled with different analyzer settings "
+                f"(stop words, cleaning rules or NLTK version); recompile it with jd_profile.py")
+        return cls(dict(zip(keywords, counts)), mode, normalize or None, source, fingerprint)
+
+    def save(self, path):
+        """Writes the profile atomically."""
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self.to_bytes())
+        os.replace(tmp_path, path)
+
+def load_jd_profile(path):
+    """Reads a .jdp profile (same errors as JDProfile.from_bytes, plus OSError)."""
+    with open(path, "rb") as f:
+        return JDProfile.from_bytes(f.read(), os.path.basename(path))
+
+# ========================
+# Command-Line Interface
+# ========================
+
+def main(argv=None):
+    """
+    python jd_profile.py compile JD_FILE_DIR_OR_GLOB [--out-dir DIR] [--mode all|nouns_verbs] [--normalize stem|lemma]
+    python jd_profile.py show PROFILE.jdp
+    """
+    from batch_utils import collect_resume_paths
+    from normalize_utils import NORMALIZE_METHODS
+
+    parser = argparse.ArgumentParser(description="Compile job descriptions into reusable JD profiles.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    compile_cmd = sub.add_parser("compile", help="Compile JDs into .jdp profiles")
+    compile_cmd.add_argument("jds", help="JD file, directory of JDs or glob pattern")
+    compile_cmd.add_argument("--out-dir", default=None,
+                             help="Where to write the profiles (default: next to each JD)")
+    compile_cmd.add_argument("--mode", choices=["all", "nouns_verbs"], default="all")
+    compile_cmd.add_argument("--normalize", choices=NORMALIZE_METHODS, default="none")
+    show = sub.add_parser("show", help="Print a profile's settings and top keywords")
+    show.add_argument("profile")
+    args = parser.parse_args(argv)
+
+    if args.command == "show":
+        try:
+            profile = load_jd_profile(args.profile)
+        except (OSError, ValueError) as e:
+            print(e)
+            return
+        print(f"{profile.source}: mode {profile.mode}, normalize {profile.normalize or 'none'}, "
+              f"{len(profile.job_word_counts)} keywords")
+        for word, count in profile.job_word_counts.most_common(15):
+            print(f"  {word:<20} {count:>5}")
+        return
+
+    jd_paths = [args.jds] if os.path.isfile(args.jds) else collect_resume_paths(args.jds)
+    if args.out_dir:
+        os.makedirs(args.out_dir, exist_ok=True)
+    readable, job_texts = [], []
+    for path in jd_paths:
+        job_text = read_file(path)
+        if not job_text:
+            print(f"Could not read {path}. Skipping.")
+            continue
+        readable.append(path)
+        job_texts.append(job_text)
+    try:
+        profiles = JDProfile.compile_many(job_texts, args.mode, args.normalize,
+                                          [os.path.basename(path) for path in readable])
+    except LookupError:
+        print("Missing NLTK data for this mode/normalization. Run: python main.py --download-nltk")
+        return
+    for path, profile in zip(readable, profiles):
+        stem = os.path.splitext(path)[0]
+        out_path = (os.path.join(args.out_dir, os.path.basename(stem)) if args.out_dir else stem) + PROFILE_EXTENSION
+        profile.save(out_path)
+    print(f"Compiled {len(profiles)} of {len(jd_paths)} job descriptions.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,391 @@
+import os
+import json
+import mmap
+import heapq
+import struct
+import bisect
+import argparse
+import collections
+
+from stopwords import STOP_WORDS
+from file_utils import read_file
+from text_utils import clean_text, extract_keywords, extract_nouns_verbs, match_percent_from_count
+from resume_result import KeywordVocab, ResumeResult
+
+# ========================
+# On-Disk Format
+# ========================
+#
+# An index is a directory:
+#   docs.json        - document table (id -> path/size/mtime), deleted ids, segment list
+#   seg_00000.idx    - immutable segments, one per build/update
+#
+# Segment layout (little-endian):
+#   header      8s magic, uint32 term count, uint32 reserved
+#   term table  one fixed-width entry per term, sorted by term bytes:
+#               uint64 term offset, uint32 term length,
+#               uint64 postings offset, uint32 postings length
+#   term blob   UTF-8 bytes of every term, back to back
+#   postings    (uint32 doc id, uint32 count) pairs, sorted by doc id
+#
+# Fixed-width entries let a query binary-search the term table straight
+# out of the mmap, so only the pages for the JD's keywords are touched.
+
+SEGMENT_MAGIC = b"RKMIDX01"
+HEADER = struct.Struct("<8sII")
+TERM_ENTRY = struct.Struct("<QIQI")
+POSTING = struct.Struct("<II")
+DOCS_FILE = "docs.json"
+
+def _write_atomic(path, data):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def write_segment(path, postings):
+    """
+    Writes a segment file from {term: [(doc_id, count), ...]}.
+    Posting lists must already be sorted by doc id.
+    """
+    terms = sorted(postings, key=lambda t: t.encode("utf-8"))
+    encoded = [t.encode("utf-8") for t in terms]
+    blob_start = HEADER.size + TERM_ENTRY.size * len(terms)
+    postings_start = blob_start + sum(len(b) for b in encoded)
+
+    table = bytearray()
+    term_offset = blob_start
+    posting_offset = postings_start
+    for term, raw in zip(terms, encoded):
+        table += TERM_ENTRY.pack(term_offset, len(raw), posting_offset, len(postings[term]))
+        term_offset += len(raw)
+        posting_offset += POSTING.size * len(postings[term])
+
+    body = bytearray(HEADER.pack(SEGMENT_MAGIC, len(terms), 0))
+    body += table
+    body += b"".join(encoded)
+    for term in terms:
+        for doc_id, count in postings[term]:
+            body += POSTING.pack(doc_id, count)
+    _write_atomic(path, bytes(body))
+
+class Segment:
+    """
+    Read-only, memory-mapped view of one segment file.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.num_terms, _ = HEADER.unpack_from(self._mm, 0)
+        if magic != SEGMENT_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a keyword index segment")
+
+    def _entry(self, i):
+        return TERM_ENTRY.unpack_from(self._mm, HEADER.size + TERM_ENTRY.size * i)
+
+    def _term_at(self, i):
+        term_offset, term_len, _, _ = self._entry(i)
+        return self._mm[term_offset:term_offset + term_len]
+
+    def postings(self, term):
+        """
+        Returns a (doc_ids, counts) pair of uint32 memoryviews for term,
+        or None if the term is not in this segment.
+        """
+        target = term.encode("utf-8")
+        lo, hi = 0, self.num_terms
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._term_at(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == self.num_terms or self._term_at(lo) != target:
+            return None
+        _, _, posting_offset, length = self._entry(lo)
+        view = memoryview(self._mm)[posting_offset:posting_offset + POSTING.size * length].cast("I")
+        return view[0::2], view[1::2]
+
+    def iter_terms(self):
+        """Yields (term, [(doc_id, count), ...]) for every term (used for compaction)."""
+        for i in range(self.num_terms):
+            term = self._term_at(i).decode("utf-8")
+            doc_ids, counts = self.postings(term)
+            yield term, list(zip(doc_ids, counts))
+
+    def close(self):
+        try:
+            self._mm.close()
+        except (BufferError, ValueError):
+            # A caller still holds a postings view; the map is released with it
+            pass
+        self._file.close()
+
+# ========================
+# Keyword Index
+# ========================
+
+class KeywordIndex:
+    """
+    Persistent inverted index: cleaned token -> resumes containing it, with counts.
+
+    Built once over a corpus and updated incrementally (each update writes a
+    new segment; replaced or removed resumes are tombstoned until compact()).
+    Queries read only the postings for the JD's keywords.
+    """
+    def __init__(self, index_dir):
+        self.index_dir = index_dir
+        os.makedirs(index_dir, exist_ok=True)
+        docs_path = os.path.join(index_dir, DOCS_FILE)
+        if os.path.exists(docs_path):
+            with open(docs_path, encoding="utf-8") as f:
+                state = json.load(f)
+        else:
+            state = {"next_id": 0, "next_segment": 0, "docs": {}, "deleted": [], "segments": []}
+        self.next_id = state["next_id"]
+        self.next_segment = state["next_segment"]
+        # doc id -> {"path", "size", "mtime"}
+        self.docs = {int(doc_id): info for doc_id, info in state["docs"].items()}
+        self.deleted = set(state["deleted"])
+        self.segment_names = list(state["segments"])
+        self.path_to_id = {info["path"]: doc_id for doc_id, info in self.docs.items()}
+        self.segments = [Segment(os.path.join(index_dir, name)) for name in self.segment_names]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        for segment in self.segments:
+            segment.close()
+        self.segments = []
+
+    def __len__(self):
+        return len(self.docs)
+
+    def _save_docs(self):
+        state = {
+            "next_id": self.next_id,
+            "next_segment": self.next_segment,
+            "docs": {str(doc_id): info for doc_id, info in self.docs.items()},
+            "deleted": sorted(self.deleted),
+            "segments": self.segment_names,
+        }
+        _write_atomic(os.path.join(self.index_dir, DOCS_FILE), json.dumps(state).encode("utf-8"))
+
+    def _add_segment(self, postings):
+        name = f"seg_{self.next_segment:05d}.idx"
+        self.next_segment += 1
+        write_segment(os.path.join(self.index_dir, name), postings)
+        self.segment_names.append(name)
+        self.segments.append(Segment(os.path.join(self.index_dir, name)))
+
+    def _tombstone(self, path):
+        doc_id = self.path_to_id.pop(path, None)
+        if doc_id is not None:
+            del self.docs[doc_id]
+            self.deleted.add(doc_id)
+
+    def add_documents(self, resume_paths):
+        """
+        Indexes new resumes and re-indexes ones whose size/mtime changed.
+        Unchanged resumes are skipped. Returns the number of resumes indexed.
+        """
+        postings = collections.defaultdict(list)
+        indexed = 0
+        for path in resume_paths:
+            stat = os.stat(path)
+            doc_id = self.path_to_id.get(path)
+            if doc_id is not None:
+                info = self.docs[doc_id]
+                if info["size"] == stat.st_size and info["mtime"] == stat.st_mtime:
+                    continue
+            resume_text = read_file(path)
+            if not resume_text:
+                print(f"Could not read {path}. Skipping.")
+                continue
+            self._tombstone(path)
+            doc_id = self.next_id
+            self.next_id += 1
+            self.docs[doc_id] = {"path": path, "size": stat.st_size, "mtime": stat.st_mtime}
+            self.path_to_id[path] = doc_id
+            for word, count in collections.Counter(clean_text(resume_text, STOP_WORDS)).items():
+                postings[word].append((doc_id, count))
+            indexed += 1
+        if postings:
+            self._add_segment(postings)
+        if indexed or postings:
+            self._save_docs()
+        return indexed
+
+    def remove_documents(self, resume_paths):
+        """
+        Drops resumes from the index (their postings are skipped until compact()).
+        """
+        for path in resume_paths:
+            self._tombstone(path)
+        self._save_docs()
+
+    def compact(self):
+        """
+        Merges all segments into one and purges postings of deleted resumes.
+        """
+        merged = collections.defaultdict(list)
+        for segment in self.segments:
+            for term, plist in segment.iter_terms():
+                merged[term].extend(p for p in plist if p[0] not in self.deleted)
+        old_names = self.segment_names
+        self.close()
+        self.segment_names = []
+        self.deleted = set()
+        postings = {term: plist for term, plist in merged.items() if plist}
+        if postings:
+            self._add_segment(postings)
+        self._save_docs()
+        for name in old_names:
+            os.remove(os.path.join(self.index_dir, name))
+
+    def postings(self, term):
+        """
+        Returns a list of (doc_ids, counts) views, one per segment containing term.
+        Deleted documents are still present; callers filter with self.deleted.
+        """
+        found = []
+        for segment in self.segments:
+            plist = segment.postings(term)
+            if plist is not None:
+                found.append(plist)
+        return found
+
+    def top_k(self, job_keywords, k=10, min_match_percent=0.0):
+        """
+        Ranks indexed resumes against the JD keywords.
+        Returns up to k ResumeResults, best first, like process_resumes.
+
+        Keywords are visited rarest first. Once the remaining keywords cannot
+        lift an unseen resume to min_match_percent (or into the current top k),
+        new candidates stop being admitted and later postings are only probed
+        for the surviving candidates.
+        """
+        job_keywords = set(job_keywords)
+        total = len(job_keywords)
+        if total == 0 or not self.docs:
+            return []
+
+        needed = 0
+        if min_match_percent > 0:
+            # Smallest match count whose percent reaches the threshold
+            needed = next((n for n in range(total + 1)
+                           if match_percent_from_count(n, total) >= min_match_percent), total + 1)
+            if needed > total:
+                return []
+
+        plists = {word: self.postings(word) for word in job_keywords}
+        order = sorted(job_keywords, key=lambda w: (sum(len(ids) for ids, _ in plists[w]), w))
+
+        candidates = {}  # doc id -> {keyword: count}
+        pruned = set(self.deleted)
+        admitting = True
+        for i, word in enumerate(order):
+            remaining = total - i
+            if admitting:
+                floor = needed
+                if len(candidates) >= k:
+                    floor = max(floor, heapq.nlargest(k, map(len, candidates.values()))[-1])
+                admitting = remaining >= max(floor, 1)
+            if admitting:
+                for doc_ids, counts in plists[word]:
+                    for doc_id, count in zip(doc_ids, counts):
+                        if doc_id not in pruned:
+                            candidates.setdefault(doc_id, {})[word] = count
+            else:
+                for doc_ids, counts in plists[word]:
+                    for doc_id, hits in candidates.items():
+                        pos = bisect.bisect_left(doc_ids, doc_id)
+                        if pos < len(doc_ids) and doc_ids[pos] == doc_id:
+                            hits[word] = counts[pos]
+
+            # Drop candidates that can no longer reach the floor
+            remaining -= 1
+            floor = needed
+            if len(candidates) > k:
+                floor = max(floor, heapq.nlargest(k, map(len, candidates.values()))[-1])
+            if floor:
+                for doc_id in [d for d, h in candidates.items() if len(h) + remaining < floor]:
+                    del candidates[doc_id]
+                    pruned.add(doc_id)
+
+        ranked = heapq.nsmallest(
+            k, candidates.items(),
+            key=lambda item: (-len(item[1]), self.docs[item[0]]["path"])
+        )
+        if len(ranked) < k and needed == 0:
+            # Resumes sharing no keyword still count as 0% matches
+            unmatched = (d for d in self.docs if d not in candidates)
+            ranked += [(d, {}) for d in heapq.nsmallest(
+                k - len(ranked), unmatched, key=lambda d: self.docs[d]["path"])]
+        vocab = KeywordVocab(job_keywords)
+        results = []
+        for doc_id, hits in ranked:
+            result = ResumeResult.from_counts(self.docs[doc_id]["path"], vocab, hits)
+            if result.match_percent < min_match_percent:
+                continue
+            results.append(result)
+        return results
+
+# ========================
+# Command-Line Interface
+# ========================
+
+def main(argv=None):
+    """
+    python keyword_index.py build INDEX_DIR RESUME_DIR_OR_GLOB
+    python keyword_index.py query INDEX_DIR --jd JOB_FILE [--mode all|nouns_verbs] [--top K] [--min-match PCT]
+    """
+    from batch_utils import collect_resume_paths
+
+    parser = argparse.ArgumentParser(description="Build or query a resume keyword index.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Create or incrementally update an index")
+    build.add_argument("index_dir")
+    build.add_argument("resumes", help="Directory of resumes or glob pattern")
+    build.add_argument("--compact", action="store_true", help="Merge segments after updating")
+    query = sub.add_parser("query", help="Rank indexed resumes against a job description")
+    query.add_argument("index_dir")
+    query.add_argument("--jd", required=True)
+    query.add_argument("--mode", choices=["all", "nouns_verbs"], default="all")
+    query.add_argument("--top", type=int, default=10)
+    query.add_argument("--min-match", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    with KeywordIndex(args.index_dir) as index:
+        if args.command == "build":
+            resume_paths = collect_resume_paths(args.resumes)
+            current = set(resume_paths)
+            gone = [p for p in index.path_to_id if p not in current]
+            if gone:
+                index.remove_documents(gone)
+            indexed = index.add_documents(resume_paths)
+            if args.compact:
+                index.compact()
+            print(f"Indexed {indexed} resumes ({len(gone)} removed). Index holds {len(index)} resumes.")
+        else:
+            job_text = read_file(args.jd)
+            if not job_text:
+                print("Could not read job description. Exiting.")
+                return
+            job_cleaned = clean_text(job_text, STOP_WORDS)
+            if args.mode == "nouns_verbs":
+                job_cleaned = extract_nouns_verbs(job_cleaned)
+            results = index.top_k(extract_keywords(job_cleaned), k=args.top, min_match_percent=args.min_match)
+            print(f"{'Resume File':<40} {'Match %':>8} {'#Matched':>10} {'#Missing':>10}")
+            print("-" * 72)
+            for r in results:
+                print(f"{r['resume_path']:<40} {r['match_percent']:>8.1f} {r['num_matched']:>10} {r['num_missing']:>10}")
+
+if __name__ == "__main__":
+    main()
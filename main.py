@@ -1,15 +1,14 @@
 import os
-import re
-import string
+import sys
+import time
+import argparse
 import collections
-import csv
-from PyPDF2 import PdfReader  # Install with: pip install PyPDF2
 
-import nltk
-# Download NLTK data if not present (POS tagger & tokenizer)
-nltk.download('punkt')
-nltk.download('averaged_perceptron_tagger')
-nltk.download('averaged_perceptron_tagger_eng')
+# NLTK data is no longer downloaded at import time; see ensure_nltk_resources
+# (or run: python main.py --download-nltk)
+from tagging_utils import ensure_nltk_resources, get_pos_tagger, NLTK_RESOURCES, LEMMATIZER_RESOURCES
+
+from normalize_utils import NORMALIZE_METHODS, normalize_words, get_normalizer
 
 from stopwords import STOP_WORDS
 
@@ -18,6 +17,8 @@ from file_utils import (
     save_results_txt,
     save_results_csv,
     save_summary_csv,
+    write_all_results_txt,
+    write_all_results_csv,
     prompt_filepath,
     prompt_resume_paths,
     prompt_save_format,
@@ -26,22 +27,45 @@ from file_utils import (
 from text_utils import (
     clean_text,
     extract_keywords,
-    match_keywords,
-    calculate_match_percent,
     extract_nouns_verbs,
 )
 
+from batch_utils import (
+    collect_resume_paths,
+    score_resumes_parallel,
+    score_records_parallel,
+    tokenize_resumes_parallel,
+    add_phrase_matches,
+    add_fuzzy_matches,
+)
+
+from corpus_utils import is_corpus_file, iter_corpus
+
+from corpus_manifest import CorpusManifest
+
+from jd_profile import is_profile_file, load_jd_profile
+
+from phrase_matcher import extract_phrases, parse_phrase_list
+
+from scoring_engine import ScoringSession
+
+from result_writers import StreamingResultWriter, STREAM_FORMATS
+
+from profiling_utils import get_profiler, configure_profiler
+
+from text_cache import get_text_cache
+
 from display_utils import (
+    configure_display,
+    paged_output,
     print_intro,
     print_single_resume_results,
     print_summary_table,
     print_keyword_matrix,
+    print_phrase_results,
+    print_fuzzy_results,
 )
 
-# Ensure output directory exists for saving results
-if not os.path.exists('output'):
-    os.makedirs('output')
-
 # Default resume samples if user doesn't specify
 DEFAULT_RESUMES = [
     "test_files/resume1.txt",
@@ -49,72 +73,165 @@ DEFAULT_RESUMES = [
     "test_files/resume3.txt"
 ]
 
+# ============================================
+# NLTK Data Check (no downloads unless asked)
+# ============================================
+def require_nltk_resources(interactive, resources=None):
+    """
+    Makes sure the POS tagger data (or the given resources) is installed
+    before nouns/verbs mode or lemma normalization runs.
+    Interactive runs ask before downloading; batch runs need --download-nltk.
+    """
+    missing = ensure_nltk_resources(resources=resources)
+    if missing and interactive:
+        answer = input(f"NLTK data not found ({', '.join(missing)}). Download now? (y/n): ").strip().lower()
+        if answer == 'y':
+            missing = ensure_nltk_resources(download=True, resources=resources)
+    if missing:
+        print(f"Missing NLTK data: {', '.join(missing)}. Run: python main.py --download-nltk")
+        exit()
+
 # ============================================
 # Step 1: Process the Job Description (JD)
 # ============================================
-def process_job_description(job_path):
+def process_job_description(job_path, mode=None, normalize=None):
     """
     Reads and processes the job description file.
-    Prompts for keyword extraction mode (all words or nouns/verbs).
+    Uses the given keyword extraction mode ('all' or 'nouns_verbs'),
+    or prompts for it when mode is None.
+    normalize ('stem' or 'lemma') reduces keywords to a common word form;
+    resumes must then be cleaned with the same setting.
     Returns: job_keywords (set), job_word_counts (Counter)
     """
-    job_text = read_file(job_path)
+    interactive = mode is None
+    prof = get_profiler()
+    with prof.stage("jd.read") as stage:
+        job_text = read_file(job_path)
+        stage.add_bytes(len(job_text or ""))
     if not job_text:
         print("Could not read job description. Exiting.")
         exit()
-    job_cleaned = clean_text(job_text, STOP_WORDS)
+    with prof.stage("jd.clean", len(job_text)):
+        job_cleaned = clean_text(job_text, STOP_WORDS)
 
     # Let user pick keyword extraction mode
-    while True:
+    while mode is None:
         print("\nKeyword extraction mode:")
         print("1. All words (default)")
         print("2. Only nouns/verbs (recommended for most jobs)")
-        mode = input("Choose 1 or 2 and press Enter: ").strip()
-        if mode in ("1", "2"):
-            break
-        print("Invalid input. Please enter 1 or 2.")
+        choice = input("Choose 1 or 2 and press Enter: ").strip()
+        if choice in ("1", "2"):
+            mode = "all" if choice == "1" else "nouns_verbs"
+        else:
+            print("Invalid input. Please enter 1 or 2.")
 
-    if mode == "2":
-        job_cleaned = extract_nouns_verbs(job_cleaned)
+    if mode == "nouns_verbs":
+        require_nltk_resources(interactive)
+        with prof.stage("jd.pos_tag"):
+            job_cleaned = extract_nouns_verbs(job_cleaned)
         print("(Extracting only nouns and verbs as keywords.)")
     else:
         print("(Using all cleaned words as keywords.)")
 
-    job_keywords = extract_keywords(job_cleaned)
-    job_word_counts = collections.Counter(job_cleaned)
+    if normalize in ("stem", "lemma"):
+        if normalize == "lemma":
+            require_nltk_resources(interactive, LEMMATIZER_RESOURCES)
+        with prof.stage("jd.normalize"):
+            job_cleaned = normalize_words(job_cleaned, normalize)
+        print(f"(Matching on word {'stems' if normalize == 'stem' else 'lemmas'}.)")
+
+    with prof.stage("jd.keywords"):
+        job_keywords = extract_keywords(job_cleaned)
+        job_word_counts = collections.Counter(job_cleaned)
     return job_keywords, job_word_counts
 
+def load_job_profile(args):
+    """
+    --jd PROFILE.jdp: loads a compiled JD profile (see jd_profile.py) in
+    place of processing the JD, and switches args.mode / args.normalize to
+    the profile's settings so resumes are cleaned to match.
+    Returns (job_keywords, job_word_counts), or None if it can't be used.
+    """
+    with get_profiler().stage("jd.load_profile"):
+        try:
+            profile = load_jd_profile(args.jd)
+        except (OSError, ValueError) as e:
+            print(e)
+            return None
+    args.mode, args.normalize = profile.mode, profile.normalize
+    if profile.normalize == "lemma":
+        require_nltk_resources(False, LEMMATIZER_RESOURCES)
+    print(f"(Using JD profile of {profile.source or args.jd}: mode {profile.mode}, "
+          f"normalize {profile.normalize or 'none'}.)")
+    return profile.job_keywords, profile.job_word_counts
+
+def resolve_job_phrases(spec, job_path):
+    """
+    Returns the JD phrases for phrase matching: extracted from the JD when
+    spec is 'auto', otherwise parsed from a comma-separated list or @file.
+    """
+    if spec == "auto":
+        with get_profiler().stage("jd.phrases"):
+            return extract_phrases(read_file(job_path) or "")
+    return parse_phrase_list(spec)
+
 # ============================================
 # Step 2: Process Each Resume
 # ============================================
-def process_resumes(resume_paths, job_keywords, job_word_counts):
+def process_resumes(resume_paths, job_keywords, job_word_counts, session=None, job_phrases=None,
+                    normalize=None, fuzzy=None):
     """
     Reads, cleans, and analyzes each resume.
     For each resume:
       - Finds matched/missing keywords
       - Counts keyword frequencies
       - Calculates match percentage
+    Pass the same ScoringSession across calls to score incrementally:
+    resumes already in the session are not re-read or re-cleaned, and a
+    new JD only applies its keyword delta.
+    With job_phrases, each result also gets phrase_matched / phrase_missing;
+    with fuzzy (max edit distance), fuzzy_matched.
+    normalize applies to a new session; a given session keeps its own setting.
     Returns: List of result dicts for each valid resume
     """
+    prof = get_profiler()
+    if session is None:
+        session = ScoringSession(normalize=normalize)
+    with prof.stage("session.set_job"):
+        session.set_job(job_keywords, job_word_counts)
     valid_results = []
     for resume_path in resume_paths:
         print(f"\nProcessing: {resume_path}")
-        resume_text = read_file(resume_path)
+        if resume_path in session and not job_phrases:
+            with prof.stage("resume.cached_result"):
+                result = session.result(resume_path)
+            if fuzzy:
+                with prof.stage("resume.fuzzy"):
+                    add_fuzzy_matches(result, session.word_counts(resume_path), fuzzy)
+            valid_results.append(result)
+            continue
+        # Phrase matching scans the raw text, so cached resumes are re-read (from the text cache)
+        with prof.stage("resume.read") as stage:
+            resume_text = read_file(resume_path)
+            stage.add_bytes(len(resume_text or ""))
         if not resume_text:
             print(f"Could not read {resume_path}. Skipping.")
             continue
-        resume_cleaned = clean_text(resume_text, STOP_WORDS)
-        matched, missing = match_keywords(job_keywords, resume_cleaned)
-        resume_counts = collections.Counter(resume_cleaned)
-        valid_results.append({
-            "resume_path": resume_path,
-            "resume_counts": resume_counts,
-            "match_percent": calculate_match_percent(matched, len(job_keywords)),
-            "num_matched": len(matched),
-            "num_missing": len(missing),
-            "matched": matched,
-            "missing": missing
-        })
+        if resume_path in session:
+            with prof.stage("resume.cached_result"):
+                result = session.result(resume_path)
+        else:
+            with prof.stage("resume.clean", len(resume_text)):
+                resume_counts = collections.Counter(session.analyzer.clean(resume_text))
+            with prof.stage("resume.match"):
+                result = session.add_resume(resume_path, resume_counts=resume_counts)
+        if job_phrases:
+            with prof.stage("resume.phrases", len(resume_text)):
+                add_phrase_matches(result, resume_text, job_phrases)
+        if fuzzy:
+            with prof.stage("resume.fuzzy"):
+                add_fuzzy_matches(result, session.word_counts(resume_path), fuzzy)
+        valid_results.append(result)
     return valid_results
 
 # ============================================
@@ -127,6 +244,7 @@ def save_single_result(result, job_word_counts):
     """
     save_choice = prompt_save_format()
     if save_choice in ("txt", "csv"):
+        os.makedirs("output", exist_ok=True)
         filename = input(f"Enter filename (e.g., output.{save_choice}): ").strip()
         if not filename.startswith("output/"):
             filename = os.path.join("output", filename)
@@ -141,10 +259,11 @@ def save_single_result(result, job_word_counts):
             if confirm != 'y':
                 print("Save cancelled.")
                 return
-        if save_choice == "txt":
-            save_results_txt(filename, result["match_percent"], result["matched"], result["missing"], job_word_counts)
-        else:
-            save_results_csv(filename, result["match_percent"], result["matched"], result["missing"], job_word_counts)
+        with get_profiler().stage("save.single"):
+            if save_choice == "txt":
+                save_results_txt(filename, result["match_percent"], result["matched"], result["missing"], job_word_counts)
+            else:
+                save_results_csv(filename, result["match_percent"], result["matched"], result["missing"], job_word_counts)
         print(f"Results saved to {filename}")
     else:
         print("Results not saved to file.")
@@ -152,14 +271,17 @@ def save_single_result(result, job_word_counts):
 # ============================================
 # Step 4: Save Results for Multiple Resumes
 # ============================================
-def save_all_results(valid_results, all_keywords, job_word_counts, header):
+def save_all_results(valid_results, all_keywords, job_word_counts, header, matrix=None):
     """
     Saves results for multiple resumes:
       - Summary table
       - Keyword comparison matrix
     Handles TXT and CSV formats, file name prompts, and overwrite confirmation.
+    matrix is an optional prebuilt KeywordMatrix over all_keywords.
     """
     save_choice = prompt_save_format()
+    if save_choice in ("txt", "csv"):
+        os.makedirs("output", exist_ok=True)
     if save_choice == "txt":
         filename = input("Enter filename (e.g., output.txt): ").strip()
         if not filename.startswith("output/"):
@@ -173,20 +295,8 @@ def save_all_results(valid_results, all_keywords, job_word_counts, header):
             if confirm != 'y':
                 print("Save cancelled.")
                 return
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write("=== SUMMARY ===\n")
-            f.write(f"{'Resume File':<28} {'Match %':>8} {'#Matched':>10} {'#Missing':>10}\n")
-            f.write("-" * 60 + "\n")
-            for r in valid_results:
-                f.write(f"{os.path.basename(r['resume_path']):<28} {r['match_percent']:>8.1f} {r['num_matched']:>10} {r['num_missing']:>10}\n")
-            f.write("\n=== KEYWORD COMPARISON ===\n")
-            f.write(" | ".join(f"{col:<15}" for col in header) + "\n")
-            f.write("-" * (18 * len(header)) + "\n")
-            for word in all_keywords:
-                row = [f"{word:<15}"]
-                for r in valid_results:
-                    row.append(f"{r['resume_counts'].get(word, 0):<15}")
-                f.write(" | ".join(row) + "\n")
+        with get_profiler().stage("save.all"):
+            write_all_results_txt(filename, valid_results, all_keywords, header, matrix)
         print(f"Results saved to {filename}")
     elif save_choice == "csv":
         filename = input("Enter filename (e.g., output.csv): ").strip()
@@ -201,64 +311,344 @@ def save_all_results(valid_results, all_keywords, job_word_counts, header):
             if confirm != 'y':
                 print("Save cancelled.")
                 return
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(["=== SUMMARY ==="])
-            writer.writerow(['Resume File', 'Match %', '#Matched', '#Missing'])
-            for r in valid_results:
-                writer.writerow([
-                    os.path.basename(r["resume_path"]),
-                    f"{r['match_percent']:.1f}",
-                    r["num_matched"],
-                    r["num_missing"]
-                ])
-            writer.writerow([])
-            writer.writerow(["=== KEYWORD COMPARISON ==="])
-            row_header = ["Keyword"] + [os.path.basename(r['resume_path']) for r in valid_results]
-            writer.writerow(row_header)
-            for word in all_keywords:
-                row = [word]
-                for r in valid_results:
-                    row.append(r['resume_counts'].get(word, 0))
-                writer.writerow(row)
+        with get_profiler().stage("save.all"):
+            write_all_results_csv(filename, valid_results, all_keywords, matrix)
         print(f"Results saved to {filename}")
     else:
         print("Results not saved to file.")
 
+# ============================================
+# Step 5: Headless Batch Mode
+# ============================================
+# Options that, given without --jd/--resumes/--output, apply to the interactive flow
+INTERACTIVE_OPTIONS = ("profile", "phrases", "fuzzy", "normalize", "top", "pager")
+
+def parse_batch_args(argv):
+    """
+    Parses command-line arguments for non-interactive batch runs.
+    """
+    parser = argparse.ArgumentParser(
+        description="Score a folder (or glob) of resumes against one job description."
+    )
+    parser.add_argument("--jd", help="Path to the job description (.txt or .pdf), or a JD profile "
+                                     "compiled with jd_profile.py (.jdp; its mode/normalize are used)")
+    parser.add_argument("--resumes",
+                        help="Directory of resumes, a glob pattern such as 'resumes/**/*.pdf', "
+                             "or a JSONL/CSV corpus file with one resume per record (optionally .gz)")
+    parser.add_argument("--text-field", default="text",
+                        help="Corpus files: JSON key / CSV column holding the resume text (default: text)")
+    parser.add_argument("--id-field", default=None,
+                        help="Corpus files: JSON key / CSV column used as the resume name "
+                             "(default: <file>:<line or row>)")
+    parser.add_argument("--mode", choices=["all", "nouns_verbs"], default="all",
+                        help="Keyword extraction mode (default: all)")
+    parser.add_argument("--output",
+                        help="Output file (.csv or .txt) with summary and keyword matrix; "
+                             "for streaming formats, the path prefix for the output files")
+    parser.add_argument("--format", choices=["report"] + list(STREAM_FORMATS), default="report",
+                        help="report (default): one TXT/CSV report written at the end. "
+                             "csv/parquet/arrow: stream <output>_summary.csv and "
+                             "<output>_matrix.<format> as each resume finishes (flat memory)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=16,
+                        help="Resumes handed to a worker per task (default: 16)")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Directory for the extracted-text cache, reused across runs")
+    parser.add_argument("--manifest", metavar="DIR", default=None,
+                        help="Keep a change manifest and cleaned-word cache for the resume folder in DIR: "
+                             "re-runs only read new or changed files, and an interrupted run resumes")
+    parser.add_argument("--checkpoint-every", type=int, default=200, metavar="N",
+                        help="With --manifest: save progress every N files read (default: 200)")
+    parser.add_argument("--watch", type=float, metavar="SECONDS", default=None,
+                        help="With --manifest: after the run, poll the resume folder every SECONDS "
+                             "and re-score when resumes are added, changed or removed (Ctrl+C stops)")
+    parser.add_argument("--download-nltk", action="store_true",
+                        help="Download the NLTK tagger data (needed for nouns_verbs) and exit "
+                             "unless a batch run is also requested")
+    parser.add_argument("--normalize", choices=NORMALIZE_METHODS, default=None,
+                        help="Match word forms: stem ('developed'/'developer' -> 'develop') or "
+                             "lemma (needs the wordnet data from --download-nltk). Default: none")
+    parser.add_argument("--phrases", metavar="SPEC", default=None,
+                        help="Also match skill phrases such as 'c++' or 'machine learning': "
+                             "'auto' extracts them from the JD, or give a comma-separated list "
+                             "or @file with one phrase per line (report format only)")
+    parser.add_argument("--fuzzy", type=int, nargs="?", const=2, default=None, metavar="EDITS",
+                        help="Also report near-miss spellings of missing JD keywords ('kubernets' for "
+                             "'kubernetes'), up to EDITS edits (default 2; keywords under 5 letters "
+                             "stay exact, under 9 allow 1). Report format only")
+    parser.add_argument("--top", type=int, default=None,
+                        help="Interactive flow: show only the N best resumes and N most frequent "
+                             "keywords in terminal tables (saved files stay complete; 0 = all)")
+    parser.add_argument("--pager", action="store_true", default=None,
+                        help="Interactive flow: show result tables through the system pager ($PAGER)")
+    parser.add_argument("--profile", metavar="REPORT.json", default=None,
+                        help="Write a per-stage timing report (JSON). On its own, "
+                             "profiles the interactive prompts instead of a batch run")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="With --profile, also record tracemalloc peaks per stage (slower)")
+    args = parser.parse_args(argv)
+    # --profile / --phrases / --fuzzy / --normalize / --top / --pager with no batch arguments apply to the interactive flow
+    args.interactive = (any(getattr(args, name) is not None for name in INTERACTIVE_OPTIONS)
+                        and not args.download_nltk
+                        and all(getattr(args, name) is None for name in ("jd", "resumes", "output")))
+    if not args.interactive and (not args.download_nltk or args.jd):
+        missing = [f"--{name}" for name in ("jd", "resumes", "output") if getattr(args, name) is None]
+        if missing:
+            parser.error(f"the following arguments are required: {', '.join(missing)}")
+    if args.phrases and args.format != "report":
+        parser.error("--phrases is only supported with --format report")
+    if args.fuzzy is not None and args.fuzzy < 1:
+        parser.error("--fuzzy needs at least 1 edit")
+    if args.fuzzy and args.format != "report":
+        parser.error("--fuzzy is only supported with --format report")
+    if args.phrases == "auto" and args.jd and is_profile_file(args.jd):
+        parser.error("--phrases auto needs the JD text; give a phrase list with a .jdp profile")
+    if args.watch is not None and not args.manifest:
+        parser.error("--watch requires --manifest")
+    if args.manifest and (args.phrases or (args.resumes and is_corpus_file(args.resumes))):
+        parser.error("--manifest works on resume folders/globs and without --phrases")
+    return args
+
+def run_batch(args):
+    """
+    Runs a full batch: processes the JD, scores every resume in parallel,
+    and writes the summary + keyword matrix to args.output.
+    Returns the list of result dicts (same shape as process_resumes).
+    """
+    if args.download_nltk:
+        missing = ensure_nltk_resources(download=True, resources={**NLTK_RESOURCES, **LEMMATIZER_RESOURCES})
+        print(f"Could not download NLTK data: {', '.join(missing)}" if missing else "NLTK data is installed.")
+        if args.jd is None:
+            return []
+
+    prof = get_profiler()
+    if is_corpus_file(args.resumes):
+        # Records are streamed from the corpus file while they are scored
+        try:
+            source = iter_corpus(args.resumes, args.text_field, args.id_field)
+        except ValueError as e:
+            print(e)
+            return []
+    else:
+        with prof.stage("batch.collect"):
+            source = collect_resume_paths(args.resumes)
+        if not source:
+            print(f"No .txt or .pdf resumes found for: {args.resumes}")
+            return []
+
+    if is_profile_file(args.jd):
+        job = load_job_profile(args)
+        if job is None:
+            return []
+        job_keywords, job_word_counts = job
+    else:
+        job_keywords, job_word_counts = process_job_description(args.jd, args.mode, args.normalize)
+    job_phrases = resolve_job_phrases(args.phrases, args.jd) if args.phrases else None
+    print(f"Scoring {len(source)} resumes..." if isinstance(source, list)
+          else f"Scoring resumes from {args.resumes}...")
+
+    if args.format != "report":
+        run_streaming_batch(args, source, job_keywords, job_word_counts)
+        return []
+
+    valid_results = []
+    seen = 0
+    # Workers run in other processes, so this is the wall time of the whole pool
+    with prof.stage("batch.score"):
+        for resume_path, result in score_source(args, source, job_keywords, job_phrases):
+            seen += 1
+            if result is None:
+                print(f"Could not read {resume_path}. Skipping.")
+                continue
+            valid_results.append(result)
+
+    if not valid_results:
+        print("No valid resumes processed.")
+        return valid_results
+
+    all_keywords = sorted(job_keywords, key=lambda w: (-job_word_counts[w], w))
+    header = ["Keyword"] + [os.path.basename(r['resume_path']) for r in valid_results]
+    output_dir = os.path.dirname(args.output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with prof.stage("save.all"):
+        if args.output.lower().endswith(".txt"):
+            write_all_results_txt(args.output, valid_results, all_keywords, header)
+        else:
+            write_all_results_csv(args.output, valid_results, all_keywords)
+    print(f"Scored {len(valid_results)} of {seen} resumes. Results saved to {args.output}")
+    return valid_results
+
+def score_source(args, source, job_keywords, job_phrases=None):
+    """
+    Scores resumes in the process pool. source is a list of resume paths, or
+    an iterator of (record id, text) corpus records, consumed lazily.
+    Yields (resume path or record id, result) pairs in input order.
+    """
+    if args.manifest:
+        return score_with_manifest(args, source, job_keywords)
+    if isinstance(source, list):
+        return score_resumes_parallel(
+            source, job_keywords, workers=args.workers, chunksize=args.chunksize,
+            cache_dir=args.cache_dir, job_phrases=job_phrases, normalize=args.normalize, fuzzy=args.fuzzy,
+        )
+    return score_records_parallel(
+        source, job_keywords, workers=args.workers, chunksize=args.chunksize,
+        job_phrases=job_phrases, normalize=args.normalize, fuzzy=args.fuzzy,
+    )
+
+def score_with_manifest(args, resume_paths, job_keywords):
+    """
+    --manifest: reads only new or changed resumes (in the process pool),
+    then scores every resume from its cached words.
+    """
+    manifest = CorpusManifest(args.manifest, args.normalize)
+    report = manifest.sync(
+        resume_paths,
+        lambda stale: tokenize_resumes_parallel(
+            stale, workers=args.workers, chunksize=args.chunksize,
+            cache_dir=args.cache_dir, normalize=args.normalize,
+        ),
+        checkpoint_every=args.checkpoint_every,
+    )
+    print(f"Read {len(report['read'])} new or changed resumes "
+          f"({report['unchanged']} unchanged, {len(report['removed'])} removed).")
+    return manifest.score(resume_paths, job_keywords, args.fuzzy)
+
+def watch_corpus(args):
+    """
+    --watch: polls the resume folder every args.watch seconds and re-runs
+    the batch (reading only what changed) whenever resumes are added,
+    changed or removed, rewriting args.output. Stops on Ctrl+C.
+    """
+    print(f"\nWatching {args.resumes} every {args.watch:g}s (Ctrl+C to stop)...")
+    try:
+        while True:
+            time.sleep(args.watch)
+            stale, removed = CorpusManifest(args.manifest, args.normalize).plan(
+                collect_resume_paths(args.resumes))
+            if stale or removed:
+                print(f"\n{len(stale)} new or changed, {len(removed)} removed resumes.")
+                run_batch(args)
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+
+def run_streaming_batch(args, source, job_keywords, job_word_counts):
+    """
+    Scores resumes and writes each one's summary and matrix rows as soon as
+    it finishes, keeping only the current result in memory.
+    """
+    all_keywords = sorted(job_keywords, key=lambda w: (-job_word_counts[w], w))
+    prefix = os.path.splitext(args.output)[0]
+    seen = 0
+    with get_profiler().stage("batch.score_and_write"), \
+            StreamingResultWriter(prefix, all_keywords, args.format) as writer:
+        for resume_path, result in score_source(args, source, job_keywords):
+            seen += 1
+            if result is None:
+                print(f"Could not read {resume_path}. Skipping.")
+                continue
+            writer.write(result)
+    print(f"Scored {writer.count} of {seen} resumes. "
+          f"Results saved to {writer.summary_path} and {writer.matrix_path}")
+
 # ============================================
 # Main CLI Program Flow
 # ============================================
-def main():
+def main(phrases=None, normalize=None, fuzzy=None):
     """
     Main program function:
       - Prints intro
       - Prompts for job description and resume(s)
       - Runs all analysis and outputs results to terminal and files
+    phrases is an optional --phrases spec ('auto', a comma-separated list or @file);
+    normalize is an optional --normalize method ('stem' or 'lemma');
+    fuzzy is an optional --fuzzy edit bound.
     """
     print_intro()
     job_path = prompt_filepath("Enter path to the job description (.txt or .pdf)", "test_files/job1.txt")
     #asking user to input paths for one or more resumes
     resume_paths = prompt_resume_paths()
     
-    #job_keywords - list of words to be compared. stop words are removed. if nouns/verbs, only nouns/verbs
-    #job_word_counts - how often each word appears in the job description
-    job_keywords, job_word_counts = process_job_description(job_path)
+    #session - keeps each resume's cleaned words so later JDs are scored incrementally
+    session = ScoringSession(normalize=normalize)
+    while True:
+        #job_keywords - list of words to be compared. stop words are removed. if nouns/verbs, only nouns/verbs
+        #job_word_counts - how often each word appears in the job description
+        job_keywords, job_word_counts = process_job_description(job_path, normalize=normalize)
 
-    #process_resumes - recleans the text, matches keywords, calculates match %, stores information 
-    valid_results = process_resumes(resume_paths, job_keywords, job_word_counts)
+        #process_resumes - cleans new resumes, matches keywords, calculates match %, stores information
+        job_phrases = resolve_job_phrases(phrases, job_path) if phrases else None
+        valid_results = process_resumes(resume_paths, job_keywords, job_word_counts, session, job_phrases,
+                                        fuzzy=fuzzy)
 
-    if not valid_results:
-        print("No valid resumes processed. Exiting.")
-        return
+        if not valid_results:
+            print("No valid resumes processed. Exiting.")
+            return
 
-    if len(valid_results) == 1:
-        print_single_resume_results(valid_results[0], job_word_counts)
-        save_single_result(valid_results[0], job_word_counts)
-    else:
-        print_summary_table(valid_results)
+        prof = get_profiler()
         all_keywords = sorted(job_keywords, key=lambda w: (-job_word_counts[w], w))
-        header = print_keyword_matrix(all_keywords, valid_results)
-        save_all_results(valid_results, all_keywords, job_word_counts, header)
+        if len(valid_results) == 1:
+            with prof.stage("display"), paged_output():
+                print_single_resume_results(valid_results[0], job_word_counts, all_keywords)
+                if job_phrases:
+                    print_phrase_results(valid_results)
+                if fuzzy:
+                    print_fuzzy_results(valid_results)
+            save_single_result(valid_results[0], job_word_counts)
+        else:
+            from matrix_utils import build_keyword_matrix  # NumPy loads only when a matrix is built
+            with prof.stage("matrix.build"):
+                matrix = build_keyword_matrix(all_keywords, [r["resume_counts"] for r in valid_results])
+            with prof.stage("display"), paged_output():
+                print_summary_table(valid_results)
+                header = print_keyword_matrix(all_keywords, valid_results, matrix)
+                if job_phrases:
+                    print_phrase_results(valid_results)
+                if fuzzy:
+                    print_fuzzy_results(valid_results)
+            save_all_results(valid_results, all_keywords, job_word_counts, header, matrix)
+
+        #optionally re-score the same resumes against another JD (only the keyword delta is applied)
+        another = input("\nCompare these resumes against another job description? (y/n): ").strip().lower()
+        if another != 'y':
+            break
+        job_path = prompt_filepath("Enter path to the job description (.txt or .pdf)")
+
+def write_profile_report(filename):
+    """Writes the profiler's per-stage report plus cache statistics to a JSON file."""
+    output_dir = os.path.dirname(filename)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    caches = {
+        "text": get_text_cache().stats(),
+        "pos_tagger": get_pos_tagger().stats(),
+    }
+    for method in ("stem", "lemma"):
+        normalizer = get_normalizer(method)
+        if normalizer.stats()["misses"]:
+            caches[f"normalizer_{method}"] = normalizer.stats()
+    get_profiler().write_json(filename, caches=caches)
+    print(f"Profile report saved to {filename}")
 
 if __name__ == "__main__":
-    main()
+    # Any command-line arguments switch to headless batch mode
+    # (except --profile / --phrases / --fuzzy / --normalize / --top / --pager on their own, which apply to the interactive flow)
+    if len(sys.argv) > 1:
+        args = parse_batch_args(sys.argv[1:])
+        configure_display(top=args.top, pager=bool(args.pager))
+        if args.profile:
+            configure_profiler(enabled=True, trace_memory=args.profile_memory)
+        try:
+            if args.interactive:
+                main(args.phrases, args.normalize, args.fuzzy)
+            else:
+                run_batch(args)
+                if args.watch is not None:
+                    watch_corpus(args)
+        finally:
+            if args.profile:
+                write_profile_report(args.profile)
+    else:
+        main()
@@ -0,0 +1,181 @@
+import numpy as np
+
+# Above this many cells, build_keyword_matrix defaults to sparse (CSR) storage
+DENSE_CELL_LIMIT = 10_000_000
+
+# ========================
+# Resume x Keyword Count Matrix
+# ========================
+
+class KeywordMatrix:
+    """
+    Count matrix with one row per resume and one column per JD keyword.
+
+    Keywords are mapped to integer column ids once (keyword_ids). Storage is
+    either a dense int32 array or CSR arrays (indptr, indices, data) holding
+    only non-zero counts. Per-resume and per-keyword statistics are computed
+    with vectorized NumPy operations in both layouts.
+    """
+    def __init__(self, keywords, num_rows, dense=None, csr=None):
+        self.keywords = list(keywords)
+        self.keyword_ids = {word: i for i, word in enumerate(self.keywords)}
+        self.num_rows = num_rows
+        self._dense = dense
+        self._csr = csr  # (indptr, indices, data)
+
+    @property
+    def is_sparse(self):
+        return self._csr is not None
+
+    @property
+    def shape(self):
+        return self.num_rows, len(self.keywords)
+
+    def to_dense(self):
+        """Returns the counts as a dense (resumes x keywords) int32 array."""
+        if self._dense is not None:
+            return self._dense
+        indptr, indices, data = self._csr
+        dense = np.zeros(self.shape, dtype=np.int32)
+        rows = np.repeat(np.arange(self.num_rows), np.diff(indptr))
+        dense[rows, indices] = data
+        return dense
+
+    def row(self, i):
+        """Returns the keyword counts of resume i as a dense 1-D array."""
+        if self._dense is not None:
+            return self._dense[i]
+        indptr, indices, data = self._csr
+        out = np.zeros(len(self.keywords), dtype=np.int32)
+        out[indices[indptr[i]:indptr[i + 1]]] = data[indptr[i]:indptr[i + 1]]
+        return out
+
+    def block(self, rows, columns):
+        """
+        Returns a dense (len(rows) x len(columns)) int32 copy of the counts for
+        the given resume rows and keyword columns (index lists or ranges),
+        without densifying the rest of the matrix.
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        columns = np.asarray(columns, dtype=np.intp)
+        if self._dense is not None:
+            return self._dense[np.ix_(rows, columns)]
+        out = np.zeros((len(rows), len(columns)), dtype=np.int32)
+        for k, i in enumerate(rows):
+            out[k] = self.row(i)[columns]
+        return out
+
+    def get(self, i, keyword):
+        """Count of keyword in resume i (0 if absent or not a JD keyword)."""
+        j = self.keyword_ids.get(keyword)
+        return 0 if j is None else int(self.row(i)[j])
+
+    def rows_by_keyword(self):
+        """
+        Yields one list of per-resume counts for each keyword, in keyword
+        order (the layout of the printed/saved comparison matrix). A CSR
+        matrix is read one keyword column at a time, never densified.
+        """
+        if self._dense is not None:
+            yield from self._dense.T.tolist()
+            return
+        indptr, indices, data = self._csr
+        # Regroup the non-zero counts by keyword (CSR -> CSC) once
+        order = np.argsort(indices, kind="stable")
+        rows = np.repeat(np.arange(self.num_rows), np.diff(indptr))[order]
+        counts = data[order]
+        colptr = np.zeros(len(self.keywords) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(indices, minlength=len(self.keywords)), out=colptr[1:])
+        for j in range(len(self.keywords)):
+            column = np.zeros(self.num_rows, dtype=np.int32)
+            column[rows[colptr[j]:colptr[j + 1]]] = counts[colptr[j]:colptr[j + 1]]
+            yield column.tolist()
+
+    # ---------- vectorized statistics ----------
+
+    def num_matched(self):
+        """Number of JD keywords present in each resume."""
+        if self._dense is not None:
+            return np.count_nonzero(self._dense, axis=1)
+        return np.diff(self._csr[0])
+
+    def num_missing(self):
+        """Number of JD keywords absent from each resume."""
+        return len(self.keywords) - self.num_matched()
+
+    def match_percent(self):
+        """
+        Match percent per resume (float64), identical to calculate_match_percent.
+        """
+        total = len(self.keywords)
+        if total == 0:
+            return np.zeros(self.num_rows)
+        return 100 * self.num_matched() / total
+
+    def matched_keywords(self, i):
+        """Set of JD keywords present in resume i."""
+        return {self.keywords[j] for j in np.flatnonzero(self.row(i))}
+
+    def missing_keywords(self, i):
+        """Set of JD keywords absent from resume i."""
+        return {self.keywords[j] for j in np.flatnonzero(self.row(i) == 0)}
+
+    def resumes_missing(self):
+        """Number of resumes missing each keyword (array aligned with keywords)."""
+        if self._dense is not None:
+            present = np.count_nonzero(self._dense, axis=0)
+        else:
+            present = np.bincount(self._csr[1], minlength=len(self.keywords))
+        return self.num_rows - present
+
+    def top_gaps(self, job_word_counts, n=8):
+        """
+        Keywords missing from the most resumes, ties broken by JD frequency
+        then alphabetically. Returns [(keyword, #resumes without it), ...].
+        """
+        missing = self.resumes_missing()
+        candidates = np.flatnonzero(missing > 0)
+        if candidates.size == 0:
+            return []
+        freqs = np.array([job_word_counts[self.keywords[j]] for j in candidates])
+        names = np.array([self.keywords[j] for j in candidates])
+        # lexsort uses the last key as primary
+        order = np.lexsort((names, -freqs, -missing[candidates]))[:n]
+        return [(self.keywords[candidates[k]], int(missing[candidates[k]])) for k in order]
+
+def build_keyword_matrix(keywords, resume_counts_list, sparse=None):
+    """
+    Builds a KeywordMatrix from per-resume count mappings (Counter or dict),
+    filling each row in a single pass over whichever is smaller: the resume's
+    vocabulary or the keyword list.
+    sparse=None picks CSR storage automatically for very large matrices.
+    """
+    keywords = list(keywords)
+    keyword_ids = {word: i for i, word in enumerate(keywords)}
+    num_rows = len(resume_counts_list)
+    if sparse is None:
+        sparse = num_rows * len(keywords) > DENSE_CELL_LIMIT
+
+    row_ids = []
+    row_counts = []
+    for counts in resume_counts_list:
+        if len(counts) < len(keywords):
+            pairs = [(keyword_ids[w], c) for w, c in counts.items() if c and w in keyword_ids]
+        else:
+            get = counts.get
+            pairs = [(j, c) for j, c in ((j, get(w, 0)) for j, w in enumerate(keywords)) if c]
+        pairs.sort()
+        row_ids.append(np.fromiter((j for j, _ in pairs), dtype=np.int32, count=len(pairs)))
+        row_counts.append(np.fromiter((c for _, c in pairs), dtype=np.int32, count=len(pairs)))
+
+    indptr = np.zeros(num_rows + 1, dtype=np.int64)
+    np.cumsum([len(ids) for ids in row_ids], out=indptr[1:])
+    indices = np.concatenate(row_ids) if row_ids else np.zeros(0, dtype=np.int32)
+    data = np.concatenate(row_counts) if row_counts else np.zeros(0, dtype=np.int32)
+
+    if sparse:
+        return KeywordMatrix(keywords, num_rows, csr=(indptr, indices, data))
+    dense = np.zeros((num_rows, len(keywords)), dtype=np.int32)
+    rows = np.repeat(np.arange(num_rows), np.diff(indptr))
+    dense[rows, indices] = data
+    return KeywordMatrix(keywords, num_rows, dense=dense)
@@ -0,0 +1,118 @@
+import functools
+import threading
+import collections
+
+# ========================
+# Token Normalization (optional stage after clean_text)
+# ========================
+#
+# "develop", "developed", "developing" and "developer" are different
+# keywords to match_keywords. Normalizing every cleaned token to a common
+# form before extract_keywords / match_keywords lets them match:
+#   stem  - NLTK Porter stemmer (no data download; aggressive: all four -> "develop")
+#   lemma - NLTK WordNet lemmatizer, verb then noun form (readable words;
+#           needs the 'wordnet' data: python main.py --download-nltk)
+#
+# Stemming a word costs tens of microseconds, but token frequencies are
+# heavily skewed, so each normalizer memoizes per token in a bounded LRU
+# and repeated words are normalized once per process.
+
+NORMALIZE_METHODS = ("none", "stem", "lemma")
+
+class TokenNormalizer:
+    """
+    Maps cleaned tokens to their stem or lemma through an LRU-bounded
+    per-token memo (functools.lru_cache, so lookups stay in C).
+    NLTK is imported when the first token is normalized.
+    """
+    def __init__(self, method="stem", cache_size=100_000):
+        if method not in ("stem", "lemma"):
+            raise ValueError(f"method must be 'stem' or 'lemma', got {method!r}")
+        self.method = method
+        self.cache_size = cache_size
+        self._impl = None
+        self._lock = threading.Lock()
+        self.normalize = functools.lru_cache(maxsize=cache_size)(self._normalize_uncached)
+
+    def _load(self):
+        with self._lock:
+            if self._impl is None:
+                if self.method == "stem":
+                    from nltk.stem import PorterStemmer
+                    self._impl = PorterStemmer().stem
+                else:
+                    from nltk.stem import WordNetLemmatizer
+                    lemmatize = WordNetLemmatizer().lemmatize
+                    self._impl = lambda word: lemmatize(lemmatize(word, "v"), "n")
+        return self._impl
+
+    def _normalize_uncached(self, word):
+        return (self._impl or self._load())(word)
+
+    def normalize_many(self, words):
+        """Normalizes a token list. Returns a new list in the same order."""
+        return list(map(self.normalize, words))
+
+    def normalize_counts(self, counts):
+        """
+        Normalizes the keys of a word-count mapping, summing the counts of
+        words that share a normal form. Returns a Counter.
+        """
+        normalize = self.normalize
+        merged = collections.Counter()
+        for word, count in counts.items():
+            merged[normalize(word)] += count
+        return merged
+
+    def stats(self):
+        """Returns memo hit/miss counters and current size."""
+        info = self.normalize.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            "method": self.method,
+            "hits": info.hits,
+            "misses": info.misses,
+            "hit_rate": info.hits / lookups if lookups else 0.0,
+            "entries": info.currsize,
+            "cache_size": info.maxsize,
+        }
+
+    def clear(self):
+        self.normalize.cache_clear()
+
+# ========================
+# Shared Process-Wide Normalizers
+# ========================
+
+_normalizers = {}
+_normalizers_lock = threading.Lock()
+
+def get_normalizer(method):
+    """
+    Returns the process-wide TokenNormalizer for 'stem' or 'lemma'
+    (so the memo is shared by every caller), or None for 'none'/None.
+    """
+    if method in (None, "none"):
+        return None
+    normalizer = _normalizers.get(method)
+    if normalizer is None:
+        with _normalizers_lock:
+            normalizer = _normalizers.setdefault(method, TokenNormalizer(method))
+    return normalizer
+
+def configure_normalizer(method, cache_size=100_000):
+    """
+    Replaces the process-wide normalizer for a method with one using the
+    given memo size and returns it.
+    """
+    with _normalizers_lock:
+        _normalizers[method] = TokenNormalizer(method, cache_size)
+        return _normalizers[method]
+
+def normalize_words(words, method):
+    """
+    Normalizes cleaned words with the given method ('none', 'stem' or 'lemma').
+    Returns the words unchanged for 'none'.
+    """
+    normalizer = get_normalizer(method)
+    return words if normalizer is None else normalizer.normalize_many(words)
@@ -0,0 +1,317 @@
+import os
+import sys
+import time
+import threading
+from io import BytesIO
+
+# ========================
+# Settings
+# ========================
+
+# Documents with at least this many pages are split across worker processes.
+PARALLEL_MIN_PAGES = 24
+
+# Worker processes for large PDFs (None = CPU count, 1 = always sequential).
+_pdf_workers = None
+_pdf_pool = None
+
+# Per-document budgets (configure_pdf_limits). With isolate on, each PDF is
+# extracted in a separate worker process that is killed when the document
+# overruns its timeout or memory allowance, so one malformed file can't
+# stall or crash the caller. The page and character caps stop extraction
+# early (the text is cut short, not rejected). 0 turns a limit off.
+_pdf_limits = {
+    "isolate": True,
+    "timeout": 30.0,        # seconds per document
+    "max_memory_mb": 1024,  # address space a worker may add while extracting
+    "max_pages": 200,
+    "max_chars": 2_000_000,
+}
+
+class PdfExtractionError(Exception):
+    """Raised when a PDF can't be extracted; the message is the reason."""
+
+def configure_pdf_limits(isolate=None, timeout=None, max_memory_mb=None, max_pages=None, max_chars=None):
+    """
+    Updates the per-document PDF budgets (None keeps the current value,
+    0 turns a limit off). isolate=False extracts in-process: the caps
+    still apply, but the timeout and memory limit can't be enforced.
+    """
+    updates = {"isolate": isolate, "timeout": timeout, "max_memory_mb": max_memory_mb,
+               "max_pages": max_pages, "max_chars": max_chars}
+    _pdf_limits.update({name: value for name, value in updates.items() if value is not None})
+    _close_isolated_workers()  # started with the old memory limit
+
+def set_pdf_workers(workers):
+    """
+    Sets how many processes large PDFs are spread over.
+    Use 1 inside processes that are already pool workers (e.g. batch mode)
+    to avoid nested pools.
+    """
+    global _pdf_workers, _pdf_pool
+    _pdf_workers = workers
+    if _pdf_pool is not None:
+        _pdf_pool.shutdown(wait=False)
+        _pdf_pool = None
+
+def _mp_context():
+    # PDFs are extracted from threads (the Streamlit server, concurrent
+    # uploads), and forking a multi-threaded process can deadlock the child
+    # on a lock another thread held. Pool workers come from a single-threaded
+    # fork server instead (spawn where there is none, e.g. Windows). Both
+    # re-import the caller's __main__, which must then be guarded.
+    import multiprocessing
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+def _get_pdf_pool():
+    # Created on first use and reused for every large document
+    global _pdf_pool
+    if _pdf_pool is None:
+        from concurrent.futures import ProcessPoolExecutor
+        _pdf_pool = ProcessPoolExecutor(max_workers=_pdf_workers, mp_context=_mp_context())
+    return _pdf_pool
+
+def _open_reader(source):
+    # Imported here so importing file_utils doesn't pay for PyPDF2
+    from PyPDF2 import PdfReader  # Install with: pip install PyPDF2
+    # PdfReader takes a path or a stream; BytesIO(bytes) shares the buffer, no copy
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return PdfReader(BytesIO(source))
+    return PdfReader(source)
+
+# ========================
+# Whole-Document Extraction
+# ========================
+
+def _page_texts(reader, start, stop, max_pages, max_chars):
+    num_pages = len(reader.pages)
+    if max_pages:
+        num_pages = min(num_pages, max_pages)
+    stop = num_pages if stop is None else min(stop, num_pages)
+    texts = []
+    chars = 0
+    for i in range(start, stop):
+        if max_chars and chars >= max_chars:
+            break
+        text = reader.pages[i].extract_text() or ""
+        texts.append(text)
+        chars += len(text)
+    return num_pages, texts
+
+def _extract_pages(source, start, stop, max_pages, max_chars):
+    """
+    Extracts pages [start, stop) (stop None = to the end) without going
+    past max_pages, and stops once max_chars characters are collected.
+    Returns (page count after the page cap, [page texts]).
+    """
+    return _page_texts(_open_reader(source), start, stop, max_pages, max_chars)
+
+def _join_capped(texts, separator, max_chars):
+    text = separator.join(texts)
+    return text[:max_chars] if max_chars else text
+
+def extract_pdf_text(source, separator=""):
+    """
+    Extracts text from a PDF (raw bytes or file path), joining pages with
+    separator in a single join. Large documents (PARALLEL_MIN_PAGES or more)
+    are split into contiguous page ranges extracted in worker processes;
+    page order and output are identical to the sequential path.
+    Extraction runs within the configure_pdf_limits budgets; a document
+    that can't be extracted raises PdfExtractionError with the reason.
+    """
+    if _pdf_limits["isolate"]:
+        if not isinstance(source, (bytes, bytearray, memoryview)):
+            with open(source, "rb") as f:
+                source = f.read()
+        return _extract_isolated(bytes(source), separator)
+    try:
+        return _extract_in_process(source, separator)
+    except Exception as e:
+        raise PdfExtractionError(f"unreadable PDF ({type(e).__name__}: {e})") from e
+
+def _extract_in_process(source, separator):
+    max_pages, max_chars = _pdf_limits["max_pages"], _pdf_limits["max_chars"]
+    reader = _open_reader(source)
+    num_pages = min(len(reader.pages), max_pages) if max_pages else len(reader.pages)
+    workers = _pdf_workers or os.cpu_count() or 1
+    if num_pages < PARALLEL_MIN_PAGES or workers == 1:
+        return _join_capped(_page_texts(reader, 0, None, max_pages, max_chars)[1], separator, max_chars)
+
+    step = -(-num_pages // workers)  # ceiling division
+    if isinstance(source, memoryview):
+        source = source.tobytes()
+    pool = _get_pdf_pool()
+    futures = [
+        pool.submit(_extract_pages, source, start, min(start + step, num_pages), max_pages, max_chars)
+        for start in range(0, num_pages, step)
+    ]
+    return _join_capped([text for future in futures for text in future.result()[1]], separator, max_chars)
+
+# ========================
+# Isolated Extraction Workers
+# ========================
+#
+# Each worker is a process that takes _extract_pages tasks over a pipe.
+# Idle workers are kept for reuse; a worker whose task overruns the
+# document's deadline is killed and replaced on the next request.
+#
+# On POSIX a worker is a fresh interpreter (subprocess) talking over a
+# socket pair, not a fork: PDFs are extracted from threads (the Streamlit
+# server, concurrent uploads), and forking a multi-threaded process can
+# deadlock the child on a lock another thread held. Unlike multiprocessing's
+# spawn/forkserver it doesn't re-run the caller's __main__ either, which
+# Streamlit scripts can't guard. Elsewhere workers use the spawn context.
+
+_WORKER_BOOTSTRAP = (
+    "import sys; sys.path.insert(0, sys.argv[1]); import pdf_utils; "
+    "pdf_utils._isolated_entry(int(sys.argv[2]), int(sys.argv[3]))"
+)
+
+_idle_workers = []
+_workers_lock = threading.Lock()
+
+def _apply_memory_limit(max_memory_mb):
+    # RLIMIT_AS covers the address space inherited from the parent too, so
+    # the allowance goes on top of what is already mapped
+    try:
+        import resource
+        with open("/proc/self/statm") as f:
+            mapped = int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        limit = mapped + max_memory_mb * 1024 * 1024
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    except (ImportError, OSError, ValueError):
+        pass  # Not available on this platform; the timeout still applies
+
+def _isolated_main(conn, max_memory_mb):
+    if max_memory_mb:
+        _apply_memory_limit(max_memory_mb)
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            # Sending pickles the whole reply first, so it is covered as well
+            conn.send(("ok", _extract_pages(*task)))
+        except MemoryError:
+            # Exit after replying; the parent starts a fresh worker
+            conn.send(("fatal", f"exceeded the {max_memory_mb} MB memory limit"))
+            return
+        except Exception as e:
+            conn.send(("error", f"unreadable PDF ({type(e).__name__}: {e})"))
+
+def _isolated_entry(fd, max_memory_mb):
+    from multiprocessing.connection import Connection
+    _isolated_main(Connection(fd), max_memory_mb)
+
+class _IsolatedWorker:
+    def __init__(self, max_memory_mb):
+        from multiprocessing.connection import Connection
+        if os.name != "posix":
+            context = _mp_context()
+            self.conn, child_conn = context.Pipe()
+            self.process = context.Process(
+                target=_isolated_main, args=(child_conn, max_memory_mb), daemon=True)
+            self.process.start()
+            child_conn.close()
+            return
+        import socket
+        import subprocess
+        parent_sock, child_sock = socket.socketpair()
+        with parent_sock, child_sock:
+            # The worker exits when the parent's end closes (EOF), however the parent stops
+            self.process = subprocess.Popen(
+                [sys.executable, "-c", _WORKER_BOOTSTRAP, os.path.dirname(os.path.abspath(__file__)),
+                 str(child_sock.fileno()), str(max_memory_mb or 0)],
+                pass_fds=(child_sock.fileno(),), stdin=subprocess.DEVNULL)
+            self.conn = Connection(parent_sock.detach())
+
+    def alive(self):
+        if hasattr(self.process, "poll"):
+            return self.process.poll() is None
+        return self.process.is_alive()
+
+    def kill(self):
+        self.process.kill()
+        if hasattr(self.process, "poll"):
+            self.process.wait()
+        else:
+            self.process.join()
+        self.conn.close()
+
+    def result(self, deadline, timeout):
+        """Waits for the current task's reply until deadline (time.monotonic(), or None)."""
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        if not self.conn.poll(remaining):
+            raise PdfExtractionError(f"extraction timed out after {timeout:g}s")
+        try:
+            status, value = self.conn.recv()
+        except (EOFError, OSError):
+            raise PdfExtractionError("extraction worker crashed") from None
+        if status != "ok":
+            raise PdfExtractionError(value)
+        return value
+
+def _acquire_worker():
+    with _workers_lock:
+        while _idle_workers:
+            worker = _idle_workers.pop()
+            if worker.alive():
+                return worker
+            worker.kill()
+    return _IsolatedWorker(_pdf_limits["max_memory_mb"])
+
+def _release_worker(worker):
+    with _workers_lock:
+        if worker.alive() and len(_idle_workers) < (_pdf_workers or os.cpu_count() or 1):
+            _idle_workers.append(worker)
+            return
+    worker.kill()
+
+def _close_isolated_workers():
+    with _workers_lock:
+        workers = list(_idle_workers)
+        _idle_workers.clear()
+    for worker in workers:
+        worker.kill()
+
+def _run_isolated(tasks, deadline, timeout):
+    """Runs each task on its own worker; all must finish by deadline."""
+    workers = [_acquire_worker() for _ in tasks]
+    results = []
+    try:
+        for worker, task in zip(workers, tasks):
+            worker.conn.send(task)
+        for worker in workers:
+            results.append(worker.result(deadline, timeout))
+    finally:
+        # Workers that didn't deliver (timed out, crashed or still busy) are killed
+        for i, worker in enumerate(workers):
+            if i < len(results):
+                _release_worker(worker)
+            else:
+                worker.kill()
+    return results
+
+def _extract_isolated(data, separator):
+    max_pages, max_chars = _pdf_limits["max_pages"], _pdf_limits["max_chars"]
+    timeout = _pdf_limits["timeout"]
+    deadline = time.monotonic() + timeout if timeout else None
+    workers = _pdf_workers or os.cpu_count() or 1
+    # The first worker also finds the page count; pages past the first
+    # PARALLEL_MIN_PAGES are then split across workers
+    first_stop = PARALLEL_MIN_PAGES if workers > 1 else None
+    (num_pages, texts), = _run_isolated([(data, 0, first_stop, max_pages, max_chars)], deadline, timeout)
+    chars = sum(map(len, texts))
+    if first_stop is not None and num_pages > first_stop and not (max_chars and chars >= max_chars):
+        step = -(-(num_pages - first_stop) // workers)  # ceiling division
+        budget = max_chars - chars if max_chars else 0
+        tasks = [(data, start, min(start + step, num_pages), max_pages, budget)
+                 for start in range(first_stop, num_pages, step)]
+        for _, more in _run_isolated(tasks, deadline, timeout):
+            texts += more
+    return _join_capped(texts, separator, max_chars)
@@ -0,0 +1,168 @@
+import re
+import functools
+import collections
+
+from stopwords import STOP_WORDS
+
+# ========================
+# Skill-Aware Tokenizer
+# ========================
+#
+# clean_text drops anything that isn't purely alphabetic, so "c++", "c#",
+# "node.js", "python3" and "ci/cd" never survive. Phrase matching uses its
+# own tokenizer instead: a token is a run of letters, digits, '+' and '#',
+# optionally joined by '.', '/' or '-' to the next run (so "node.js" and
+# "ci/cd" stay whole, but a sentence-ending "python." becomes "python"),
+# with an optional leading '.' for names like ".net".
+
+_TOKEN_CHARS = r"(?:[^\W_]|[+#])+"
+_TOKEN_RE = re.compile(rf"\.?{_TOKEN_CHARS}(?:[./\-]{_TOKEN_CHARS})*")
+# Phrases never span these (sentence/list punctuation and line breaks)
+_SEGMENT_RE = re.compile(r"[,;:!?()\[\]{}|•\n]|\.(?=\s|$)")
+# Symbol-bearing tokens that are abbreviations, not skills
+_NOT_SKILLS = frozenset({"e.g", "i.e", "etc", "vs", "a.m", "p.m"})
+
+def tokenize(text):
+    """Lowercases text and returns its skill-aware tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+def phrase_key(phrase):
+    """Normalized form of a phrase: its tokens joined by single spaces."""
+    return " ".join(tokenize(phrase))
+
+# ========================
+# Phrase Extraction
+# ========================
+
+def extract_phrases(job_text, stop_words=STOP_WORDS, min_count=2, max_words=3):
+    """
+    Extracts key phrases from a job description:
+      - every symbol-bearing token with a letter in it ("c++", "node.js", "python3", "ci/cd")
+      - runs of 2..max_words non-stop-words, within one sentence/list item,
+        that occur at least min_count times (e.g. "machine learning")
+    Returns a set of normalized phrases.
+    """
+    stop_words = frozenset(stop_words)
+    phrases = set()
+    ngram_counts = collections.Counter()
+    for segment in _SEGMENT_RE.split(job_text.lower()):
+        tokens = _TOKEN_RE.findall(segment)
+        for token in tokens:
+            if not token.isalpha() and token not in _NOT_SKILLS and any(c.isalpha() for c in token):
+                phrases.add(token)
+        run = []
+        for token in tokens + [None]:
+            if token is not None and token not in stop_words and any(c.isalpha() for c in token):
+                run.append(token)
+                continue
+            for n in range(2, max_words + 1):
+                for i in range(len(run) - n + 1):
+                    ngram_counts[" ".join(run[i:i + n])] += 1
+            run = []
+    phrases.update(p for p, count in ngram_counts.items() if count >= min_count)
+    return phrases
+
+def parse_phrase_list(spec):
+    """
+    Parses user-supplied phrases: a comma-separated string, or '@path' to
+    read one phrase per line from a file. Returns a set of normalized phrases.
+    """
+    if spec.startswith("@"):
+        with open(spec[1:], encoding="utf-8") as f:
+            items = f.read().splitlines()
+    else:
+        items = spec.split(",")
+    return {key for key in (phrase_key(item) for item in items) if key}
+
+# ========================
+# Aho–Corasick Phrase Matcher
+# ========================
+
+class PhraseMatcher:
+    """
+    Compiles phrases into an Aho–Corasick automaton over tokens, so a
+    resume is scanned once, in time linear in its token count, for every
+    phrase at the same time. Matching is on whole tokens, so "java" never
+    matches inside "javascript" and "c" never matches inside "c++".
+    """
+    def __init__(self, phrases):
+        self.phrases = {key for key in (phrase_key(p) for p in phrases) if key}
+        # State 0 is the root. goto[s] maps token -> next state.
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]  # phrases ending at each state (including via fail links)
+        for phrase in self.phrases:
+            self._insert(phrase)
+        self._build_fail_links()
+
+    def _insert(self, phrase):
+        state = 0
+        for token in phrase.split(" "):
+            nxt = self._goto[state].get(token)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][token] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = nxt
+        self._output[state] = (phrase,)
+
+    def _build_fail_links(self):
+        queue = collections.deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(token, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+
+    def __len__(self):
+        return len(self.phrases)
+
+    def count(self, text):
+        """
+        Returns a Counter of phrase -> occurrences in text. Like JD phrase
+        extraction, phrases never span sentence/list punctuation or lines:
+
+        >>> matcher = PhraseMatcher({"machine learning"})
+        >>> matcher.count("Machine, learning and\\nmachine\\nlearning")
+        Counter()
+        >>> matcher.count("Machine learning, deep learning")
+        Counter({'machine learning': 1})
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        counts = collections.Counter()
+        for segment in _SEGMENT_RE.split(text.lower()):
+            state = 0
+            for token in _TOKEN_RE.findall(segment):
+                while state and token not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(token, 0)
+                for phrase in output[state]:
+                    counts[phrase] += 1
+        return counts
+
+    def match(self, text):
+        """
+        Returns two sets, like match_keywords: phrases found in text and
+        phrases missing from it.
+        """
+        found = set(self.count(text))
+        return found, self.phrases - found
+
+@functools.lru_cache(maxsize=32)
+def get_phrase_matcher(phrases):
+    """Returns a PhraseMatcher for a frozenset of phrases, compiled once per process."""
+    return PhraseMatcher(phrases)
+
+def match_phrases(job_phrases, resume_text):
+    """
+    Matches a resume's raw text against JD phrases.
+    Returns two sets: matched phrases and missing phrases.
+    """
+    return get_phrase_matcher(frozenset(job_phrases)).match(resume_text)
@@ -0,0 +1,194 @@
+import json
+import time
+import threading
+import tracemalloc
+
+# ========================
+# Per-Stage Profiler
+# ========================
+#
+# Usage:
+#     prof = get_profiler()
+#     with prof.stage("resume.read") as stage:
+#         text = read_file(path)
+#         stage.add_bytes(len(text))
+#
+# A disabled profiler hands out one shared no-op stage, so instrumented code
+# costs a method call and an attribute lookup per stage when profiling is off.
+
+class _NullStage:
+    """Stage returned by a disabled profiler: does nothing."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def add_bytes(self, n):
+        pass
+
+_NULL_STAGE = _NullStage()
+
+class _Stage:
+    """One timed run of a named stage (see Profiler.stage)."""
+    __slots__ = ("profiler", "name", "nbytes", "start", "mem_base", "mem_peak")
+
+    def __init__(self, profiler, name, nbytes):
+        self.profiler = profiler
+        self.name = name
+        self.nbytes = nbytes
+
+    def add_bytes(self, n):
+        """Adds to the input size recorded for this run."""
+        self.nbytes += n
+
+    def __enter__(self):
+        if self.profiler.trace_memory:
+            self.profiler._enter_memory(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        peak = self.profiler._exit_memory(self) if self.profiler.trace_memory else None
+        self.profiler._record(self.name, elapsed, self.nbytes, peak)
+        return False
+
+class Profiler:
+    """
+    Collects wall time, call count, input bytes and (with trace_memory=True)
+    the tracemalloc peak above the starting allocation for each named stage.
+    Stages may nest; a parent's time and memory peak include its children.
+    Memory tracing slows Python code down considerably, so it is opt-in.
+    tracemalloc is process-wide: with several threads profiling at once
+    (e.g. concurrent Streamlit sessions) a stage's memory figure also
+    counts the other threads' allocations, so treat it as an upper bound.
+    """
+    def __init__(self, enabled=True, trace_memory=False):
+        self.enabled = enabled
+        self.trace_memory = enabled and trace_memory
+        self._lock = threading.Lock()
+        self._local = threading.local()  # per-thread stack of open traced stages
+        self._started_tracing = False  # True only if tracemalloc was off and we turned it on
+        self._traced_stacks = 0        # threads with an open traced stage
+        self.reset()
+
+    def reset(self):
+        """Clears all recorded stages and restarts the wall clock."""
+        with self._lock:
+            self._stages = {}  # name -> stats dict, in first-seen order
+            self._created = time.perf_counter()
+
+    def stage(self, name, nbytes=0):
+        """Returns a context manager that records one run of stage `name`."""
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name, nbytes)
+
+    # ---------- memory tracing ----------
+
+    def _memory_stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _enter_memory(self, stage):
+        stack = self._memory_stack()
+        if not stack:
+            with self._lock:
+                if self._traced_stacks == 0 and not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    self._started_tracing = True
+                self._traced_stacks += 1
+        current, peak = tracemalloc.get_traced_memory()
+        if stack:
+            # Fold the peak seen so far into the enclosing stage before resetting it
+            stack[-1].mem_peak = max(stack[-1].mem_peak, peak)
+        tracemalloc.reset_peak()
+        stage.mem_base = stage.mem_peak = current
+        stack.append(stage)
+
+    def _exit_memory(self, stage):
+        stack = self._memory_stack()
+        stage.mem_peak = max(stage.mem_peak, tracemalloc.get_traced_memory()[1])
+        stack.pop()
+        if stack:
+            stack[-1].mem_peak = max(stack[-1].mem_peak, stage.mem_peak)
+        else:
+            with self._lock:
+                self._traced_stacks -= 1
+                # Leave tracing alone if someone else had it on, or another thread is still using it
+                if self._traced_stacks == 0 and self._started_tracing:
+                    tracemalloc.stop()
+                    self._started_tracing = False
+        return stage.mem_peak - stage.mem_base
+
+    # ---------- results ----------
+
+    def _record(self, name, elapsed, nbytes, peak):
+        with self._lock:
+            entry = self._stages.get(name)
+            if entry is None:
+                entry = self._stages[name] = {
+                    "calls": 0, "total_s": 0.0, "max_s": 0.0, "bytes": 0, "peak_mem_bytes": None,
+                }
+            entry["calls"] += 1
+            entry["total_s"] += elapsed
+            entry["max_s"] = max(entry["max_s"], elapsed)
+            entry["bytes"] += nbytes
+            if peak is not None:
+                entry["peak_mem_bytes"] = max(entry["peak_mem_bytes"] or 0, peak)
+
+    def report(self):
+        """
+        Returns a JSON-serializable dict: overall wall time since creation
+        (or reset) and one entry per stage, in the order stages first ran.
+        """
+        with self._lock:
+            stages = []
+            for name, entry in self._stages.items():
+                stages.append({
+                    "stage": name,
+                    "calls": entry["calls"],
+                    "total_ms": round(entry["total_s"] * 1000, 3),
+                    "mean_ms": round(entry["total_s"] * 1000 / entry["calls"], 3),
+                    "max_ms": round(entry["max_s"] * 1000, 3),
+                    "bytes": entry["bytes"],
+                    "peak_mem_bytes": entry["peak_mem_bytes"],
+                })
+            return {
+                "enabled": self.enabled,
+                "trace_memory": self.trace_memory,
+                "wall_ms": round((time.perf_counter() - self._created) * 1000, 3),
+                "stages": stages,
+            }
+
+    def write_json(self, filename, **extra):
+        """Writes report() (plus any extra top-level keys) to a JSON file."""
+        report = self.report()
+        report.update(extra)
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+# ========================
+# Shared Process-Wide Profiler
+# ========================
+
+_default_profiler = Profiler(enabled=False)
+
+def get_profiler():
+    """Returns the process-wide profiler (disabled unless configured)."""
+    return _default_profiler
+
+def configure_profiler(**kwargs):
+    """
+    Replaces the process-wide profiler (same arguments as Profiler)
+    and returns it.
+    """
+    global _default_profiler
+    _default_profiler = Profiler(**kwargs)
+    return _default_profiler
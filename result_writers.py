@@ -0,0 +1,165 @@
+import os
+import csv
+
+# ========================
+# Streaming Result Writers
+# ========================
+#
+# Each writer emits rows as soon as a resume is scored, so a batch run
+# never has to keep every result (and its word counts) in memory.
+# The keyword matrix is written one row per resume (columns = JD keywords),
+# which is the only orientation that can be streamed.
+
+SUMMARY_HEADER = ['Resume File', 'Match %', '#Matched', '#Missing']
+# Cleaned tokens are lowercase letters only, so this can't collide with a keyword
+RESUME_COLUMN = 'Resume File'
+
+def summary_row(result):
+    """Returns the summary CSV row for one result dict."""
+    return [
+        os.path.basename(result["resume_path"]),
+        f"{result['match_percent']:.1f}",
+        result["num_matched"],
+        result["num_missing"]
+    ]
+
+def keyword_counts_row(result, keywords):
+    """Returns the counts of each keyword in one result, in keyword order."""
+    get = result["resume_counts"].get
+    return [get(word, 0) for word in keywords]
+
+class SummaryCsvWriter:
+    """Streams the summary table (one row per resume) to a CSV file."""
+    def __init__(self, filename):
+        self._file = open(filename, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(SUMMARY_HEADER)
+
+    def write(self, result):
+        self._writer.writerow(summary_row(result))
+
+    def close(self):
+        self._file.close()
+
+class MatrixCsvWriter:
+    """Streams the keyword matrix (one row per resume) to a CSV file."""
+    def __init__(self, filename, keywords):
+        self.keywords = list(keywords)
+        self._file = open(filename, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([RESUME_COLUMN] + self.keywords)
+
+    def write(self, result):
+        self._writer.writerow(
+            [os.path.basename(result["resume_path"])] + keyword_counts_row(result, self.keywords)
+        )
+
+    def close(self):
+        self._file.close()
+
+class ColumnarMatrixWriter:
+    """
+    Streams the keyword matrix to Parquet or Arrow IPC (Feather v2) in
+    record batches of batch_size rows, so memory stays bounded by one batch.
+    Columns: 'Resume File', 'Match %', '#Matched', '#Missing', then one
+    int32 column per JD keyword.
+    """
+    def __init__(self, filename, keywords, fmt="parquet", batch_size=1024):
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("Columnar output needs pyarrow. Install with: pip install pyarrow") from None
+        import numpy as np
+        self._pa = pa
+        self._np = np
+        self.keywords = list(keywords)
+        self.batch_size = batch_size
+        fields = [
+            pa.field(RESUME_COLUMN, pa.string()),
+            pa.field('Match %', pa.float64()),
+            pa.field('#Matched', pa.int32()),
+            pa.field('#Missing', pa.int32()),
+        ] + [pa.field(word, pa.int32()) for word in self.keywords]
+        self.schema = pa.schema(fields)
+        if fmt == "parquet":
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(filename, self.schema)
+        elif fmt == "arrow":
+            import pyarrow.ipc as ipc
+            self._writer = ipc.new_file(filename, self.schema)
+        else:
+            raise ValueError(f"Unknown columnar format: {fmt}")
+        self._reset_batch()
+
+    def _reset_batch(self):
+        self._labels = []
+        self._stats = []
+        self._counts = self._np.zeros((self.batch_size, len(self.keywords)), dtype=self._np.int32)
+
+    def write(self, result):
+        row = len(self._labels)
+        self._labels.append(os.path.basename(result["resume_path"]))
+        self._stats.append((result["match_percent"], result["num_matched"], result["num_missing"]))
+        self._counts[row] = keyword_counts_row(result, self.keywords)
+        if len(self._labels) == self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        n = len(self._labels)
+        if n == 0:
+            return
+        pa = self._pa
+        match_percent, num_matched, num_missing = zip(*self._stats)
+        columns = [
+            pa.array(self._labels, pa.string()),
+            pa.array(match_percent, pa.float64()),
+            pa.array(num_matched, pa.int32()),
+            pa.array(num_missing, pa.int32()),
+        ] + [pa.array(self._counts[:n, j]) for j in range(len(self.keywords))]
+        self._writer.write_batch(pa.record_batch(columns, schema=self.schema))
+        self._reset_batch()
+
+    def close(self):
+        self._flush()
+        self._writer.close()
+
+# ========================
+# Combined Writer
+# ========================
+
+STREAM_FORMATS = ("csv", "parquet", "arrow")
+
+class StreamingResultWriter:
+    """
+    Writes {prefix}_summary.csv and {prefix}_matrix.{csv|parquet|arrow}
+    incrementally, one resume at a time. Use as a context manager.
+    """
+    def __init__(self, prefix, keywords, fmt="csv", batch_size=1024):
+        if fmt not in STREAM_FORMATS:
+            raise ValueError(f"fmt must be one of {STREAM_FORMATS}")
+        output_dir = os.path.dirname(prefix)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        self.summary_path = f"{prefix}_summary.csv"
+        self.matrix_path = f"{prefix}_matrix.{fmt}"
+        self.count = 0
+        self._summary = SummaryCsvWriter(self.summary_path)
+        if fmt == "csv":
+            self._matrix = MatrixCsvWriter(self.matrix_path, keywords)
+        else:
+            self._matrix = ColumnarMatrixWriter(self.matrix_path, keywords, fmt, batch_size)
+
+    def write(self, result):
+        self._summary.write(result)
+        self._matrix.write(result)
+        self.count += 1
+
+    def close(self):
+        self._summary.close()
+        self._matrix.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
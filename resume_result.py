@@ -0,0 +1,223 @@
+from array import array
+from bisect import bisect_left
+
+from text_utils import match_percent_from_count
+
+# ========================
+# Compact Per-Resume Results
+# ========================
+#
+# A result dict used to hold the resume's full word Counter plus two sets of
+# keyword strings, although every consumer (summary, matrix, detail view,
+# writers) only reads counts for the JD keywords. Now the JD keywords are
+# interned once per JD (KeywordVocab: keyword <-> id) and each resume keeps:
+#   counts        array('I'), one count per keyword id
+#   matched_bits  int bitmap, bit i set when keyword i is in the resume
+#                 (missing is the complement within the vocabulary)
+#
+# Measured with tracemalloc over 2,000 synthetic 600-word resumes
+# (benchmarks/synthetic.py) against a 131-keyword JD, per resume:
+#   result dict with the full Counter            ~34.6 KB
+#   result dict with the Counter trimmed to JD   ~10.3 KB
+#   ResumeResult                                  ~0.7 KB
+# ScoringSession also keeps every resume's full word counts (to apply JD
+# keyword deltas); as WordInterner bags they take ~3.7 KB per resume instead
+# of a ~30 KB Counter plus ~9 KB of matched/missing sets.
+
+class KeywordVocab:
+    """
+    Interned JD keywords: keywords[i] is the keyword with id i (sorted
+    order, so ids are stable for a given keyword set). Shared by every
+    ResumeResult scored against the same JD.
+    """
+    def __init__(self, keywords):
+        self.keywords = tuple(sorted(set(keywords)))
+        self.index = {word: i for i, word in enumerate(self.keywords)}
+        self.all_bits = (1 << len(self.keywords)) - 1
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def __iter__(self):
+        return iter(self.keywords)
+
+    def __contains__(self, word):
+        return word in self.index
+
+    def words(self, bits):
+        """Returns the set of keywords whose bits are set."""
+        return {word for i, word in enumerate(self.keywords) if bits >> i & 1}
+
+class KeywordCounts:
+    """
+    Read-only Counter-like view of a ResumeResult's keyword counts:
+    iteration, len() and items() cover the keywords the resume contains,
+    and missing words count as 0 (as with a Counter).
+    """
+    __slots__ = ("_vocab", "_counts")
+
+    def __init__(self, vocab, counts):
+        self._vocab = vocab
+        self._counts = counts
+
+    def __getitem__(self, word):
+        i = self._vocab.index.get(word)
+        return 0 if i is None else self._counts[i]
+
+    def get(self, word, default=None):
+        i = self._vocab.index.get(word)
+        count = 0 if i is None else self._counts[i]
+        return count if count else default
+
+    def __contains__(self, word):
+        return bool(self[word])
+
+    def items(self):
+        keywords = self._vocab.keywords
+        return [(keywords[i], c) for i, c in enumerate(self._counts) if c]
+
+    def keys(self):
+        return [word for word, _ in self.items()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self._counts) - self._counts.count(0)
+
+class ResumeResult:
+    """
+    One resume's match against a KeywordVocab. Supports the result-dict
+    keys the display and save code read (result["matched"],
+    result["resume_counts"], ...), computing the derived ones on access;
+    matched/missing return fresh sets.
+    """
+    __slots__ = ("resume_path", "vocab", "counts", "matched_bits", "phrase_matched", "phrase_missing",
+                 "fuzzy_matched")
+
+    def __init__(self, resume_path, vocab, counts, matched_bits=None):
+        self.resume_path = resume_path
+        self.vocab = vocab
+        self.counts = counts
+        if matched_bits is None:
+            matched_bits = 0
+            for i, count in enumerate(counts):
+                if count:
+                    matched_bits |= 1 << i
+        self.matched_bits = matched_bits
+        self.phrase_matched = None
+        self.phrase_missing = None
+        self.fuzzy_matched = None
+
+    @classmethod
+    def from_counts(cls, resume_path, vocab, word_counts):
+        """Builds a result from a word-count mapping (e.g. a Counter of cleaned words)."""
+        get = word_counts.get
+        return cls(resume_path, vocab, array("I", [get(word, 0) for word in vocab.keywords]))
+
+    def copy(self):
+        """Shallow copy (arrays are shared; they are never modified in place)."""
+        other = ResumeResult(self.resume_path, self.vocab, self.counts, self.matched_bits)
+        other.phrase_matched = self.phrase_matched
+        other.phrase_missing = self.phrase_missing
+        other.fuzzy_matched = self.fuzzy_matched
+        return other
+
+    # ---------- derived fields ----------
+
+    @property
+    def num_matched(self):
+        return self.matched_bits.bit_count()
+
+    @property
+    def num_missing(self):
+        return len(self.vocab) - self.num_matched
+
+    @property
+    def match_percent(self):
+        return match_percent_from_count(self.num_matched, len(self.vocab))
+
+    @property
+    def matched(self):
+        return self.vocab.words(self.matched_bits)
+
+    @property
+    def missing(self):
+        return self.vocab.words(self.vocab.all_bits & ~self.matched_bits)
+
+    @property
+    def resume_counts(self):
+        return KeywordCounts(self.vocab, self.counts)
+
+    # ---------- dict-style access ----------
+
+    _KEYS = ("resume_path", "resume_counts", "match_percent", "num_matched", "num_missing",
+             "matched", "missing", "phrase_matched", "phrase_missing", "fuzzy_matched")
+    _OPTIONAL = ("phrase_matched", "phrase_missing", "fuzzy_matched")
+    _SETTABLE = ("resume_path",) + _OPTIONAL
+
+    def keys(self):
+        return [key for key in self._KEYS if key in self]
+
+    def __contains__(self, key):
+        if key in self._OPTIONAL:
+            return getattr(self, key) is not None
+        return key in self._KEYS
+
+    def __getitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self else default
+
+    def __setitem__(self, key, value):
+        if key not in self._SETTABLE:
+            raise KeyError(f"{key!r} is derived from the keyword counts and can't be set")
+        setattr(self, key, value)
+
+    def __repr__(self):
+        return (f"ResumeResult({self.resume_path!r}, {self.match_percent:.1f}%, "
+                f"{self.num_matched}/{len(self.vocab)} keywords)")
+
+# ========================
+# Compact Resume Word Bags
+# ========================
+
+class WordInterner:
+    """Maps words to small integer ids, shared across every resume in a session."""
+    def __init__(self):
+        self.ids = {}
+        self.words = []  # id -> word
+
+    def __len__(self):
+        return len(self.ids)
+
+    def bag(self, word_counts):
+        """
+        Packs a word-count mapping into (word ids, counts) arrays sorted by id,
+        replacing one dict entry and string per word with 8 bytes.
+        """
+        ids = self.ids
+        for word, count in word_counts.items():
+            if count and word not in ids:
+                ids[word] = len(self.words)
+                self.words.append(word)
+        pairs = sorted((ids[word], count) for word, count in word_counts.items() if count)
+        return array("I", [i for i, _ in pairs]), array("I", [c for _, c in pairs])
+
+    def lookup(self, bag, word):
+        """Count of word in a bag (0 if absent)."""
+        word_id = self.ids.get(word)
+        if word_id is None:
+            return 0
+        word_ids, counts = bag
+        pos = bisect_left(word_ids, word_id)
+        return counts[pos] if pos < len(word_ids) and word_ids[pos] == word_id else 0
+
+    def word_counts(self, bag):
+        """Unpacks a bag back into a {word: count} dict."""
+        words = self.words
+        word_ids, counts = bag
+        return {words[i]: count for i, count in zip(word_ids, counts)}
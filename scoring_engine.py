@@ -0,0 +1,172 @@
+import collections
+from array import array
+
+from stopwords import STOP_WORDS
+from file_utils import read_file
+from normalize_utils import normalize_words
+from resume_result import KeywordVocab, ResumeResult, WordInterner
+from text_utils import (
+    Analyzer,
+    clean_text,
+    extract_keywords,
+    extract_nouns_verbs,
+    extract_nouns_verbs_many,
+    match_keywords,
+    calculate_match_percent,
+)
+
+# ========================
+# Stateless Scoring Helpers
+# ========================
+
+def extract_keywords_from_jd(job_text, mode, normalize=None):
+    """
+    Cleans and processes job description text,
+    extracting a set of keywords and their frequencies.
+    Mode can be 'all' (all words) or 'nouns_verbs' (only nouns/verbs).
+    normalize ('stem'/'lemma') is applied after POS filtering, which needs
+    the original word forms.
+    """
+    job_cleaned = clean_text(job_text, STOP_WORDS)
+    if mode == "nouns_verbs":
+        job_cleaned = extract_nouns_verbs(job_cleaned)
+    job_cleaned = normalize_words(job_cleaned, normalize)
+    job_keywords = extract_keywords(job_cleaned)
+    job_word_counts = collections.Counter(job_cleaned)
+    return job_keywords, job_word_counts
+
+def extract_keywords_from_jds(job_texts, mode, normalize=None):
+    """
+    extract_keywords_from_jd for several job descriptions at once: in
+    'nouns_verbs' mode they are POS-tagged in one batched call.
+    Returns a (job_keywords, job_word_counts) pair per text, in order.
+    """
+    cleaned = [clean_text(job_text, STOP_WORDS) for job_text in job_texts]
+    if mode == "nouns_verbs":
+        cleaned = extract_nouns_verbs_many(cleaned)
+    results = []
+    for job_cleaned in cleaned:
+        job_cleaned = normalize_words(job_cleaned, normalize)
+        results.append((extract_keywords(job_cleaned), collections.Counter(job_cleaned)))
+    return results
+
+def analyze_resume(resume_text, jd_keywords, normalize=None):
+    """
+    Cleans a resume and matches it against JD keywords
+    (normalized the same way as the JD keywords).
+    Returns matched/missing sets, match percent, and resume word counts.
+    """
+    resume_cleaned = clean_text(resume_text, STOP_WORDS, normalize)
+    matched, missing = match_keywords(jd_keywords, resume_cleaned)
+    match_percent = calculate_match_percent(matched, len(jd_keywords))
+    resume_counts = collections.Counter(resume_cleaned)
+    return matched, missing, match_percent, resume_counts
+
+# ========================
+# Incremental Scoring Session
+# ========================
+
+class ScoringSession:
+    """
+    Keeps each resume's cleaned word counts (as a compact interned word bag)
+    and its ResumeResult against the current JD, so that changes are scored
+    incrementally:
+      - add_resume scores only the new resume
+      - set_job applies only the keyword delta (added/removed JD keywords)
+        to every resume, without re-reading or re-cleaning anything
+    Results always equal a full recompute with match_keywords.
+    normalize ('stem'/'lemma') must match how the JD keywords were normalized.
+    """
+    def __init__(self, stop_words=STOP_WORDS, normalize=None):
+        self.analyzer = Analyzer(stop_words, normalize)
+        self.job_keywords = set()
+        self.job_word_counts = collections.Counter()
+        self.vocab = KeywordVocab(())
+        self._words = WordInterner()
+        # key -> (word bag, ResumeResult against self.vocab)
+        self._resumes = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._resumes)
+
+    def __contains__(self, key):
+        return key in self._resumes
+
+    def keys(self):
+        return list(self._resumes)
+
+    # ---------- job description ----------
+
+    def set_job(self, job_keywords, job_word_counts=None):
+        """
+        Switches to a new JD keyword set. Counts for keywords kept from the
+        previous JD are carried over; only added keywords are looked up in
+        each resume's word bag. Returns (added, removed) keyword sets.
+        """
+        job_keywords = set(job_keywords)
+        added = job_keywords - self.job_keywords
+        removed = self.job_keywords - job_keywords
+        if added or removed:
+            old_index = self.vocab.index
+            vocab = KeywordVocab(job_keywords)
+            for key, (bag, old) in self._resumes.items():
+                old_counts = old.counts
+                counts = array("I", [
+                    old_counts[old_index[word]] if word in old_index else self._words.lookup(bag, word)
+                    for word in vocab.keywords
+                ])
+                self._resumes[key] = (bag, ResumeResult(key, vocab, counts))
+            self.vocab = vocab
+        self.job_keywords = job_keywords
+        self.job_word_counts = job_word_counts if job_word_counts is not None else collections.Counter()
+        return added, removed
+
+    # ---------- resumes ----------
+
+    def add_resume(self, key, resume_text=None, resume_counts=None):
+        """
+        Adds (or replaces) one resume and scores only that resume.
+        Pass the raw text, or precomputed cleaned word counts.
+        Returns its ResumeResult.
+        """
+        if resume_counts is None:
+            resume_counts = collections.Counter(self.analyzer.clean(resume_text))
+        bag = self._words.bag(resume_counts)
+        self._resumes[key] = (bag, ResumeResult.from_counts(key, self.vocab, resume_counts))
+        return self.result(key)
+
+    def add_resume_file(self, resume_path):
+        """
+        Reads and adds a resume file (keyed by its path).
+        Returns its ResumeResult, or None if the file could not be read.
+        """
+        resume_text = read_file(resume_path)
+        if not resume_text:
+            return None
+        return self.add_resume(resume_path, resume_text)
+
+    def remove_resume(self, key):
+        self._resumes.pop(key, None)
+
+    def retain(self, keys):
+        """Drops every resume whose key is not in keys."""
+        keep = set(keys)
+        for key in [k for k in self._resumes if k not in keep]:
+            del self._resumes[key]
+
+    # ---------- results ----------
+
+    def result(self, key):
+        """
+        Returns the ResumeResult for one resume, in the same shape as
+        process_resumes (a copy, safe to keep or add phrase matches to).
+        """
+        return self._resumes[key][1].copy()
+
+    def word_counts(self, key):
+        """One resume's cleaned word counts, as a {word: count} dict."""
+        return self._words.word_counts(self._resumes[key][0])
+
+    def results(self, keys=None):
+        """ResumeResults for the given keys (default: all, in insertion order)."""
+        return [self.result(key) for key in (self._resumes if keys is None else keys)]
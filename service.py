@@ -0,0 +1,455 @@
+"""
+Local HTTP scoring service (stdlib asyncio, no web framework).
+
+    python service.py [--host 127.0.0.1] [--port 8080] [--workers N]
+                      [--max-inflight 256] [--batch-window-ms 5] [--max-batch 32]
+
+Endpoints (JSON in, JSON out):
+    POST /extract_keywords   {"job_text": "..." | "job_pdf_base64": "...", "mode": "all",
+                              "normalize": "none" | "stem" | "lemma"}
+                             or a raw text/plain or application/pdf body (?mode=nouns_verbs&normalize=stem)
+    POST /analyze            {"job_text" | "job_pdf_base64", "mode", "normalize",
+                              "resume_text" | "resume_pdf_base64"}
+                             or "resumes": [{"text" | "pdf_base64", "label"}, ...]
+    GET  /health, GET /stats
+
+Cleaning, PDF extraction and POS tagging run in a process pool. Concurrent
+/analyze requests for the same JD, mode and normalization are micro-batched: they wait up
+to --batch-window-ms and are scored together in one pool task, so the JD is
+processed once per batch. Identical concurrent /extract_keywords requests
+share one computation. Past --max-inflight requests the service answers 503.
+"""
+import os
+import json
+import base64
+import signal
+import asyncio
+import hashlib
+import argparse
+import functools
+import urllib.parse
+from concurrent.futures import ProcessPoolExecutor
+
+from file_utils import read_pdf_bytes
+from pdf_utils import set_pdf_workers, PdfExtractionError
+from normalize_utils import NORMALIZE_METHODS
+from scoring_engine import extract_keywords_from_jd, analyze_resume
+
+MODES = ("all", "nouns_verbs")
+MAX_BODY_BYTES = 20 * 1024 * 1024
+IDLE_TIMEOUT_SECONDS = 30
+
+class RequestError(Exception):
+    """Raised for a bad request; carries the HTTP status to answer with."""
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+# ========================
+# Pool Worker Functions
+# ========================
+#
+# Documents travel to the workers as ("text", str) or ("pdf", bytes).
+
+def _init_worker():
+    # Already one process per core; don't fan out again per PDF
+    set_pdf_workers(1)
+
+def _document_text(document):
+    kind, data = document
+    return read_pdf_bytes(data, separator="\n") if kind == "pdf" else data
+
+@functools.lru_cache(maxsize=64)
+def _jd_keywords(job_text, mode, normalize=None):
+    # Per-worker cache: batches for a popular JD skip re-extraction entirely
+    return extract_keywords_from_jd(job_text, mode, normalize)
+
+def _ranked(words, job_word_counts):
+    return sorted(words, key=lambda w: (-job_word_counts[w], w))
+
+def _extract_job(job, mode, normalize=None):
+    """Pool task for /extract_keywords."""
+    job_keywords, job_word_counts = _jd_keywords(_document_text(job), mode, normalize)
+    return {
+        "mode": mode,
+        "normalize": normalize or "none",
+        "keywords": _ranked(job_keywords, job_word_counts),
+        "word_counts": dict(job_word_counts),
+    }
+
+def _score_batch(job, mode, resumes, normalize=None):
+    """
+    Pool task for one micro-batch: processes the JD once and scores every
+    resume against it. A resume that can't be read gets an "error" entry.
+    """
+    job_keywords, job_word_counts = _jd_keywords(_document_text(job), mode, normalize)
+    results = []
+    for resume in resumes:
+        try:
+            resume_text = _document_text(resume)
+        except Exception as e:
+            results.append({"error": f"Could not read resume: {e}"})
+            continue
+        matched, missing, match_percent, _ = analyze_resume(resume_text, job_keywords, normalize)
+        results.append({
+            "match_percent": round(match_percent, 2),
+            "num_matched": len(matched),
+            "num_missing": len(missing),
+            "matched": _ranked(matched, job_word_counts),
+            "missing": _ranked(missing, job_word_counts),
+        })
+    return results
+
+# ========================
+# Scoring Service (event loop side)
+# ========================
+
+class _Batch:
+    __slots__ = ("job", "mode", "normalize", "items", "timer")
+
+    def __init__(self, job, mode, normalize=None):
+        self.job = job
+        self.mode = mode
+        self.normalize = normalize
+        self.items = []  # (resume document, future)
+        self.timer = None
+
+def document_key(document):
+    """Content hash used to coalesce requests for the same document."""
+    kind, data = document
+    raw = data if kind == "pdf" else data.encode("utf-8")
+    return kind, hashlib.sha256(raw).digest()
+
+class ScoringService:
+    """
+    Owns the process pool, the open micro-batches (keyed by JD hash, mode
+    and normalization) and the in-flight extract computations. Must be used from the
+    event loop thread.
+    """
+    def __init__(self, workers=None, max_inflight=256, batch_window_ms=5, max_batch=32):
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+        self.max_inflight = max_inflight
+        self.batch_window = batch_window_ms / 1000
+        self.max_batch = max_batch
+        self.inflight = 0
+        self._batches = {}     # (job key, mode, normalize) -> open _Batch
+        self._extracting = {}  # (job key, mode, normalize) -> Future
+        self._tasks = set()    # running batch tasks (the loop only keeps weak references)
+        self.stats = {
+            "requests": 0, "rejected": 0, "errors": 0,
+            "batches": 0, "batched_resumes": 0, "coalesced_extracts": 0,
+        }
+
+    def try_acquire(self):
+        """Reserves an in-flight slot; False means the caller should answer 503."""
+        if self.inflight >= self.max_inflight:
+            self.stats["rejected"] += 1
+            return False
+        self.inflight += 1
+        self.stats["requests"] += 1
+        return True
+
+    def release(self):
+        self.inflight -= 1
+
+    async def extract(self, job, mode, normalize=None):
+        key = (document_key(job), mode, normalize)
+        future = self._extracting.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self.pool, _extract_job, job, mode, normalize)
+            self._extracting[key] = future
+            future.add_done_callback(lambda _: self._extracting.pop(key, None))
+        else:
+            self.stats["coalesced_extracts"] += 1
+        # shield: one client disconnecting must not cancel the others' result
+        return await asyncio.shield(future)
+
+    async def analyze(self, job, mode, resumes, normalize=None):
+        """Queues resumes onto the open batch for this JD and awaits their results."""
+        loop = asyncio.get_running_loop()
+        key = (document_key(job), mode, normalize)
+        futures = []
+        for resume in resumes:
+            batch = self._batches.get(key)
+            if batch is None:
+                batch = self._batches[key] = _Batch(job, mode, normalize)
+                batch.timer = loop.call_later(self.batch_window, self._flush, key, batch)
+            future = loop.create_future()
+            batch.items.append((resume, future))
+            futures.append(future)
+            if len(batch.items) >= self.max_batch:
+                batch.timer.cancel()
+                self._flush(key, batch)
+        return await asyncio.gather(*futures)
+
+    def _flush(self, key, batch):
+        if self._batches.get(key) is batch:
+            del self._batches[key]
+        self.stats["batches"] += 1
+        self.stats["batched_resumes"] += len(batch.items)
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch):
+        loop = asyncio.get_running_loop()
+        resumes = [resume for resume, _ in batch.items]
+        try:
+            results = await loop.run_in_executor(self.pool, _score_batch,
+                                                 batch.job, batch.mode, resumes, batch.normalize)
+        except Exception as e:
+            for _, future in batch.items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch.items, results):
+            if not future.done():
+                future.set_result(result)
+
+    def snapshot(self):
+        batches = self.stats["batches"]
+        return dict(
+            self.stats,
+            inflight=self.inflight,
+            max_inflight=self.max_inflight,
+            mean_batch_size=round(self.stats["batched_resumes"] / batches, 2) if batches else 0.0,
+        )
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+# ========================
+# Request Parsing
+# ========================
+
+def parse_mode(value):
+    mode = value or "all"
+    if mode not in MODES:
+        raise RequestError(400, f"mode must be one of {MODES}")
+    return mode
+
+def parse_normalize(value):
+    """Returns None for exact-word matching, else 'stem' or 'lemma'."""
+    normalize = value or "none"
+    if normalize not in NORMALIZE_METHODS:
+        raise RequestError(400, f"normalize must be one of {NORMALIZE_METHODS}")
+    return None if normalize == "none" else normalize
+
+def parse_document(payload, prefix, required=True):
+    """
+    Reads {prefix}_text or {prefix}_pdf_base64 (e.g. job_text) from a JSON
+    payload and returns ("text", str) or ("pdf", bytes).
+    """
+    text = payload.get(f"{prefix}_text") if prefix else payload.get("text")
+    encoded = payload.get(f"{prefix}_pdf_base64") if prefix else payload.get("pdf_base64")
+    if isinstance(text, str) and text:
+        return "text", text
+    if isinstance(encoded, str) and encoded:
+        try:
+            return "pdf", base64.b64decode(encoded, validate=True)
+        except ValueError:
+            raise RequestError(400, f"{prefix or 'resume'} PDF is not valid base64") from None
+    if required:
+        name = prefix or "resume"
+        raise RequestError(400, f"Provide {name}_text or {name}_pdf_base64")
+    return None
+
+def parse_json(body):
+    try:
+        payload = json.loads(body or b"{}")
+    except ValueError:
+        raise RequestError(400, "Body is not valid JSON") from None
+    if not isinstance(payload, dict):
+        raise RequestError(400, "Body must be a JSON object")
+    return payload
+
+# ========================
+# HTTP Handlers
+# ========================
+
+async def handle_extract(service, query, headers, body):
+    content_type = headers.get("content-type", "").split(";")[0].strip()
+    if content_type in ("application/pdf", "text/plain"):
+        if content_type == "application/pdf":
+            job = ("pdf", body)
+        else:
+            job = ("text", body.decode("utf-8", errors="replace"))
+        mode, normalize = parse_mode(query.get("mode")), parse_normalize(query.get("normalize"))
+    else:
+        payload = parse_json(body)
+        job, mode = parse_document(payload, "job"), parse_mode(payload.get("mode"))
+        normalize = parse_normalize(payload.get("normalize"))
+    return await service.extract(job, mode, normalize)
+
+async def handle_analyze(service, query, headers, body):
+    payload = parse_json(body)
+    job, mode = parse_document(payload, "job"), parse_mode(payload.get("mode"))
+    normalize = parse_normalize(payload.get("normalize"))
+    if "resumes" in payload:
+        items = payload["resumes"]
+        if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+            raise RequestError(400, "resumes must be a list of objects")
+        resumes = [parse_document(item, "") for item in items]
+        results = await service.analyze(job, mode, resumes, normalize)
+        for item, result in zip(items, results):
+            if "label" in item:
+                result["label"] = item["label"]
+        return {"mode": mode, "normalize": normalize or "none", "results": results}
+    resume = parse_document(payload, "resume")
+    result, = await service.analyze(job, mode, [resume], normalize)
+    return dict(result, mode=mode, normalize=normalize or "none")
+
+ROUTES = {
+    ("POST", "/extract_keywords"): handle_extract,
+    ("POST", "/analyze"): handle_analyze,
+}
+
+REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    411: "Length Required", 413: "Payload Too Large", 422: "Unprocessable Entity",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+def encode_response(status, payload, keep_alive=True, extra_headers=()):
+    body = json.dumps(payload).encode("utf-8")
+    lines = [
+        f"HTTP/1.1 {status} {REASONS.get(status, '')}",
+        "Content-Type: application/json",
+        f"Content-Length: {len(body)}",
+        "Connection: keep-alive" if keep_alive else "Connection: close",
+    ]
+    lines.extend(extra_headers)
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+async def read_request(reader):
+    """
+    Reads one HTTP/1.1 request. Returns (method, path, query, headers, body),
+    or None when the client closed the connection.
+    """
+    request_line = await asyncio.wait_for(reader.readline(), IDLE_TIMEOUT_SECONDS)
+    if not request_line:
+        return None
+    try:
+        method, target, _ = request_line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise RequestError(400, "Malformed request line") from None
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        raise RequestError(411, "Chunked bodies are not supported; send Content-Length")
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError:
+        raise RequestError(400, "Content-Length is not a number") from None
+    if length < 0:
+        raise RequestError(400, "Content-Length is negative")
+    if length > MAX_BODY_BYTES:
+        raise RequestError(413, f"Body larger than {MAX_BODY_BYTES} bytes")
+    body = await reader.readexactly(length) if length else b""
+    url = urllib.parse.urlsplit(target)
+    query = dict(urllib.parse.parse_qsl(url.query))
+    return method.upper(), url.path, query, headers, body
+
+async def dispatch(service, method, path, query, headers, body):
+    """Returns (status, payload, extra headers) for one request."""
+    if method == "GET" and path == "/health":
+        return 200, {"status": "ok"}, ()
+    if method == "GET" and path == "/stats":
+        return 200, service.snapshot(), ()
+    handler = ROUTES.get((method, path))
+    if handler is None:
+        if any(route_path == path for _, route_path in ROUTES):
+            return 405, {"error": f"{method} not allowed on {path}"}, ()
+        return 404, {"error": f"No route for {path}"}, ()
+    if not service.try_acquire():
+        return 503, {"error": "Server busy, retry shortly"}, ("Retry-After: 1",)
+    try:
+        return 200, await handler(service, query, headers, body), ()
+    except RequestError as e:
+        return e.status, {"error": str(e)}, ()
+    except PdfExtractionError as e:
+        # The JD PDF was malformed or overran the extraction budgets
+        return 422, {"error": f"Could not read job description PDF: {e}"}, ()
+    except LookupError as e:
+        # NLTK data missing in the workers (nouns_verbs mode, or lemma normalization)
+        service.stats["errors"] += 1
+        return 500, {"error": f"NLTK data not installed: {e}. Run: python main.py --download-nltk"}, ()
+    except Exception as e:
+        service.stats["errors"] += 1
+        return 500, {"error": f"{type(e).__name__}: {e}"}, ()
+    finally:
+        service.release()
+
+async def handle_connection(service, reader, writer):
+    """Serves requests on one keep-alive connection until it closes."""
+    try:
+        while True:
+            try:
+                request = await read_request(reader)
+            except RequestError as e:
+                writer.write(encode_response(e.status, {"error": str(e)}, keep_alive=False))
+                await writer.drain()
+                break
+            if request is None:
+                break
+            method, path, query, headers, body = request
+            keep_alive = headers.get("connection", "").lower() != "close"
+            status, payload, extra = await dispatch(service, method, path, query, headers, body)
+            writer.write(encode_response(status, payload, keep_alive, extra))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+async def serve(host="127.0.0.1", port=8080, **service_kwargs):
+    service = ScoringService(**service_kwargs)
+    server = await asyncio.start_server(
+        functools.partial(handle_connection, service), host, port, backlog=1024,
+    )
+    bound = server.sockets[0].getsockname()
+    print(f"Scoring service listening on http://{bound[0]}:{bound[1]} "
+          f"(pool workers: {service.workers})", flush=True)
+    # SIGTERM (e.g. from a process manager or load_test.py) stops the server
+    # like Ctrl+C does, so the pool workers are shut down instead of orphaned
+    stop = asyncio.Event()
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stop.set)
+    except NotImplementedError:
+        pass  # Windows event loops have no signal handlers
+    try:
+        async with server:
+            await stop.wait()
+    finally:
+        service.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=None, help="Pool processes (default: CPU count)")
+    parser.add_argument("--max-inflight", type=int, default=256,
+                        help="Requests accepted at once before answering 503 (default: 256)")
+    parser.add_argument("--batch-window-ms", type=float, default=5,
+                        help="How long an /analyze batch waits for more resumes (default: 5)")
+    parser.add_argument("--max-batch", type=int, default=32,
+                        help="Resumes per batch before it is sent immediately (default: 32)")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, workers=args.workers, max_inflight=args.max_inflight,
+                          batch_window_ms=args.batch_window_ms, max_batch=args.max_batch))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
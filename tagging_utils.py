@@ -0,0 +1,166 @@
+import hashlib
+import threading
+import collections
+
+# Penn Treebank tags kept by the nouns/verbs extraction mode
+NOUN_VERB_TAGS = frozenset({'NN', 'NNS', 'NNP', 'NNPS', 'VB', 'VBD', 'VBG', 'VBN', 'VBP', 'VBZ'})
+
+# ========================
+# NLTK Resources (checked locally, downloaded only on request)
+# ========================
+
+# Resource name -> path searched by nltk.data.find
+NLTK_RESOURCES = {
+    "averaged_perceptron_tagger_eng": "taggers/averaged_perceptron_tagger_eng/",
+}
+# Only needed for lemma normalization (see normalize_utils)
+LEMMATIZER_RESOURCES = {
+    "wordnet": "corpora/wordnet",
+}
+
+def missing_nltk_resources(resources=None):
+    """
+    Returns the names of required NLTK resources (default: the POS tagger's)
+    not installed locally. Never touches the network.
+    """
+    import nltk
+    missing = []
+    for name, path in (NLTK_RESOURCES if resources is None else resources).items():
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            missing.append(name)
+    return missing
+
+def ensure_nltk_resources(download=False, resources=None):
+    """
+    Checks for the NLTK data used by nouns/verbs mode (or the given resources).
+    Downloads anything missing only when download=True.
+    Returns the list of resources that are still missing.
+    """
+    missing = missing_nltk_resources(resources)
+    if missing and download:
+        import nltk
+        for name in missing:
+            nltk.download(name, quiet=True)
+        missing = missing_nltk_resources(resources)
+    return missing
+
+# ========================
+# Memoized POS Tagger
+# ========================
+
+class PosTagger:
+    """
+    Wraps nltk.pos_tag with a per-document LRU cache.
+
+    Documents are keyed by a hash of their token sequence, so the same
+    cleaned JD is only tagged once per process. The perceptron model is
+    loaded once (warm()) instead of lazily on the first request.
+    """
+    def __init__(self, cache_size=128):
+        self.cache_size = cache_size
+        self._cache = collections.OrderedDict()  # doc key -> tuple of tags
+        self._lock = threading.Lock()
+        self._nltk = None
+        self.hits = 0
+        self.misses = 0
+
+    def warm(self):
+        """Imports NLTK and loads the perceptron tagger model (once per process)."""
+        if self._nltk is None:
+            import nltk
+            nltk.pos_tag(["warmup"])
+            self._nltk = nltk
+        return self
+
+    @staticmethod
+    def doc_key(words):
+        """Returns the cache key for a token list."""
+        return hashlib.blake2b("\x1f".join(words).encode("utf-8"), digest_size=16).digest()
+
+    def _lookup(self, key):
+        with self._lock:
+            tags = self._cache.get(key)
+            if tags is None:
+                self.misses += 1
+            else:
+                self._cache.move_to_end(key)
+                self.hits += 1
+            return tags
+
+    def _store(self, key, tags):
+        with self._lock:
+            self._cache[key] = tags
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def tag(self, words):
+        """
+        Returns [(word, tag), ...] exactly as nltk.pos_tag(words) would.
+        """
+        return self.tag_many([words])[0]
+
+    def tag_many(self, docs):
+        """
+        Tags several token lists in one batched nltk.pos_tag_sents call.
+        Cached documents (and duplicates within the batch) are not re-tagged.
+        Returns one [(word, tag), ...] list per document, in order.
+        """
+        keys = [self.doc_key(words) for words in docs]
+        tags_by_key = {}
+        pending = {}  # key -> words, for cache misses
+        for key, words in zip(keys, docs):
+            if key in tags_by_key or key in pending:
+                continue
+            tags = self._lookup(key)
+            if tags is None:
+                pending[key] = words
+            else:
+                tags_by_key[key] = tags
+        if pending:
+            self.warm()
+            tagged = self._nltk.pos_tag_sents(list(pending.values()))
+            for key, pairs in zip(pending, tagged):
+                tags = tuple(tag for _, tag in pairs)
+                tags_by_key[key] = tags
+                if self.cache_size > 0:
+                    self._store(key, tags)
+        return [list(zip(words, tags_by_key[key])) for key, words in zip(keys, docs)]
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self):
+        """Returns cache hit/miss counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._cache),
+                "cache_size": self.cache_size,
+                "warm": self._nltk is not None,
+            }
+
+# ========================
+# Shared Process-Wide Tagger
+# ========================
+
+_default_tagger = PosTagger()
+
+def get_pos_tagger():
+    """Returns the process-wide tagger used by extract_nouns_verbs."""
+    return _default_tagger
+
+def configure_pos_tagger(cache_size=128):
+    """
+    Replaces the process-wide tagger with one using the given cache size
+    and returns it.
+    """
+    global _default_tagger
+    _default_tagger = PosTagger(cache_size=cache_size)
+    return _default_tagger
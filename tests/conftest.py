@@ -0,0 +1,8 @@
+import os
+import sys
+
+# The modules live flat in the repo root (run the tests from there: python -m pytest)
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+TEST_FILES = os.path.join(REPO, "test_files")
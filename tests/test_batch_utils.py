@@ -0,0 +1,32 @@
+import os
+
+from conftest import TEST_FILES
+from stopwords import STOP_WORDS
+from file_utils import read_file
+from text_utils import clean_text, extract_keywords, match_keywords, calculate_match_percent
+from batch_utils import collect_resume_paths, score_resume, score_resumes_parallel
+
+def job_keywords():
+    return extract_keywords(clean_text(read_file(os.path.join(TEST_FILES, "job1.txt")), STOP_WORDS))
+
+def test_score_resume_matches_baseline_pipeline():
+    keywords = job_keywords()
+    path = os.path.join(TEST_FILES, "resume1.txt")
+    matched, missing = match_keywords(keywords, clean_text(read_file(path), STOP_WORDS))
+    result = score_resume(path, keywords)
+    assert set(result.matched) == matched
+    assert set(result.missing) == missing
+    assert result.match_percent == calculate_match_percent(matched, len(keywords))
+
+def test_pool_gives_sequential_results_in_input_order():
+    keywords = job_keywords()
+    paths = [p for p in collect_resume_paths(TEST_FILES) if "resume" in os.path.basename(p)]
+    expected = [(p, score_resume(p, keywords)) for p in paths]
+    scored = list(score_resumes_parallel(paths, keywords, workers=2, chunksize=1))
+    assert [p for p, _ in scored] == paths
+    for (_, want), (_, got) in zip(expected, scored):
+        if want is None:
+            assert got is None
+        else:
+            assert set(got.matched) == set(want.matched)
+            assert got.match_percent == want.match_percent
@@ -0,0 +1,40 @@
+import random
+import collections
+
+import pytest
+
+from text_utils import match_keywords, calculate_match_percent
+from bitset_match import match_grid
+
+def random_sets(rng, count, vocab, max_size):
+    return [set(rng.sample(vocab, rng.randint(0, max_size))) for _ in range(count)]
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_grid_matches_calculate_match_percent(seed):
+    rng = random.Random(seed)
+    vocab = [f"w{i}" for i in range(300)]
+    jds = random_sets(rng, 7, vocab, 90) + [set()]  # an empty JD scores 0 everywhere
+    resumes = random_sets(rng, 30, vocab, 200)
+    grid = match_grid(jds, resumes)
+    assert grid.shape == (len(jds), len(resumes))
+    for j, jd in enumerate(jds):
+        for r, resume in enumerate(resumes):
+            matched, missing = match_keywords(jd, resume)
+            assert grid.scores[j, r] == calculate_match_percent(matched, len(jd))
+            assert grid.missing()[j, r] == len(missing)
+
+def test_counters_and_unknown_words():
+    jds = [{"python", "sql", "aws"}]
+    resumes = [collections.Counter(["python", "python", "rust"]), collections.Counter()]
+    grid = match_grid(jds, resumes)
+    assert list(grid.scores[0]) == [calculate_match_percent({"python"}, 3), 0.0]
+
+def test_top_k_breaks_ties_by_order():
+    jds = [{"a", "b"}, {"c"}]
+    resumes = [{"a"}, {"a", "b"}, {"b"}, {"c"}]
+    grid = match_grid(jds, resumes)
+    indices, scores = grid.top_k_per_jd(k=3)
+    assert indices[0].tolist() == [1, 0, 2]
+    assert scores[0].tolist() == [100.0, 50.0, 50.0]
+    indices, _ = grid.top_k_per_resume(k=2)
+    assert indices[3].tolist() == [1, 0]
@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+from conftest import TEST_FILES
+from file_utils import read_file
+from jd_profile import HEADER, JDProfile, StaleProfileError, load_jd_profile
+
+@pytest.fixture
+def profile():
+    return JDProfile.compile(read_file(os.path.join(TEST_FILES, "job1.txt")), source="job1.txt")
+
+def test_round_trip(tmp_path, profile):
+    path = str(tmp_path / "job1.jdp")
+    profile.save(path)
+    loaded = load_jd_profile(path)
+    assert loaded.job_word_counts == profile.job_word_counts
+    assert (loaded.mode, loaded.normalize, loaded.source) == ("all", None, "job1.txt")
+
+@pytest.mark.parametrize("cut", [1, 2, 5, 100])
+def test_truncated_profile_is_rejected(profile, cut):
+    data = profile.to_bytes()
+    with pytest.raises(ValueError, match="truncated or corrupt"):
+        JDProfile.from_bytes(data[:-cut])
+
+def test_truncated_header_is_rejected(profile):
+    with pytest.raises(ValueError, match="not a JD profile"):
+        JDProfile.from_bytes(profile.to_bytes()[:HEADER.size - 1])
+
+@pytest.mark.parametrize("where", ["counts", "keywords"])
+def test_flipped_byte_is_rejected(profile, where):
+    data = bytearray(profile.to_bytes())
+    pos = HEADER.size + len("all") + len("job1.txt") + (1 if where == "counts" else 4 * len(profile.job_word_counts) + 1)
+    data[pos] ^= 0x01
+    with pytest.raises(ValueError, match="truncated or corrupt"):
+        JDProfile.from_bytes(bytes(data))
+
+def test_appended_bytes_are_rejected(profile):
+    with pytest.raises(ValueError, match="truncated or corrupt"):
+        JDProfile.from_bytes(profile.to_bytes() + b"x")
+
+def test_other_files_are_rejected():
+    with pytest.raises(ValueError, match="not a JD profile"):
+        JDProfile.from_bytes(b"Senior Python developer wanted")
+
+def test_old_format_is_stale(profile):
+    data = b"RKMJDP01" + profile.to_bytes()[8:]
+    with pytest.raises(StaleProfileError):
+        JDProfile.from_bytes(data)
+
+def test_other_analyzer_settings_are_stale(profile):
+    data = JDProfile(profile.job_word_counts, "all", fingerprint=b"\0" * 32).to_bytes()
+    with pytest.raises(StaleProfileError, match="different analyzer settings"):
+        JDProfile.from_bytes(data)
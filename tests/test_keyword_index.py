@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from stopwords import STOP_WORDS
+from text_utils import clean_text, calculate_match_percent
+from keyword_index import KeywordIndex
+
+VOCAB = [f"skill{chr(97 + i // 26)}{chr(97 + i % 26)}" for i in range(60)]
+
+@pytest.fixture
+def corpus(tmp_path):
+    rng = random.Random(7)
+    paths = []
+    for i in range(40):
+        path = tmp_path / "resumes" / f"r{i:02d}.txt"
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(" ".join(rng.choices(VOCAB, k=rng.randint(1, 80))), encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+def brute_force(paths, job_keywords, k, min_match_percent):
+    scored = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            words = set(clean_text(f.read(), STOP_WORDS))
+        percent = calculate_match_percent(job_keywords & words, len(job_keywords))
+        if percent >= min_match_percent:
+            scored.append((-percent, path))
+    return [(path, -neg) for neg, path in sorted(scored)[:k]]
+
+@pytest.mark.parametrize("k,min_match_percent", [(1, 0), (5, 0), (10, 40), (50, 0), (5, 100)])
+def test_top_k_matches_brute_force(tmp_path, corpus, k, min_match_percent):
+    job_keywords = set(random.Random(k).sample(VOCAB, 12))
+    with KeywordIndex(str(tmp_path / "index")) as index:
+        index.add_documents(corpus)
+        results = index.top_k(job_keywords, k=k, min_match_percent=min_match_percent)
+        got = [(r.resume_path, r.match_percent) for r in results]
+    assert got == brute_force(corpus, job_keywords, k, min_match_percent)
+
+def test_top_k_after_updates_and_compaction(tmp_path, corpus):
+    job_keywords = set(VOCAB[:10])
+    with KeywordIndex(str(tmp_path / "index")) as index:
+        index.add_documents(corpus[:25])
+        index.add_documents(corpus[20:])
+        index.remove_documents(corpus[:5])
+        live = corpus[5:]
+        before = [(r.resume_path, r.match_percent) for r in index.top_k(job_keywords, k=10)]
+        index.compact()
+        after = [(r.resume_path, r.match_percent) for r in index.top_k(job_keywords, k=10)]
+    assert before == after == brute_force(live, job_keywords, 10, 0)
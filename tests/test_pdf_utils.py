@@ -0,0 +1,54 @@
+import os
+import sys
+
+import pytest
+
+from conftest import REPO, TEST_FILES
+import pdf_utils
+from pdf_utils import PdfExtractionError, configure_pdf_limits, extract_pdf_text
+
+sys.path.insert(0, os.path.join(REPO, "benchmarks"))
+from synthetic import write_pdf
+
+@pytest.fixture(autouse=True)
+def pdf_limits():
+    saved = dict(pdf_utils._pdf_limits)
+    yield
+    configure_pdf_limits(**saved)
+
+@pytest.fixture(scope="module")
+def big_pdf(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("pdf") / "big.pdf")
+    write_pdf(path, "\n".join("python kubernetes developer " * 3 for _ in range(4000)), lines_per_page=50)
+    with open(path, "rb") as f:
+        return f.read()
+
+def small_pdf():
+    with open(os.path.join(TEST_FILES, "resume1.pdf"), "rb") as f:
+        return f.read()
+
+@pytest.mark.parametrize("isolate", [True, False])
+def test_unreadable_pdf_raises(isolate):
+    configure_pdf_limits(isolate=isolate)
+    with pytest.raises(PdfExtractionError, match="unreadable PDF"):
+        extract_pdf_text(b"%PDF-1.4 not really a pdf")
+
+def test_timeout_kills_the_worker(big_pdf):
+    configure_pdf_limits(isolate=True, timeout=0.05, max_pages=0, max_chars=0)
+    with pytest.raises(PdfExtractionError, match="timed out"):
+        extract_pdf_text(big_pdf)
+    # The next document gets a fresh worker
+    configure_pdf_limits(timeout=30)
+    assert extract_pdf_text(small_pdf())
+
+def test_isolated_output_matches_in_process(big_pdf):
+    configure_pdf_limits(isolate=True, max_pages=0, max_chars=0)
+    isolated = extract_pdf_text(big_pdf, "\n"), extract_pdf_text(small_pdf())
+    configure_pdf_limits(isolate=False)
+    assert (extract_pdf_text(big_pdf, "\n"), extract_pdf_text(small_pdf())) == isolated
+
+def test_caps_cut_the_text_short(big_pdf):
+    configure_pdf_limits(isolate=False, max_pages=0, max_chars=0)
+    full = extract_pdf_text(big_pdf, "\n")
+    configure_pdf_limits(isolate=True, max_chars=5000)
+    assert extract_pdf_text(big_pdf, "\n") == full[:5000]
@@ -0,0 +1,46 @@
+import os
+import string
+
+import pytest
+
+from conftest import TEST_FILES
+from stopwords import STOP_WORDS
+from file_utils import read_file
+from text_utils import Analyzer, clean_text, iter_clean_text
+
+def baseline_clean_text(raw_text, stop_words):
+    # clean_text as it was before the Analyzer
+    text = raw_text.lower().translate(str.maketrans('', '', string.punctuation))
+    return [word for word in text.split() if word not in stop_words and word.isalpha()]
+
+SAMPLES = [
+    "",
+    "   \n\t ",
+    "Senior Python/Django developer -- 5+ years; REST APIs, CI/CD & AWS.",
+    "C++ and C# (.NET) experience; Node.js, e-mail, state-of-the-art.",
+    "Café résumé naïve Zürich: ÉLAN, straße — “quoted” words…",
+    "ﬁle ligatures and İstanbul upper-case İ, Greek ΣΟΦΙΑ",
+    "numbers 2024 mixed abc123 and 3d words",
+    "The and of to a in for on with",  # stop words only
+]
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_analyzer_matches_baseline(text):
+    expected = baseline_clean_text(text, STOP_WORDS)
+    assert Analyzer(STOP_WORDS).clean(text) == expected
+    assert clean_text(text, STOP_WORDS) == expected
+    assert list(iter_clean_text(text, STOP_WORDS)) == expected
+
+def test_sample_files_match_baseline():
+    analyzer = Analyzer(STOP_WORDS)
+    for name in sorted(os.listdir(TEST_FILES)):
+        text = read_file(os.path.join(TEST_FILES, name))
+        assert analyzer.clean(text) == baseline_clean_text(text, STOP_WORDS), name
+
+def test_clean_many_and_chunked_iteration():
+    analyzer = Analyzer(STOP_WORDS)
+    assert analyzer.clean_many(SAMPLES) == [baseline_clean_text(t, STOP_WORDS) for t in SAMPLES]
+    text = " ".join(SAMPLES) * 50
+    # Pieces that cut words in half must still give the same words
+    pieces = [text[i:i + 7] for i in range(0, len(text), 7)]
+    assert list(analyzer.iter_clean(pieces)) == baseline_clean_text(text, STOP_WORDS)
@@ -0,0 +1,206 @@
+import os
+import zlib
+import hashlib
+import threading
+import collections
+
+# ========================
+# Content-Addressed Text Cache
+# ========================
+
+class TextCache:
+    """
+    Caches extracted document text keyed by a hash of the raw file bytes.
+
+    Entries live in an in-memory LRU bounded by total bytes and, when
+    cache_dir is set, in an on-disk LRU bounded by max_disk_bytes and
+    shared by every process using the same cache_dir.
+    With compress=True entries are zlib-compressed in both tiers.
+    Thread-safe (Streamlit runs sessions on separate threads).
+    """
+    def __init__(self, max_bytes=64 * 1024 * 1024, cache_dir=None,
+                 max_disk_bytes=512 * 1024 * 1024, compress=False):
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.compress = compress
+        self._memory = collections.OrderedDict()  # key -> stored bytes
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    # ---------- keys & encoding ----------
+
+    @staticmethod
+    def make_key(data, kind):
+        """
+        Returns the cache key for raw file bytes.
+        kind names the extraction variant (e.g. 'pdf'), since different
+        readers may join pages differently.
+        """
+        return f"{hashlib.sha256(data).hexdigest()}-{kind}"
+
+    def _encode(self, text):
+        raw = text.encode("utf-8")
+        return zlib.compress(raw, 1) if self.compress else raw
+
+    def _decode(self, stored):
+        return (zlib.decompress(stored) if self.compress else stored).decode("utf-8")
+
+    # ---------- disk tier ----------
+
+    def _disk_path(self, key):
+        return os.path.join(self.cache_dir, key + (".z" if self.compress else ".txt"))
+
+    def _scan_disk(self):
+        """
+        Returns [(mtime, key, size)] for the files on disk, oldest first.
+        The directory itself is the index, so processes sharing cache_dir
+        (e.g. pool workers) see each other's entries and share one budget.
+        """
+        suffix = ".z" if self.compress else ".txt"
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(suffix):
+                try:
+                    stat = os.stat(os.path.join(self.cache_dir, name))
+                except OSError:
+                    continue  # removed by another process meanwhile
+                entries.append((stat.st_mtime, name[:-len(suffix)], stat.st_size))
+        return sorted(entries)
+
+    def _disk_get(self, key):
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as f:
+                stored = f.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return stored
+
+    def _disk_put(self, key, stored):
+        if len(stored) > self.max_disk_bytes:
+            return
+        path = self._disk_path(key)
+        if os.path.exists(path):
+            return
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(stored)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+        entries = self._scan_disk()
+        total = sum(size for _, _, size in entries)
+        for _, old_key, size in entries:
+            if total <= self.max_disk_bytes:
+                break
+            total -= size
+            self.evictions += 1
+            try:
+                os.remove(self._disk_path(old_key))
+            except OSError:
+                pass
+
+    # ---------- memory tier ----------
+
+    def _memory_put(self, key, stored):
+        if len(stored) > self.max_bytes:
+            return
+        if key in self._memory:
+            self._memory_bytes -= len(self._memory.pop(key))
+        self._memory[key] = stored
+        self._memory_bytes += len(stored)
+        while self._memory_bytes > self.max_bytes:
+            _, old = self._memory.popitem(last=False)
+            self._memory_bytes -= len(old)
+            self.evictions += 1
+
+    # ---------- public API ----------
+
+    def get(self, key):
+        """Returns cached text for key, or None on a miss."""
+        with self._lock:
+            stored = self._memory.get(key)
+            if stored is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._decode(stored)
+            if self.cache_dir:
+                stored = self._disk_get(key)
+                if stored is not None:
+                    self._memory_put(key, stored)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return self._decode(stored)
+            self.misses += 1
+            return None
+
+    def put(self, key, text):
+        """Stores text under key in memory (and on disk when enabled)."""
+        stored = self._encode(text)
+        with self._lock:
+            self._memory_put(key, stored)
+            if self.cache_dir:
+                self._disk_put(key, stored)
+
+    def get_or_extract(self, data, kind, extract):
+        """
+        Returns the cached text for data, or calls extract() and caches its result.
+        Exceptions from extract() propagate and nothing is cached.
+        """
+        key = self.make_key(data, kind)
+        text = self.get(key)
+        if text is None:
+            text = extract()
+            self.put(key, text)
+        return text
+
+    def clear(self):
+        """Empties the memory tier (the disk tier is left alone)."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+    def stats(self):
+        """Returns hit/miss/eviction counters and current sizes."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            disk = self._scan_disk() if self.cache_dir else []
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_entries": len(disk),
+                "disk_bytes": sum(size for _, _, size in disk),
+            }
+
+# ========================
+# Shared Process-Wide Cache
+# ========================
+
+_default_cache = TextCache()
+
+def get_text_cache():
+    """Returns the process-wide cache used by the file readers."""
+    return _default_cache
+
+def configure_text_cache(**kwargs):
+    """
+    Replaces the process-wide cache (same arguments as TextCache)
+    and returns it. Call before reading any files.
+    """
+    global _default_cache
+    _default_cache = TextCache(**kwargs)
+    return _default_cache
@@ -1,22 +1,116 @@
-import os
 import re
 import string
-import collections
-import csv
-from PyPDF2 import PdfReader  # Install with: pip install PyPDF2
-import nltk
+import functools
 
-def clean_text(raw_text, stop_words):
+# nltk is imported lazily by tagging_utils (only nouns/verbs mode needs it)
+from tagging_utils import NOUN_VERB_TAGS, get_pos_tagger
+from normalize_utils import get_normalizer
+
+# ========================
+# Text Cleaning
+# ========================
+
+# Built once: ASCII text is lowercased and stripped of punctuation in one
+# str.translate call (CPython's 1-byte fast path). Non-ASCII text falls back
+# to lower() + a regex, which is several times faster than translate there.
+_ASCII_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase, string.punctuation)
+_PUNCTUATION_RE = re.compile(f"[{re.escape(string.punctuation)}]+")
+
+# Bump whenever the cleaning rules change (it is part of the analyzer
+# fingerprint that compiled JD profiles are checked against, see jd_profile)
+ANALYZER_VERSION = 1
+
+# Generator cleaning (iter_clean) works on pieces of about this many characters
+CLEAN_CHUNK_CHARS = 1 << 16
+
+def _word_chunks(pieces):
+    """
+    Regroups text pieces into chunks that start and end on word boundaries
+    (whitespace), carrying a word cut at a piece boundary into the next chunk.
+    Cleaning each chunk gives the same words as cleaning the joined text.
+    """
+    carry = ""
+    for piece in pieces:
+        text = carry + piece if carry else piece
+        if not text:
+            continue
+        if text[-1].isspace():
+            carry = ""
+            yield text
+            continue
+        parts = text.rsplit(None, 1)
+        carry = parts[-1]
+        if len(parts) == 2:
+            yield parts[0]
+    if carry:
+        yield carry
+
+class Analyzer:
+    """
+    Reusable text cleaner that gives exactly the same output as clean_text,
+    with the punctuation table, stop-word frozenset and token rules compiled once.
+    normalize ('stem' or 'lemma') maps each cleaned word to its normal form
+    through the shared memoized normalizer (see normalize_utils).
+    """
+    def __init__(self, stop_words, normalize=None):
+        self.stop_words = frozenset(stop_words)
+        self.normalize = normalize if normalize != "none" else None
+        self._normalizer = get_normalizer(self.normalize)
+
+    def clean(self, raw_text):
+        """
+        Lowercases, removes punctuation, splits, and removes stop words.
+        Returns a list of cleaned words.
+        """
+        if raw_text.isascii():
+            text = raw_text.translate(_ASCII_TABLE)
+        else:
+            text = _PUNCTUATION_RE.sub("", raw_text.lower())
+        stop_words = self.stop_words
+        words = [word for word in text.split() if word.isalpha() and word not in stop_words]
+        if self._normalizer is not None:
+            return self._normalizer.normalize_many(words)
+        return words
+
+    def iter_clean(self, text):
+        """
+        Generator variant of clean: yields the same words, cleaning about
+        CLEAN_CHUNK_CHARS at a time. text is a string or an iterable of
+        string pieces (e.g. file_utils.read_text_chunks), so the whole text
+        and its word list never have to be in memory at once.
+        """
+        pieces = text
+        if isinstance(text, str):
+            pieces = (text[i:i + CLEAN_CHUNK_CHARS] for i in range(0, len(text), CLEAN_CHUNK_CHARS))
+        clean = self.clean
+        for chunk in _word_chunks(pieces):
+            yield from clean(chunk)
+
+    def clean_many(self, texts):
+        """
+        Cleans a batch of texts. Returns one list of cleaned words per text.
+        """
+        clean = self.clean
+        return [clean(text) for text in texts]
+
+@functools.lru_cache(maxsize=8)
+def _analyzer_for(stop_words, normalize=None):
+    return Analyzer(stop_words, normalize)
+
+def clean_text(raw_text, stop_words, normalize=None):
     """
     Lowercases, removes punctuation, splits, and removes stop words.
+    With normalize='stem' or 'lemma', words are also reduced to a normal form.
     Returns a list of cleaned words.
     """
-    text = raw_text.lower()
-    translator = str.maketrans('', '', string.punctuation)
-    text = text.translate(translator)
-    words = text.split()
-    cleaned_words = [word for word in words if word not in stop_words and word.isalpha()]
-    return cleaned_words
+    return _analyzer_for(frozenset(stop_words), normalize).clean(raw_text)
+
+def iter_clean_text(raw_text, stop_words, normalize=None):
+    """
+    Generator variant of clean_text: yields the same cleaned words one at a
+    time. raw_text may also be an iterable of text pieces (see Analyzer.iter_clean).
+    """
+    return _analyzer_for(frozenset(stop_words), normalize).iter_clean(raw_text)
 
 def extract_keywords(cleaned_words):
     """
@@ -38,15 +132,30 @@ def calculate_match_percent(matched, total):
     """
     Returns the match percent as a float (0-100).
     """
+    return match_percent_from_count(len(matched), total)
+
+def match_percent_from_count(num_matched, total):
+    """
+    Returns the match percent (0-100) for a count of matched keywords.
+    """
     if total == 0:
         return 0.0
-    return 100 * len(matched) / total
+    return 100 * num_matched / total
 
 def extract_nouns_verbs(words):
     """
     Uses NLTK POS tagging to return only nouns and verbs from a word list.
+    Tagging is memoized per document (see tagging_utils).
+    """
+    pos_tags = get_pos_tagger().tag(words)
+    return [word for word, tag in pos_tags if tag in NOUN_VERB_TAGS]
+
+def extract_nouns_verbs_many(docs):
+    """
+    Batched extract_nouns_verbs for several word lists (e.g. many JDs at once).
+    Returns one filtered word list per input list.
     """
-    pos_tags = nltk.pos_tag(words)
-    allowed = {'NN', 'NNS', 'NNP', 'NNPS', 'VB', 'VBD', 'VBG', 'VBN', 'VBP', 'VBZ'}
-    filtered = [word for word, tag in pos_tags if tag in allowed]
-    return filtered   
\ No newline at end of file
+    return [
+        [word for word, tag in pos_tags if tag in NOUN_VERB_TAGS]
+        for pos_tags in get_pos_tagger().tag_many(docs)
+    ]